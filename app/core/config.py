@@ -1,6 +1,8 @@
 """
 Configuration management for Ovu Transport Aggregator
 """
+from functools import cached_property, lru_cache
+from types import SimpleNamespace
 from pydantic_settings import BaseSettings
 from typing import List
 
@@ -25,6 +27,8 @@ class Settings(BaseSettings):
     # MongoDB
     MONGODB_URL: str
     MONGODB_DB_NAME: str = "ovu_transport"
+    MONGO_MAX_POOL: int = 100
+    MONGO_MIN_POOL: int = 10
     
     # Travu API
     TRAVU_API_KEY: str = ""
@@ -61,10 +65,17 @@ class Settings(BaseSettings):
     
     # Redis
     REDIS_URL: str = "redis://localhost:6379/0"
+    SEARCH_CACHE_TTL_SECONDS: int = 60
+    OPERATOR_CACHE_TTL_SECONDS: int = 300
+    DASHBOARD_CACHE_TTL_SECONDS: int = 60
+    PARTNER_STATUS_CACHE_TTL_SECONDS: int = 3600
+    PARTNER_RESPONSE_CACHE_TTL_SECONDS: int = 60
     
     # Security
     ALLOWED_ORIGINS: str = "http://localhost:3000,http://localhost:8000"
     RATE_LIMIT_PER_MINUTE: int = 60
+    BCRYPT_ROUNDS: int = 12
+    API_KEY_PEPPER: str = ""  # Falls back to SECRET_KEY when unset
     
     # Compliance
     PCI_DSS_MODE: str = "enabled"
@@ -74,9 +85,11 @@ class Settings(BaseSettings):
     class Config:
         env_file = ".env"
         case_sensitive = True
+        frozen = True
     
-    @property
+    @cached_property
     def origins(self) -> List[str]:
+        """Parsed ALLOWED_ORIGINS (computed once per Settings instance)"""
         return [origin.strip() for origin in self.ALLOWED_ORIGINS.split(",")]
     
     @property
@@ -90,4 +103,17 @@ class Settings(BaseSettings):
         return self.APP_ENV.lower() in ["development", "dev"]
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Build settings on first use and reuse the instance afterwards"""
+    return Settings()
+
+
+@lru_cache(maxsize=1)
+def get_fast_settings() -> SimpleNamespace:
+    """
+    Plain-attribute snapshot of the (frozen) settings for hot paths such as
+    JWT signing, skipping pydantic's attribute machinery on every read
+    """
+    return SimpleNamespace(**get_settings().model_dump())
+
@@ -1,9 +1,12 @@
 """
 Database connection and initialization
 """
+import asyncio
+from typing import Optional
+from weakref import WeakKeyDictionary
 from motor.motor_asyncio import AsyncIOMotorClient
 from beanie import init_beanie
-from app.core.config import settings
+from app.core.config import get_settings
 from app.models.user import User
 from app.models.booking import Booking, FlightBooking, BusBooking, TrainBooking
 from app.models.payment import Payment, Transaction
@@ -17,17 +20,69 @@ from app.models.questions import Question
 
 
 class Database:
-    client: AsyncIOMotorClient = None  # type: ignore
-    
-    
+    """
+    Holds a single Motor client per event loop. Motor clients are bound to the
+    loop they are first used on, so production shares one client while each
+    test loop gets its own; clients for discarded loops are dropped with them.
+    """
+
+    def __init__(self):
+        self._clients: "WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncIOMotorClient]" = (
+            WeakKeyDictionary()
+        )
+
+    @property
+    def client(self) -> Optional[AsyncIOMotorClient]:
+        """Client for the running loop, if one has been created"""
+        try:
+            return self._clients.get(asyncio.get_running_loop())
+        except RuntimeError:
+            return None
+
+    def get_client(self) -> AsyncIOMotorClient:
+        """Return the running loop's client, creating it on first use"""
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            settings = get_settings()
+            client = AsyncIOMotorClient(
+                settings.MONGODB_URL,
+                maxPoolSize=settings.MONGO_MAX_POOL,
+                minPoolSize=settings.MONGO_MIN_POOL,
+                maxIdleTimeMS=300_000,
+                serverSelectionTimeoutMS=5000
+            )
+            self._clients[loop] = client
+        return client
+
+    def close_client(self) -> None:
+        """Close and forget the running loop's client"""
+        client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            client.close()
+
+
 db = Database()
 
 
 async def connect_to_mongo():
     """Connect to MongoDB"""
-    client = AsyncIOMotorClient(settings.MONGODB_URL)
-    db.client = client  # type: ignore
+    if db.client is not None:
+        # Already connected on this loop; don't re-initialize Beanie
+        return
+
+    settings = get_settings()
+    client = db.get_client()
+
+    # Fail fast on a bad URL and open the first pooled connection before serving
+    try:
+        await client.admin.command("ping")
+    except Exception:
+        db.close_client()
+        raise
 
+    # Indexes are created/verified on every boot; nothing else builds them, and
+    # the unique ones back duplicate checks in the write paths
     await init_beanie(
         database=client[settings.MONGODB_DB_NAME],
         document_models=[
@@ -45,11 +100,11 @@ async def connect_to_mongo():
             WaitlistSubscription,
             PartnershipInterest,
             Question
-        ]
+        ],
+        allow_index_dropping=False
     )
 
 
 async def close_mongo_connection():
     """Close MongoDB connection"""
-    if db.client:
-        db.client.close()
+    db.close_client()
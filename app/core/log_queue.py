@@ -0,0 +1,44 @@
+"""
+Queue-based logging so request handlers never block on log I/O
+"""
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+
+def start_queue_logging() -> Optional[QueueListener]:
+    """
+    Move the root logger's handlers behind a QueueHandler. Log calls on the
+    event loop only enqueue the record; a listener thread does the actual
+    stream/file I/O. Returns the listener (stop it at shutdown to flush), or
+    None if the root logger is already queued.
+    """
+    root = logging.getLogger()
+    if any(isinstance(h, QueueHandler) for h in root.handlers):
+        return None
+
+    handlers = list(root.handlers)
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+
+    for handler in handlers:
+        root.removeHandler(handler)
+    root.addHandler(QueueHandler(log_queue))
+
+    listener.start()
+    return listener
+
+
+def stop_queue_logging(listener: Optional[QueueListener]) -> None:
+    """Flush queued records and restore the original root handlers"""
+    if listener is None:
+        return
+
+    listener.stop()
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        if isinstance(handler, QueueHandler):
+            root.removeHandler(handler)
+    for handler in listener.handlers:
+        root.addHandler(handler)
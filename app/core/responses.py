@@ -0,0 +1,18 @@
+"""
+Custom response classes
+"""
+from typing import Any
+import msgspec
+from fastapi.responses import Response
+
+
+class MsgspecResponse(Response):
+    """
+    JSON response encoded directly with msgspec. Returning one from a route
+    bypasses FastAPI's response_model validation and jsonable_encoder pass,
+    so use it only for server-built DTOs (msgspec Structs, plain containers)
+    """
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return msgspec.json.encode(content)
@@ -1,78 +1,133 @@
 """
 Security utilities for authentication and authorization
 """
-from datetime import datetime, timedelta
+import asyncio
+import hashlib
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from functools import lru_cache
 from typing import Optional
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+from cachetools import TTLCache
+import jwt
 from fastapi import HTTPException, status
-from app.core.config import settings
+from app.core.config import get_fast_settings
 
 import bcrypt
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# bcrypt releases the GIL while hashing, so a thread pool keeps the event loop free
+_bcrypt_pool = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="bcrypt")
+
+# Verified JWT payloads, keyed by a digest of the raw token
+_token_cache: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+
+
+@lru_cache(maxsize=1)
+def _jwt_key() -> bytes:
+    """HMAC signing key, encoded once instead of on every encode/decode"""
+    return get_fast_settings().SECRET_KEY.encode('utf-8')
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash"""
-    password_bytes = plain_password.encode('utf-8')[:72]
+    # bcrypt only uses the first 72 bytes; slice the str first so long inputs
+    # aren't encoded in full (72 chars is always >= 72 bytes of UTF-8)
+    password_bytes = plain_password[:72].encode('utf-8')[:72]
     hash_bytes = hashed_password.encode('utf-8')
 
     return bcrypt.checkpw(password_bytes, hash_bytes)
 
 
-def get_password_hash(password: str) -> str:
-    """Hash a password"""
-    password_bytes = password.encode('utf-8')[:72]
+def get_password_hash(password: str, rounds: Optional[int] = None) -> str:
+    """Hash a password (cost defaults to settings.BCRYPT_ROUNDS)"""
+    password_bytes = password[:72].encode('utf-8')[:72]
 
     # Generate salt and hash the password
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=rounds or get_fast_settings().BCRYPT_ROUNDS)
     hashed = bcrypt.hashpw(password_bytes, salt)
 
     return hashed.decode('utf-8')
 
 
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password against its hash without blocking the event loop"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _bcrypt_pool, verify_password, plain_password, hashed_password
+    )
+
+
+async def get_password_hash_async(password: str, rounds: Optional[int] = None) -> str:
+    """Hash a password without blocking the event loop"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_bcrypt_pool, get_password_hash, password, rounds)
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create JWT access token"""
+    settings = get_fast_settings()
     to_encode = data.copy()
 
+    # exp is seconds since the epoch, so skip building datetimes
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        ttl_seconds = int(expires_delta.total_seconds())
     else:
-        expire = datetime.utcnow() + timedelta(
-            minutes=settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES
-        )
+        ttl_seconds = settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES * 60
+    expire = int(time.time()) + ttl_seconds
 
-    to_encode.update({"exp": expire, "type": "access"})
+    # Callers may set their own type (e.g. partner / partner_refresh)
+    to_encode["exp"] = expire
+    to_encode.setdefault("type", "access")
     encoded_jwt = jwt.encode(
-        to_encode, settings.SECRET_KEY, algorithm=settings.JWT_ALGORITHM
+        to_encode, _jwt_key(), algorithm=settings.JWT_ALGORITHM
     )
     return encoded_jwt
 
 
 def create_refresh_token(data: dict) -> str:
     """Create JWT refresh token"""
+    settings = get_fast_settings()
     to_encode = data.copy()
-    expire = datetime.utcnow() + timedelta(days=settings.JWT_REFRESH_TOKEN_EXPIRE_DAYS)
+    expire = int(time.time()) + settings.JWT_REFRESH_TOKEN_EXPIRE_DAYS * 86400
     to_encode.update({"exp": expire, "type": "refresh"})
 
     encoded_jwt = jwt.encode(
-        to_encode, settings.SECRET_KEY, algorithm=settings.JWT_ALGORITHM
+        to_encode, _jwt_key(), algorithm=settings.JWT_ALGORITHM
     )
     return encoded_jwt
 
 
 def decode_token(token: str) -> dict:
-    """Decode and verify JWT token"""
+    """Decode and verify JWT token (verified payloads are cached briefly)"""
+    cache_key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    payload = _token_cache.get(cache_key)
+    if payload is not None and payload.get("exp", 0) > time.time():
+        return payload
+
+    settings = get_fast_settings()
     try:
         payload = jwt.decode(
-            token, settings.SECRET_KEY, algorithms=[settings.JWT_ALGORITHM]
+            token, _jwt_key(), algorithms=[settings.JWT_ALGORITHM]
         )
+        _token_cache[cache_key] = payload
         return payload
-    except JWTError:
+    except jwt.PyJWTError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
             headers={"WWW-Authenticate": "Bearer"},
         )
+
+
+async def warm_up() -> None:
+    """
+    Exercise the bcrypt and JWT paths once at startup so the first real
+    login doesn't pay for cold caches, lazy settings and pool thread spin-up
+    """
+    hashed = await get_password_hash_async("warmup", rounds=4)
+    await verify_password_async("warmup", hashed)
+
+    token = create_access_token({"sub": "warmup"})
+    decode_token(token)
+    _token_cache.pop(hashlib.blake2b(token.encode(), digest_size=16).digest(), None)
@@ -4,35 +4,49 @@ Authentication middleware and dependencies
 from fastapi import Depends, HTTPException, status, Header, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from typing import Optional
+from bson import ObjectId
+from cachetools import TTLCache
 from app.core.security import decode_token
-from app.models.user import User
+from app.models.user import User, UserProjection
 from app.models.partner import Partner
 
 
 security = HTTPBearer()
 
+# Recently fetched users, keyed by user id, to skip a Mongo round-trip per request.
+# Entries are frozen projections, so one request can't change what the next sees.
+_user_cache: TTLCache = TTLCache(maxsize=50_000, ttl=30)
+
+
+def invalidate_cached_user(user_id: str) -> None:
+    """Drop a user from the auth cache; call after every write to a User"""
+    _user_cache.pop(user_id, None)
+
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security)
-) -> User:
+) -> UserProjection:
     """Get current authenticated user"""
     
     token = credentials.credentials
     payload = decode_token(token)
     
     user_id = payload.get("sub")
-    if not user_id:
+    if not user_id or not ObjectId.is_valid(user_id):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid authentication credentials",
         )
     
-    user = await User.get(user_id)
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found",
-        )
+    user = _user_cache.get(user_id)
+    if user is None:
+        user = await User.find_one(User.id == ObjectId(user_id)).project(UserProjection)
+        if not user:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="User not found",
+            )
+        _user_cache[user_id] = user
     
     if not user.is_active:
         raise HTTPException(
@@ -44,8 +58,8 @@ async def get_current_user(
 
 
 async def get_current_active_user(
-    current_user: User = Depends(get_current_user)
-) -> User:
+    current_user: UserProjection = Depends(get_current_user)
+) -> UserProjection:
     """Get current active user"""
     if not current_user.is_active:
         raise HTTPException(
@@ -56,8 +70,8 @@ async def get_current_active_user(
 
 
 async def get_current_operator(
-    current_user: User = Depends(get_current_user)
-) -> User:
+    current_user: UserProjection = Depends(get_current_user)
+) -> UserProjection:
     """Get current operator user"""
     if current_user.role not in ["operator", "admin"]:
         raise HTTPException(
@@ -68,8 +82,8 @@ async def get_current_operator(
 
 
 async def get_current_admin(
-    current_user: User = Depends(get_current_user)
-) -> User:
+    current_user: UserProjection = Depends(get_current_user)
+) -> UserProjection:
     """Get current admin user"""
     if current_user.role != "admin":
         raise HTTPException(
@@ -129,23 +143,19 @@ async def verify_partner_api_key(
             detail="API key required",
         )
     
-    # Try to find partner by legacy api_key
-    partner = await Partner.find_one(Partner.api_key == x_api_key)
+    from app.services.partner_service import PartnerService
+    
+    partner = None
     api_key_doc = None
     
-    # If not found, try new APIKey model
-    if not partner:
-        from app.models.api_key import APIKey, APIKeyStatus
-        
-        # In a real implementation, you'd hash the incoming key and compare
-        # For now, we'll search by key_id (simplified)
-        # This is a placeholder - implement proper key verification
-        api_key_doc = await APIKey.find_one(
-            APIKey.status == APIKeyStatus.ACTIVE
-        )
-        
-        if api_key_doc:
-            partner = await Partner.get(api_key_doc.partner_id)
+    if PartnerService.parse_api_key(x_api_key):
+        # APIKey model credential (ovu_live_<key_id>_<secret>): key + partner in one query
+        resolved = await PartnerService.resolve_api_key(x_api_key)
+        if resolved:
+            api_key_doc, partner = resolved
+    else:
+        # Legacy partner.api_key
+        partner = await Partner.find_one(Partner.api_key == x_api_key)
     
     if not partner:
         raise HTTPException(
@@ -167,16 +177,11 @@ async def verify_partner_api_key(
         api_key=api_key_doc
     )
     
-    # Update usage tracking
-    partner.total_requests += 1
-    from datetime import datetime
-    partner.last_request_at = datetime.utcnow()
-    await partner.save()
-    
-    # Update API key usage if applicable
-    if api_key_doc:
-        api_key_doc.total_requests += 1
-        api_key_doc.last_used_at = datetime.utcnow()
-        await api_key_doc.save()
+    # Update usage tracking (buffered and flushed in the background)
+    from app.services.usage_tracker import usage_tracker
+    usage_tracker.record(
+        str(partner.id),
+        str(api_key_doc.id) if api_key_doc else None
+    )
     
     return partner
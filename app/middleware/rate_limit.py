@@ -1,12 +1,13 @@
 """
 Rate limiting middleware for partner API
 """
+import secrets
 import time
 from typing import Optional, Tuple
 from fastapi import Request, HTTPException, status
 from fastapi.responses import JSONResponse
-from redis import Redis
-from app.core.config import settings
+from redis.asyncio import Redis
+from app.core.config import get_settings
 from app.models.partner import Partner
 from app.models.api_key import APIKey
 import logging
@@ -14,36 +15,68 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+# Atomically check both windows and consume one request if allowed.
+# The minute limit is a rolling window kept as a sorted set of request
+# timestamps, so bursts straddling a minute boundary can't double the limit;
+# the day limit stays a plain counter.
+# KEYS: minute_key, day_key
+# ARGV: limit_per_minute, limit_per_day, now_ms, request_id
+# Returns: {allowed (0/1), minute_count, day_count, oldest_ms}
+RATE_LIMIT_SCRIPT = """
+local now = tonumber(ARGV[3])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now - 60000)
+local minute_count = redis.call('ZCARD', KEYS[1])
+local day_count = tonumber(redis.call('GET', KEYS[2]) or '0')
+if minute_count >= tonumber(ARGV[1]) or day_count >= tonumber(ARGV[2]) then
+    local oldest = redis.call('ZRANGE', KEYS[1], 0, 0, 'WITHSCORES')[2] or now
+    return {0, minute_count, day_count, tonumber(oldest)}
+end
+redis.call('ZADD', KEYS[1], now, ARGV[4])
+redis.call('PEXPIRE', KEYS[1], 60000)
+minute_count = minute_count + 1
+day_count = redis.call('INCR', KEYS[2])
+redis.call('EXPIRE', KEYS[2], 172800)
+local oldest = redis.call('ZRANGE', KEYS[1], 0, 0, 'WITHSCORES')[2]
+return {1, minute_count, day_count, tonumber(oldest)}
+"""
+
+
 class RateLimiter:
     """Redis-based rate limiter for partner API"""
     
     def __init__(self):
-        """Initialize Redis connection"""
+        """Create the Redis client (connection is verified in connect())"""
+        settings = get_settings()
+        self.redis = Redis(
+            host=getattr(settings, 'REDIS_HOST', 'localhost'),
+            port=getattr(settings, 'REDIS_PORT', 6379),
+            db=getattr(settings, 'REDIS_DB', 0),
+            decode_responses=True
+        )
+        # Sent via EVALSHA, falling back to EVAL if the script cache was flushed
+        self.rate_limit_script = self.redis.register_script(RATE_LIMIT_SCRIPT)
+        self.enabled = False
+    
+    async def connect(self) -> None:
+        """Verify the Redis connection; rate limiting stays disabled on failure"""
         try:
-            self.redis = Redis(
-                host=getattr(settings, 'REDIS_HOST', 'localhost'),
-                port=getattr(settings, 'REDIS_PORT', 6379),
-                db=getattr(settings, 'REDIS_DB', 0),
-                decode_responses=True
-            )
-            # Test connection
-            self.redis.ping()
+            await self.redis.ping()
             self.enabled = True
             logger.info("Rate limiter initialized with Redis")
         except Exception as e:
             logger.warning(f"Redis not available, rate limiting disabled: {e}")
-            self.redis = None
             self.enabled = False
     
-    def _get_current_window(self) -> int:
-        """Get current time window (minute)"""
-        return int(time.time() / 60)
+    async def close(self) -> None:
+        """Close the Redis connection pool"""
+        await self.redis.aclose()
+        self.enabled = False
     
     def _get_current_day(self) -> str:
         """Get current day (YYYY-MM-DD)"""
         return time.strftime("%Y-%m-%d")
     
-    def check_rate_limit(
+    async def check_rate_limit(
         self,
         partner_id: str,
         api_key_id: Optional[str],
@@ -66,62 +99,33 @@ class RateLimiter:
                 "reset_day": int(time.time()) + 86400
             }
         
-        current_window = self._get_current_window()
+        now_ms = int(time.time() * 1000)
         current_day = self._get_current_day()
         
         # Keys for tracking
-        minute_key = f"rate_limit:partner:{partner_id}:minute:{current_window}"
+        minute_key = f"rate_limit:partner:{partner_id}:minute"
         day_key = f"rate_limit:partner:{partner_id}:day:{current_day}"
         
         # If API key is provided, also track per-key limits
         if api_key_id:
-            minute_key = f"rate_limit:api_key:{api_key_id}:minute:{current_window}"
+            minute_key = f"rate_limit:api_key:{api_key_id}:minute"
             day_key = f"rate_limit:api_key:{api_key_id}:day:{current_day}"
         
         try:
-            # Get current counts
-            minute_count = self.redis.get(minute_key)
-            day_count = self.redis.get(day_key)
-            
-            minute_count = int(minute_count) if minute_count else 0
-            day_count = int(day_count) if day_count else 0
-            
-            # Check limits
-            if minute_count >= limit_per_minute:
-                return False, {
-                    "limit_per_minute": limit_per_minute,
-                    "remaining_per_minute": 0,
-                    "limit_per_day": limit_per_day,
-                    "remaining_per_day": max(0, limit_per_day - day_count),
-                    "reset_minute": (current_window + 1) * 60,
-                    "reset_day": int(time.time()) + 86400
-                }
-            
-            if day_count >= limit_per_day:
-                return False, {
-                    "limit_per_minute": limit_per_minute,
-                    "remaining_per_minute": max(0, limit_per_minute - minute_count),
-                    "limit_per_day": limit_per_day,
-                    "remaining_per_day": 0,
-                    "reset_minute": (current_window + 1) * 60,
-                    "reset_day": int(time.time()) + 86400
-                }
-            
-            # Increment counters
-            pipe = self.redis.pipeline()
-            pipe.incr(minute_key)
-            pipe.expire(minute_key, 120)  # Keep for 2 minutes
-            pipe.incr(day_key)
-            pipe.expire(day_key, 172800)  # Keep for 2 days
-            pipe.execute()
+            # Check and increment both windows in a single round-trip; the
+            # random suffix keeps same-millisecond requests distinct in the set
+            allowed, minute_count, day_count, oldest_ms = await self.rate_limit_script(
+                keys=[minute_key, day_key],
+                args=[limit_per_minute, limit_per_day, now_ms, f"{now_ms}-{secrets.token_hex(4)}"]
+            )
             
-            # Return success with rate limit info
-            return True, {
+            return bool(allowed), {
                 "limit_per_minute": limit_per_minute,
-                "remaining_per_minute": limit_per_minute - minute_count - 1,
+                "remaining_per_minute": max(0, limit_per_minute - minute_count),
                 "limit_per_day": limit_per_day,
-                "remaining_per_day": limit_per_day - day_count - 1,
-                "reset_minute": (current_window + 1) * 60,
+                "remaining_per_day": max(0, limit_per_day - day_count),
+                # The oldest request in the window is the next to expire
+                "reset_minute": -(-(oldest_ms + 60000) // 1000),
                 "reset_day": int(time.time()) + 86400
             }
             
@@ -158,7 +162,7 @@ class RateLimiter:
                 limit_per_minute = api_key.rate_limit_per_minute
         
         # Check rate limit
-        allowed, rate_info = self.check_rate_limit(
+        allowed, rate_info = await self.check_rate_limit(
             partner_id=str(partner.id),
             api_key_id=api_key_id,
             limit_per_minute=limit_per_minute,
@@ -187,7 +191,7 @@ class RateLimiter:
                 }
             )
     
-    def get_usage_stats(self, partner_id: str, days: int = 30) -> dict:
+    async def get_usage_stats(self, partner_id: str, days: int = 30) -> dict:
         """Get usage statistics for a partner"""
         if not self.enabled:
             return {
@@ -201,11 +205,17 @@ class RateLimiter:
                 "daily_breakdown": []
             }
             
-            # Get daily stats for the past N days
-            for i in range(days):
-                day = time.strftime("%Y-%m-%d", time.localtime(time.time() - (i * 86400)))
-                day_key = f"rate_limit:partner:{partner_id}:day:{day}"
-                count = self.redis.get(day_key)
+            # Get daily stats for the past N days in a single MGET
+            now = time.time()
+            dates = [
+                time.strftime("%Y-%m-%d", time.localtime(now - (i * 86400)))
+                for i in range(days)
+            ]
+            counts = await self.redis.mget(
+                [f"rate_limit:partner:{partner_id}:day:{day}" for day in dates]
+            ) if dates else []
+            
+            for day, count in zip(dates, counts):
                 count = int(count) if count else 0
                 
                 stats["daily_breakdown"].append({
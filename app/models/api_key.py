@@ -4,6 +4,7 @@ API Key model for partner authentication
 from datetime import datetime
 from typing import Optional
 from beanie import Document
+from pymongo import IndexModel, ASCENDING
 from pydantic import Field
 from enum import Enum
 
@@ -19,12 +20,12 @@ class APIKey(Document):
     """API Key model for partner authentication"""
     
     # Key identification
-    key_id: str = Field(unique=True, index=True)  # Public key identifier
-    key_hash: str  # Hashed API secret (never store plain text)
+    key_id: str  # Public key identifier
+    key_hash: str  # HMAC-SHA256 of the key secret (never store plain text)
     name: str  # Friendly name for the key (e.g., "Production Key", "Testing Key")
     
     # Partner relationship
-    partner_id: str = Field(index=True)  # Reference to Partner document
+    partner_id: str  # Reference to Partner document
     
     # Key metadata
     status: APIKeyStatus = APIKeyStatus.ACTIVE
@@ -48,8 +49,11 @@ class APIKey(Document):
     class Settings:
         name = "api_keys"
         indexes = [
-            "key_id",
-            "partner_id",
+            IndexModel([("key_id", ASCENDING)], unique=True),
+            IndexModel(
+                [("partner_id", ASCENDING), ("status", ASCENDING)],
+                name="partner_id_status"
+            ),
             "status",
             "created_at",
         ]
@@ -3,8 +3,9 @@ Booking models for different transport types
 """
 from datetime import datetime
 from typing import Optional, List, Dict, Any
-from beanie import Document
-from pydantic import Field
+from beanie import Document, PydanticObjectId
+from pydantic import BaseModel, ConfigDict, Field
+from pymongo import IndexModel, ASCENDING, DESCENDING
 from enum import Enum
 
 from app.schemas.booking import PassengerCreate
@@ -36,7 +37,7 @@ class SeatType(str, Enum):
     STANDARD = "standard"
 
 
-class Passenger(Document):
+class Passenger(BaseModel):
     """Passenger information"""
     first_name: str
     last_name: str
@@ -52,8 +53,8 @@ class Passenger(Document):
 
 class Booking(Document):
     """Base booking model"""
-    booking_reference: str = Field(unique=True, index=True)
-    user_id: str = Field(index=True)
+    booking_reference: str
+    user_id: str
     transport_type: TransportType
     status: BookingStatus = BookingStatus.PENDING
 
@@ -67,11 +68,11 @@ class Booking(Document):
     passengers: List[PassengerCreate] = []
     total_passengers: int
 
-    # Pricing
-    base_price: float
-    tax: float
-    service_fee: float
-    total_price: float
+    # Pricing, in integer minor units (kobo for NGN)
+    base_price_kobo: int
+    tax_kobo: int
+    service_fee_kobo: int
+    total_price_kobo: int
     currency: str = "NGN"
 
     # External references
@@ -84,14 +85,31 @@ class Booking(Document):
     cancelled_at: Optional[datetime] = None
     cancellation_reason: Optional[str] = None
 
-    # Additional data
+    # Additional data. Left as a bare dict so pydantic passes it through on
+    # load/save without walking its contents; don't attach a validator here.
     metadata: Dict[str, Any] = {}
 
     class Settings:
         name = "bookings"
         indexes = [
-            "booking_reference",
-            "user_id",
+            IndexModel([("booking_reference", ASCENDING)], unique=True),
+            # Serves user_id lookups and newest-first history pagination;
+            # ObjectIds are time-ordered, so _id doubles as the creation order
+            IndexModel(
+                [("user_id", ASCENDING), ("_id", DESCENDING)],
+                name="user_newest"
+            ),
+            # Operator dashboards filter by operator and page/range on created_at
+            IndexModel(
+                [("operator_id", ASCENDING), ("created_at", DESCENDING)],
+                name="operator_recent"
+            ),
+            # Partner usage stats: range on created_at, then group by day on
+            # status/price, all answered from the index without loading documents
+            IndexModel(
+                [("created_at", ASCENDING), ("status", ASCENDING), ("total_price_kobo", ASCENDING)],
+                name="created_status_price"
+            ),
             "transport_type",
             "status",
             "departure_date",
@@ -109,6 +127,8 @@ class FlightBooking(Booking):
 
     class Settings:
         name = "flight_bookings"
+        # Beanie doesn't inherit Settings, so each booking collection repeats the base indexes
+        indexes = Booking.Settings.indexes
 
 
 class BusBooking(Booking):
@@ -122,6 +142,7 @@ class BusBooking(Booking):
 
     class Settings:
         name = "bus_bookings"
+        indexes = Booking.Settings.indexes
 
 
 class TrainBooking(Booking):
@@ -135,3 +156,22 @@ class TrainBooking(Booking):
 
     class Settings:
         name = "train_bookings"
+        indexes = Booking.Settings.indexes
+
+
+class BookingListProjection(BaseModel):
+    """Columns fetched for booking lists (mirrors BookingResponse)"""
+    model_config = ConfigDict(frozen=True, populate_by_name=True)
+
+    id: PydanticObjectId = Field(alias="_id")
+    booking_reference: str
+    user_id: str
+    transport_type: TransportType
+    status: BookingStatus
+    origin: str
+    destination: str
+    departure_date: datetime
+    total_passengers: int
+    total_price_kobo: int
+    currency: str
+    created_at: datetime
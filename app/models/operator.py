@@ -3,8 +3,9 @@ Operator model for transport operators
 """
 from datetime import datetime
 from typing import Optional, Dict, Any, List
-from beanie import Document
-from pydantic import Field, EmailStr
+from beanie import Document, PydanticObjectId
+from pydantic import BaseModel, ConfigDict, Field, EmailStr
+from pymongo import IndexModel, ASCENDING
 from enum import Enum
 
 
@@ -24,7 +25,7 @@ class OperatorStatus(str, Enum):
 
 class Operator(Document):
     """Transport operator model"""
-    operator_code: str = Field(unique=True, index=True)
+    operator_code: str
     name: str
     operator_type: OperatorType
     
@@ -59,7 +60,20 @@ class Operator(Document):
     class Settings:
         name = "operators"
         indexes = [
-            "operator_code",
+            IndexModel([("operator_code", ASCENDING)], unique=True),
             "operator_type",
             "status",
         ]
+
+
+class OperatorProjection(BaseModel):
+    """Operator columns the dashboard routes need (also the cached form)"""
+    model_config = ConfigDict(frozen=True, populate_by_name=True)
+
+    id: PydanticObjectId = Field(alias="_id")
+    operator_code: str
+    name: str
+    operator_type: OperatorType
+    status: OperatorStatus
+    paystack_subaccount_code: Optional[str] = None
+    commission_percentage: float
@@ -4,6 +4,7 @@ Partner model for API integrations
 from datetime import datetime
 from typing import Optional, Dict, Any, List
 from beanie import Document
+from pymongo import IndexModel, ASCENDING, DESCENDING
 from pydantic import Field, EmailStr
 from enum import Enum
 
@@ -30,7 +31,7 @@ class WebhookEvent(str, Enum):
 
 class Partner(Document):
     """Partner/API consumer model"""
-    partner_code: str = Field(unique=True, index=True)
+    partner_code: str
     name: str
     
     # Contact information
@@ -45,13 +46,14 @@ class Partner(Document):
     
     # API credentials (legacy - for backward compatibility)
     # New partners should use APIKey model instead
-    api_key: str = Field(unique=True)
+    api_key: str
     api_secret: str
     
     # Webhook configuration
     webhook_url: Optional[str] = None
     webhook_events: List[WebhookEvent] = []
     webhook_secret: Optional[str] = None
+    webhook_secret_preview: Optional[str] = None  # Set alongside webhook_secret
     
     # Authentication (for dashboard access)
     password_hash: Optional[str] = None
@@ -95,8 +97,21 @@ class Partner(Document):
     class Settings:
         name = "partners"
         indexes = [
-            "partner_code",
-            "api_key",
-            "email",
-            "status",
+            IndexModel([("partner_code", ASCENDING)], unique=True),
+            IndexModel([("api_key", ASCENDING)], unique=True),
+            # Registration and login look partners up by email; also enforces
+            # the one-account-per-email rule the registration checks assume
+            IndexModel([("email", ASCENDING)], unique=True),
+            # Admin pending-application list: equality on status, newest first
+            IndexModel(
+                [("status", ASCENDING), ("created_at", DESCENDING)],
+                name="status_recent"
+            ),
+            # One-time token lookups; only set while a flow is in progress
+            IndexModel(
+                [("email_verification_token", ASCENDING)],
+                sparse=True,
+                name="email_verification_token"
+            ),
+            IndexModel([("reset_token", ASCENDING)], sparse=True, name="reset_token"),
         ]
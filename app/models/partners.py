@@ -1,7 +1,8 @@
 """
 Partners interest model
 """
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import partial
 from beanie import Document
 from pydantic import Field, EmailStr
 from typing import Optional
@@ -14,7 +15,7 @@ class PartnershipInterest(Document):
     category: str
     email: EmailStr
     phone: str
-    created_at: datetime = Field(default_factory=datetime.now)
+    created_at: datetime = Field(default_factory=partial(datetime.now, timezone.utc))
 
     class Settings:
         name = "partnerships"
@@ -4,7 +4,8 @@ Payment and transaction models
 from datetime import datetime
 from typing import Optional, Dict, Any, List
 from beanie import Document
-from pydantic import Field
+from pydantic import BaseModel, Field
+from pymongo import IndexModel, ASCENDING, DESCENDING
 from enum import Enum
 
 
@@ -32,22 +33,22 @@ class PaymentProvider(str, Enum):
     PAYSTACK = "paystack"
 
 
-class SplitConfig(Document):
+class SplitConfig(BaseModel):
     """Split payment configuration for operators"""
     subaccount_code: str
     share_percentage: float
-    share_amount: Optional[float] = None
+    share_amount_kobo: Optional[int] = None
     description: Optional[str] = None
 
 
 class Payment(Document):
     """Payment model"""
-    payment_reference: str = Field(unique=True, index=True)
-    booking_id: str = Field(index=True)
-    user_id: str = Field(index=True)
+    payment_reference: str
+    booking_id: str
+    user_id: str
     
-    # Amount details
-    amount: float
+    # Amount details, in integer minor units (kobo for NGN)
+    amount_kobo: int
     currency: str = "NGN"
     
     # Payment info
@@ -72,9 +73,18 @@ class Payment(Document):
     class Settings:
         name = "payments"
         indexes = [
-            "payment_reference",
-            "booking_id",
-            "user_id",
+            IndexModel([("payment_reference", ASCENDING)], unique=True),
+            # Booking -> payment joins filter on status; the prefix also
+            # serves plain booking_id lookups
+            IndexModel(
+                [("booking_id", ASCENDING), ("status", ASCENDING)],
+                name="booking_status"
+            ),
+            # Serves user_id lookups and newest-first history pagination
+            IndexModel(
+                [("user_id", ASCENDING), ("created_at", DESCENDING)],
+                name="user_recent"
+            ),
             "status",
         ]
 
@@ -89,9 +99,9 @@ class TransactionType(str, Enum):
 
 class Transaction(Document):
     """Transaction ledger"""
-    transaction_id: str = Field(unique=True, index=True)
-    payment_id: Optional[str] = Field(None, index=True)
-    booking_id: Optional[str] = Field(None, index=True)
+    transaction_id: str
+    payment_id: Optional[str] = None
+    booking_id: Optional[str] = None
     
     transaction_type: TransactionType
     
@@ -100,8 +110,8 @@ class Transaction(Document):
     to_user_id: Optional[str] = None
     operator_id: Optional[str] = None
     
-    # Amount
-    amount: float
+    # Amount, in integer minor units (kobo for NGN)
+    amount_kobo: int
     currency: str = "NGN"
     
     # Status
@@ -117,8 +127,16 @@ class Transaction(Document):
     class Settings:
         name = "transactions"
         indexes = [
-            "transaction_id",
+            IndexModel([("transaction_id", ASCENDING)], unique=True),
             "payment_id",
             "booking_id",
-            "operator_id",
+            # Payout history: equality on operator and type, newest first
+            IndexModel(
+                [
+                    ("operator_id", ASCENDING),
+                    ("transaction_type", ASCENDING),
+                    ("created_at", DESCENDING),
+                ],
+                name="operator_type_recent"
+            ),
         ]
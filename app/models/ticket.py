@@ -5,6 +5,7 @@ from datetime import datetime
 from typing import Optional, Dict, Any
 from beanie import Document
 from pydantic import Field
+from pymongo import IndexModel, ASCENDING, DESCENDING
 from enum import Enum
 
 
@@ -18,9 +19,9 @@ class TicketStatus(str, Enum):
 
 class Ticket(Document):
     """E-ticket model"""
-    ticket_number: str = Field(unique=True, index=True)
-    booking_id: str = Field(index=True)
-    user_id: str = Field(index=True)
+    ticket_number: str
+    booking_id: str
+    user_id: str
     passenger_name: str
     
     # QR Code
@@ -54,8 +55,12 @@ class Ticket(Document):
     class Settings:
         name = "tickets"
         indexes = [
-            "ticket_number",
+            IndexModel([("ticket_number", ASCENDING)], unique=True),
             "booking_id",
-            "user_id",
+            # Serves user_id lookups and newest-first history pagination
+            IndexModel(
+                [("user_id", ASCENDING), ("created_at", DESCENDING)],
+                name="user_recent"
+            ),
             "status",
         ]
@@ -3,8 +3,9 @@ User model
 """
 from datetime import datetime
 from typing import Optional, List
-from beanie import Document
-from pydantic import EmailStr, Field
+from beanie import Document, PydanticObjectId
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
+from pymongo import IndexModel, ASCENDING
 from enum import Enum
 
 
@@ -18,8 +19,8 @@ class UserRole(str, Enum):
 
 class User(Document):
     """User model"""
-    email: EmailStr = Field(unique=True, index=True)
-    phone: Optional[str] = Field(None, index=True)
+    email: EmailStr
+    phone: Optional[str] = None
     password_hash: str
     first_name: str
     last_name: str
@@ -35,7 +36,7 @@ class User(Document):
     class Settings:
         name = "users"
         indexes = [
-            "email",
+            IndexModel([("email", ASCENDING)], unique=True),
             "phone",
             "role",
         ]
@@ -43,3 +44,23 @@ class User(Document):
     @property
     def full_name(self) -> str:
         return f"{self.first_name} {self.last_name}"
+
+
+class UserProjection(BaseModel):
+    """User columns request auth needs (also the cached form); no password hash"""
+    model_config = ConfigDict(frozen=True, populate_by_name=True)
+
+    id: PydanticObjectId = Field(alias="_id")
+    email: str
+    phone: Optional[str] = None
+    first_name: str
+    last_name: str
+    role: UserRole
+    is_active: bool
+    is_verified: bool
+    operator_id: Optional[str] = None
+    partner_id: Optional[str] = None
+
+    @property
+    def full_name(self) -> str:
+        return f"{self.first_name} {self.last_name}"
@@ -4,22 +4,25 @@ Authentication routes
 from fastapi import APIRouter, HTTPException, status, Depends
 from datetime import datetime, timedelta
 from app.schemas.auth import UserRegister, UserLogin, Token, UserResponse
-from app.models.user import User
+from app.models.user import User, UserProjection
 from app.core.security import (
-    verify_password,
-    get_password_hash,
+    verify_password_async,
+    get_password_hash_async,
     create_access_token,
     create_refresh_token,
 )
-from app.middleware.auth import get_current_user
-from app.services.notification_service import NotificationService
+from app.middleware.auth import get_current_user, invalidate_cached_user
+from app.services.notification_service import NotificationService, get_notification_service
 
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
 
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-async def register(user_data: UserRegister):
+async def register(
+    user_data: UserRegister,
+    notification_service: NotificationService = Depends(get_notification_service),
+):
     """Register a new user"""
     
     # Check if user already exists
@@ -33,16 +36,16 @@ async def register(user_data: UserRegister):
     # Create new user
     user = User(
         email=user_data.email,
-        password_hash=get_password_hash(user_data.password),
+        password_hash=await get_password_hash_async(user_data.password),
         first_name=user_data.first_name,
         last_name=user_data.last_name,
         phone=user_data.phone,
     )
     
     await user.save()
+    invalidate_cached_user(str(user.id))
     
     # Send welcome email
-    notification_service = NotificationService()
     await notification_service.email_service.send_welcome_email(
         to_email=user.email,
         first_name=user.first_name,
@@ -72,7 +75,7 @@ async def login(credentials: UserLogin):
         )
     
     # Verify password
-    if not verify_password(credentials.password, user.password_hash):
+    if not await verify_password_async(credentials.password, user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid credentials"
@@ -88,6 +91,7 @@ async def login(credentials: UserLogin):
     # Update last login
     user.last_login = datetime.utcnow()
     await user.save()
+    invalidate_cached_user(str(user.id))
     
     # Create tokens
     access_token = create_access_token(
@@ -104,7 +108,7 @@ async def login(credentials: UserLogin):
 
 
 @router.get("/me", response_model=UserResponse)
-async def get_current_user_info(current_user: User = Depends(get_current_user)):
+async def get_current_user_info(current_user: UserProjection = Depends(get_current_user)):
     """Get current user information"""
     
     return UserResponse(
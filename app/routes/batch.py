@@ -0,0 +1,79 @@
+"""
+JSON batching: several API calls in one HTTP round-trip
+"""
+import asyncio
+from typing import Dict
+import httpx
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from app.schemas.batch import BATCH_MARKER_HEADER, BatchRequest, BatchRequestItem, BatchResponse, BatchResponseItem
+from app.models.partner import Partner
+from app.middleware.auth import verify_partner_api_key
+
+API_PREFIX = "/api/v1"
+
+# The caller's credentials are copied onto every batched call unless the item sets its own
+_FORWARDED_HEADERS = ("x-api-key", "authorization")
+
+router = APIRouter(prefix=API_PREFIX, tags=["Partner API"])
+
+
+async def _dispatch(client: httpx.AsyncClient, item: BatchRequestItem, forwarded: Dict[str, str]) -> BatchResponseItem:
+    """Run one batched call through the app and capture its response"""
+    headers = httpx.Headers(forwarded)
+    headers.update(item.headers)  # case-insensitive, so item headers replace forwarded ones
+    headers[BATCH_MARKER_HEADER] = "1"
+    response = await client.request(
+        item.method,
+        API_PREFIX + item.url,
+        headers=headers,
+        json=item.body if item.method != "GET" else None,
+    )
+
+    body = None
+    if response.content:
+        if response.headers.get("content-type", "").startswith("application/json"):
+            body = orjson.loads(response.content)
+        else:
+            body = response.text
+
+    return BatchResponseItem(
+        id=item.id,
+        status=response.status_code,
+        headers=dict(response.headers),
+        body=body,
+    )
+
+
+@router.post("/batch", response_model=BatchResponse)
+async def batch(
+    batch_req: BatchRequest,
+    request: Request,
+    partner: Partner = Depends(verify_partner_api_key),
+):
+    """
+    Dispatch up to 20 API calls concurrently and return every response at once
+
+    Each call runs through this app in-process (no extra sockets) with the
+    usual routing, validation, auth and rate limiting, so a batch of N calls
+    costs the partner one network round-trip instead of N. Calls are
+    independent: one failing doesn't stop the others, and responses come back
+    in request order.
+    """
+    if BATCH_MARKER_HEADER in request.headers:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Batches cannot be nested"
+        )
+
+    forwarded = {
+        name: request.headers[name] for name in _FORWARDED_HEADERS if name in request.headers
+    }
+
+    transport = httpx.ASGITransport(app=request.app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(transport=transport, base_url=str(request.base_url)) as client:
+        responses = await asyncio.gather(
+            *(_dispatch(client, item, forwarded) for item in batch_req.requests)
+        )
+
+    return BatchResponse(responses=list(responses))
@@ -1,15 +1,21 @@
 """
 Booking routes for unified search and booking management
 """
-from fastapi import APIRouter, HTTPException, status, Depends
-from typing import List
-from datetime import datetime
+import asyncio
+import heapq
+from beanie import PydanticObjectId
+from beanie.odm.queries.update import UpdateResponse
+from beanie.operators import NotIn, Set
+from fastapi import APIRouter, BackgroundTasks, HTTPException, status, Depends
+from itertools import islice
+from operator import attrgetter
+from typing import List, Optional
+from datetime import datetime, timezone
 from app.schemas.booking import (
     SearchRequest,
     SearchResult,
     BookingCreate,
     BookingResponse,
-    TransportType as SchemaTransportType,
 )
 from app.models.booking import (
     Booking,
@@ -18,71 +24,91 @@ from app.models.booking import (
     TrainBooking,
     BookingStatus,
     TransportType,
+    BookingListProjection,
 )
-from app.models.user import User
+from app.models.user import UserProjection
+from app.core.responses import MsgspecResponse
 from app.middleware.auth import get_current_user
-from app.services.travu_client import TravuAPIClient
-from app.services.nrc_client import NRCAPIClient
+from app.services.search_service import SearchService
+from app.services.booking_service import BookingService
 from app.services.ticket_service import TicketService
-from app.services.notification_service import NotificationService
+from app.services.notification_service import (
+    BookingConfirmationDetails,
+    NotificationService,
+    get_notification_service,
+)
+from app.services.travu_client import TravuAPIClient, get_travu_client
+from app.services.nrc_client import NRCAPIClient, get_nrc_client
+from app.services.search_cache import SearchCache, get_search_cache
+from app.services.dashboard_cache import DashboardCache, get_dashboard_cache
 from app.utils.helpers import generate_reference
 
 
 router = APIRouter(prefix="/bookings", tags=["Bookings"])
 
 
-def _to_booking_response(booking: Booking) -> BookingResponse:
-    """Map any booking document to BookingResponse"""
-    return BookingResponse(
-        id=str(booking.id),
-        booking_reference=booking.booking_reference,
-        user_id=booking.user_id,
-        transport_type=SchemaTransportType(booking.transport_type.value),
-        status=booking.status,
-        origin=booking.origin,
-        destination=booking.destination,
-        departure_date=booking.departure_date,
-        total_passengers=booking.total_passengers,
-        total_price=booking.total_price,
-        currency=booking.currency,
-        created_at=booking.created_at,
-    )
+_by_id = attrgetter("id")
+
+
+# Every collection a booking may live in
+_BOOKING_MODELS = (Booking, FlightBooking, BusBooking, TrainBooking)
+
+
+def _user_booking_filters(booking_id: str, current_user: UserProjection) -> Optional[list]:
+    """
+    Query filters selecting a booking visible to the current user (None for a malformed id)
+    Ownership is part of the query for non-admins, so other users' bookings
+    are never loaded (they read as not found)
+    """
+    if not PydanticObjectId.is_valid(booking_id):
+        return None
+
+    filters = [Booking.id == PydanticObjectId(booking_id)]
+    if current_user.role != "admin":
+        filters.append(Booking.user_id == str(current_user.id))
+    return filters
+
+
+async def _find_user_booking(
+    booking_id: str,
+    current_user: UserProjection,
+) -> Optional[BookingListProjection]:
+    """Fetch the response columns of a booking visible to the current user"""
+    filters = _user_booking_filters(booking_id, current_user)
+    if filters is None:
+        return None
+
+    # Attempt to locate the booking across all collections
+    for model in _BOOKING_MODELS:
+        booking = await model.find_one(*filters, projection_model=BookingListProjection)
+        if booking:
+            return booking
+    return None
 
 
 @router.post("/search", response_model=List[SearchResult])
-async def search_transport(search_req: SearchRequest):
+async def search_transport(
+    search_req: SearchRequest,
+    travu_client: TravuAPIClient = Depends(get_travu_client),
+    nrc_client: NRCAPIClient = Depends(get_nrc_client),
+    search_cache: SearchCache = Depends(get_search_cache),
+):
     """Unified search across all transport types"""
     
-    results = []
-    
-    # Search flights
-    if TransportType.FLIGHT in search_req.transport_types:
-        travu_client = TravuAPIClient()
-        flight_results = await travu_client.search_flights(search_req)
-        results.extend(flight_results)
-    
-    # Search buses
-    if TransportType.BUS in search_req.transport_types:
-        travu_client = TravuAPIClient()
-        bus_results = await travu_client.search_buses(search_req)
-        results.extend(bus_results)
-    
-    # Search trains
-    if TransportType.TRAIN in search_req.transport_types:
-        nrc_client = NRCAPIClient()
-        train_results = await nrc_client.search_trains(search_req)
-        results.extend(train_results)
-    
-    # Sort by price
-    results.sort(key=lambda x: x.price)
+    results = await SearchService.search(
+        search_req, travu_client, nrc_client, search_cache
+    )
     
-    return results
+    return MsgspecResponse(results)
 
 
 @router.post("/", response_model=BookingResponse, status_code=status.HTTP_201_CREATED)
 async def create_booking(
     booking_data: BookingCreate,
-    current_user: User = Depends(get_current_user)
+    background_tasks: BackgroundTasks,
+    current_user: UserProjection = Depends(get_current_user),
+    notification_service: NotificationService = Depends(get_notification_service),
+    dashboard_cache: DashboardCache = Depends(get_dashboard_cache),
 ):
     """Create a new booking"""
     
@@ -92,6 +118,9 @@ async def create_booking(
     # Get search result details (in production, this would come from cache or re-query)
     # For now, we'll create a mock booking
     
+    # One clock read per request, shared by every timestamp on the booking
+    now = datetime.now(timezone.utc)
+
     base_booking_data = {
         "booking_reference": booking_reference,
         "user_id": str(current_user.id),
@@ -101,6 +130,8 @@ async def create_booking(
         "total_passengers": len(booking_data.passengers),
         "provider_booking_id": booking_data.provider_reference,
         "metadata": booking_data.metadata,
+        "created_at": now,
+        "updated_at": now,
     }
     
     # Create transport-specific booking
@@ -110,44 +141,44 @@ async def create_booking(
             **base_booking_data,
             origin="Lagos",
             destination="Abuja",
-            departure_date=datetime.utcnow(),
+            departure_date=now,
             airline="Air Peace",
             flight_number="AA101",
-            base_price=40000.0,
-            tax=5000.0,
-            service_fee=2000.0,
-            total_price=47000.0,
+            base_price_kobo=4_000_000,
+            tax_kobo=500_000,
+            service_fee_kobo=200_000,
+            total_price_kobo=4_700_000,
         )
     elif booking_data.transport_type == TransportType.BUS:
         booking = BusBooking(
             **base_booking_data,
             origin="Lagos",
             destination="Ibadan",
-            departure_date=datetime.utcnow(),
+            departure_date=now,
             bus_company="GUO Transport",
             bus_type="Luxury",
             departure_terminal="Ojota Terminal",
             arrival_terminal="Ibadan Main",
-            base_price=7000.0,
-            tax=500.0,
-            service_fee=500.0,
-            total_price=8000.0,
+            base_price_kobo=700_000,
+            tax_kobo=50_000,
+            service_fee_kobo=50_000,
+            total_price_kobo=800_000,
         )
     elif booking_data.transport_type == TransportType.TRAIN:
         booking = TrainBooking(
             **base_booking_data,
             origin="Lagos",
             destination="Ibadan",
-            departure_date=datetime.utcnow(),
+            departure_date=now,
             train_service="Lagos-Ibadan Express",
             train_number="NRC-001",
             departure_station="Ebute Metta",
             arrival_station="Ibadan Station",
             train_class="Standard",
-            base_price=3000.0,
-            tax=300.0,
-            service_fee=200.0,
-            total_price=3500.0,
+            base_price_kobo=300_000,
+            tax_kobo=30_000,
+            service_fee_kobo=20_000,
+            total_price_kobo=350_000,
         )
     else:
         raise HTTPException(
@@ -155,135 +186,115 @@ async def create_booking(
             detail="Invalid transport type"
         )
     
-    # Persist booking
-    await booking.save()  # type: ignore
+    # Persist booking (insert skips save()'s upsert path for a brand-new document)
+    await booking.insert()  # type: ignore
+    if booking.operator_id:
+        await dashboard_cache.invalidate(booking.operator_id)
     
-    # Send booking confirmation
-    notification_service = NotificationService()
-    await notification_service.send_booking_confirmation(
+    # Send booking confirmation after the response so email/SMS latency isn't on the request
+    background_tasks.add_task(
+        notification_service.send_booking_confirmation,
         email=current_user.email,
         phone=current_user.phone,
         booking_reference=booking_reference,
-        booking_details={
-            "customer_name": f"{current_user.first_name} {current_user.last_name}",
-            "transport_type": booking.transport_type,
-            "origin": booking.origin,
-            "destination": booking.destination,
-            "departure_date": booking.departure_date.strftime("%Y-%m-%d %H:%M"),
-            "total_passengers": booking.total_passengers,
-            "total_price": booking.total_price,
-        }
+        booking_details=BookingConfirmationDetails(
+            customer_name=f"{current_user.first_name} {current_user.last_name}",
+            transport_type=booking.transport_type.value,
+            origin=booking.origin,
+            destination=booking.destination,
+            departure_date=booking.departure_date.strftime("%Y-%m-%d %H:%M"),
+            total_passengers=booking.total_passengers,
+            total_price_kobo=booking.total_price_kobo,
+        ),
     )
     
-    return BookingResponse(
-        id=str(booking.id),
-        booking_reference=booking.booking_reference,
-        user_id=booking.user_id,
-        transport_type=SchemaTransportType(booking.transport_type.value),
-        status=booking.status,
-        origin=booking.origin,
-        destination=booking.destination,
-        departure_date=booking.departure_date,
-        total_passengers=booking.total_passengers,
-        total_price=booking.total_price,
-        currency=booking.currency,
-        created_at=booking.created_at,
+    return MsgspecResponse(
+        BookingService.to_struct(booking), status_code=status.HTTP_201_CREATED
     )
 
 
 @router.get("/", response_model=List[BookingResponse])
 async def get_user_bookings(
-    current_user: User = Depends(get_current_user),
+    current_user: UserProjection = Depends(get_current_user),
     skip: int = 0,
     limit: int = 10,
 ):
     """Get user's bookings"""
-    # Collect from all specific booking collections to ensure unified results
+    # Collect from all specific booking collections to ensure unified results.
+    # Each collection only needs its newest skip+limit rows, and only the
+    # response columns are fetched.
     user_filter = Booking.user_id == str(current_user.id)
+    window = skip + limit
 
-    flight_bookings = await FlightBooking.find(user_filter).to_list()
-    bus_bookings = await BusBooking.find(user_filter).to_list()
-    train_bookings = await TrainBooking.find(user_filter).to_list()
+    per_collection = await asyncio.gather(*(
+        model.find(user_filter)
+        .sort(-Booking.id)
+        .limit(window)
+        .project(BookingListProjection)
+        .to_list()
+        for model in (FlightBooking, BusBooking, TrainBooking)
+    ))
 
-    combined = flight_bookings + bus_bookings + train_bookings
+    # Merge the already-sorted lists newest first, then paginate
+    combined = heapq.merge(*per_collection, key=_by_id, reverse=True)
+    paged = islice(combined, skip, window)
 
-    # Sort newest first by created_at for consistency
-    combined.sort(key=lambda b: b.created_at, reverse=True)
-
-    # Paginate after merge
-    paged = combined[skip : skip + limit]
-
-    return [_to_booking_response(b) for b in paged]
+    return MsgspecResponse([BookingService.to_struct(row) for row in paged])
 
 
 @router.get("/{booking_id}", response_model=BookingResponse)
 async def get_booking(
     booking_id: str,
-    current_user: User = Depends(get_current_user)
+    current_user: UserProjection = Depends(get_current_user)
 ):
     """Get a specific booking"""
-    # Attempt to locate the booking across all collections
-    booking = await Booking.get(booking_id)
-    if not booking:
-        # Try specific collections
-        booking = await FlightBooking.get(booking_id)
-    if not booking:
-        booking = await BusBooking.get(booking_id)
-    if not booking:
-        booking = await TrainBooking.get(booking_id)
+    booking = await _find_user_booking(booking_id, current_user)
     if not booking:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Booking not found",
         )
     
-    # Check if user owns the booking
-    if booking.user_id != str(current_user.id) and current_user.role != "admin":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to view this booking"
-        )
-    
-    return _to_booking_response(booking)
+    return MsgspecResponse(BookingService.to_struct(booking))
 
 
 @router.post("/{booking_id}/cancel")
 async def cancel_booking(
     booking_id: str,
-    current_user: User = Depends(get_current_user)
+    current_user: UserProjection = Depends(get_current_user),
+    dashboard_cache: DashboardCache = Depends(get_dashboard_cache),
 ):
     """Cancel a booking"""
-    # Locate the booking across all collections
-    booking = await Booking.get(booking_id)
-    if not booking:
-        booking = await FlightBooking.get(booking_id)
-    if not booking:
-        booking = await BusBooking.get(booking_id)
-    if not booking:
-        booking = await TrainBooking.get(booking_id)
-    if not booking:
+    filters = _user_booking_filters(booking_id, current_user)
+    if filters is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Booking not found",
         )
     
-    # Check if user owns the booking
-    if booking.user_id != str(current_user.id) and current_user.role != "admin":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to cancel this booking"
-        )
+    # Status check and update happen in one atomic $set of just the changed fields
+    now = datetime.now(timezone.utc)
+    for model in _BOOKING_MODELS:
+        booking = await model.find_one(
+            *filters,
+            NotIn(model.status, [BookingStatus.CANCELLED, BookingStatus.COMPLETED]),
+        ).update(Set({
+            model.status: BookingStatus.CANCELLED,
+            model.cancelled_at: now,
+            model.updated_at: now,
+        }), response_type=UpdateResponse.NEW_DOCUMENT)
+        if booking is not None:
+            if booking.operator_id:
+                await dashboard_cache.invalidate(booking.operator_id)
+            return {"message": "Booking cancelled successfully"}
     
-    # Check if booking can be cancelled
-    if booking.status in [BookingStatus.CANCELLED, BookingStatus.COMPLETED]:
+    # Nothing matched: either no such booking, or it can't be cancelled any more
+    if await _find_user_booking(booking_id, current_user):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Booking cannot be cancelled"
         )
-    
-    # Update booking status
-    booking.status = BookingStatus.CANCELLED
-    booking.cancelled_at = datetime.utcnow()
-    await booking.save()  # type: ignore
-    
-    return {"message": "Booking cancelled successfully"}
+    raise HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail="Booking not found",
+    )
@@ -2,64 +2,134 @@
 Operator dashboard routes
 """
 from fastapi import APIRouter, HTTPException, status, Depends
+from fastapi.responses import ORJSONResponse
 from typing import List, Dict, Any
 from datetime import datetime, timedelta
-from app.models.user import User
-from app.models.operator import Operator
+from app.models.user import UserProjection
+from app.models.operator import OperatorProjection
 from app.models.booking import Booking
-from app.models.payment import Payment, Transaction
+from app.models.payment import Payment, PaymentStatus, Transaction, TransactionType
 from app.middleware.auth import get_current_operator
+from app.services.operator_cache import OperatorCache, get_operator_cache
+from app.services.dashboard_cache import DashboardCache, get_dashboard_cache
 from pymongo import DESCENDING
 
 
 router = APIRouter(prefix="/operators", tags=["Operators"])
 
+# Routes return ORJSONResponse directly: payloads are plain dicts (mostly
+# straight from aggregations), so FastAPI's jsonable_encoder pass is overhead
 
-@router.get("/dashboard")
-async def get_dashboard(
-    current_user: User = Depends(get_current_operator)
-):
-    """Get operator dashboard data"""
-    
-    # Get operator
-    operator = await Operator.find_one(Operator.operator_code == current_user.operator_id)
+# Shape of each row returned by GET /operators/bookings
+_OPERATOR_BOOKING_FIELDS = {
+    "_id": 0,
+    "id": {"$toString": "$_id"},
+    "booking_reference": 1,
+    "transport_type": 1,
+    "status": 1,
+    "origin": 1,
+    "destination": 1,
+    "departure_date": 1,
+    "total_passengers": 1,
+    "total_price_kobo": 1,
+    "created_at": 1,
+}
+
+# Shape of each row in GET /operators/payouts
+_PAYOUT_FIELDS = {
+    "_id": 0,
+    "transaction_id": 1,
+    "amount_kobo": 1,
+    "status": 1,
+    "description": 1,
+    "created_at": 1,
+}
+
+# Documents per getMore when streaming aggregation results
+_AGGREGATE_BATCH_SIZE = 500
+
+
+async def get_operator(
+    current_user: UserProjection = Depends(get_current_operator),
+    operator_cache: OperatorCache = Depends(get_operator_cache),
+) -> OperatorProjection:
+    """Resolve the signed-in operator user's Operator record (cached)"""
+    operator = await operator_cache.get(current_user.operator_id)
     if not operator:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Operator not found"
         )
+    return operator
+
+
+def _successful_payments_lookup() -> List[Dict[str, Any]]:
+    """
+    Stages joining each booking to its successful payments as "pays".
+    Payments store booking_id as a string, so the ObjectId is stringified
+    first; the join itself is served by the payments (booking_id, status) index.
+    """
+    return [
+        {"$addFields": {"booking_id": {"$toString": "$_id"}}},
+        {"$lookup": {
+            "from": Payment.Settings.name,
+            "localField": "booking_id",
+            "foreignField": "booking_id",
+            "pipeline": [
+                {"$match": {"status": PaymentStatus.SUCCESS.value}},
+                {"$project": {"_id": 0, "amount_kobo": 1, "paid_at": 1}},
+            ],
+            "as": "pays",
+        }},
+        {"$unwind": "$pays"},
+    ]
+
+
+@router.get("/dashboard")
+async def get_dashboard(
+    operator: OperatorProjection = Depends(get_operator),
+    dashboard_cache: DashboardCache = Depends(get_dashboard_cache),
+):
+    """Get operator dashboard data"""
+    
+    cached = await dashboard_cache.get(str(operator.id))
+    if cached is not None:
+        return ORJSONResponse(cached)
     
     # Get date ranges
     today = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
     week_ago = today - timedelta(days=7)
     month_ago = today - timedelta(days=30)
     
-    # Get bookings count
-    total_bookings = await Booking.find(
-        Booking.operator_id == str(operator.id)
-    ).count()
-    
-    today_bookings = await Booking.find(
-        Booking.operator_id == str(operator.id),
-        Booking.created_at >= today
-    ).count()
-    
-    # Get revenue
-    total_revenue = 0.0
-    today_revenue = 0.0
-    
-    payments = await Payment.find(
-        Payment.status == "success"
-    ).to_list()
-    
-    for payment in payments:
-        booking = await Booking.get(payment.booking_id)
-        if booking and booking.operator_id == str(operator.id):
-            total_revenue += payment.amount
-            if payment.paid_at and payment.paid_at >= today:
-                today_revenue += payment.amount
-    
-    return {
+    # Booking counts and revenue in one pass over the operator's bookings;
+    # revenue joins to successful payments server-side (no per-payment lookups)
+    [stats] = await Booking.aggregate([
+        {"$match": {"operator_id": str(operator.id)}},
+        {"$project": {"_id": 1, "created_at": 1}},
+        {"$facet": {
+            "total": [{"$count": "n"}],
+            "today": [{"$match": {"created_at": {"$gte": today}}}, {"$count": "n"}],
+            "revenue": [
+                *_successful_payments_lookup(),
+                {"$group": {
+                    "_id": None,
+                    "total": {"$sum": "$pays.amount_kobo"},
+                    "today": {"$sum": {
+                        "$cond": [{"$gte": ["$pays.paid_at", today]}, "$pays.amount_kobo", 0]
+                    }},
+                }},
+            ],
+        }},
+    ]).to_list()
+
+    # Empty facet branches come back as [] rather than zero-valued documents
+    total_bookings = stats["total"][0]["n"] if stats["total"] else 0
+    today_bookings = stats["today"][0]["n"] if stats["today"] else 0
+    revenue = stats["revenue"][0] if stats["revenue"] else {"total": 0, "today": 0}
+    total_revenue = revenue["total"]
+    today_revenue = revenue["today"]
+    
+    dashboard = {
         "operator": {
             "name": operator.name,
             "operator_code": operator.operator_code,
@@ -69,131 +139,104 @@ async def get_dashboard(
         "stats": {
             "total_bookings": total_bookings,
             "today_bookings": today_bookings,
-            "total_revenue": total_revenue,
-            "today_revenue": today_revenue,
+            "total_revenue_kobo": total_revenue,
+            "today_revenue_kobo": today_revenue,
         }
     }
+    await dashboard_cache.set(str(operator.id), dashboard)
+    
+    return ORJSONResponse(dashboard)
 
 
 @router.get("/bookings")
 async def get_operator_bookings(
-    current_user: User = Depends(get_current_operator),
+    operator: OperatorProjection = Depends(get_operator),
     skip: int = 0,
     limit: int = 20,
 ):
     """Get operator's bookings"""
     
-    operator = await Operator.find_one(Operator.operator_code == current_user.operator_id)
-    if not operator:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Operator not found"
-        )
-    
-    bookings = await Booking.find(
-        Booking.operator_id == str(operator.id)
-    ).skip(skip).limit(limit).sort([("created_at", DESCENDING)]).to_list()
-    
-    return {
-        "bookings": [
-            {
-                "id": str(booking.id),
-                "booking_reference": booking.booking_reference,
-                "transport_type": booking.transport_type,
-                "status": booking.status,
-                "origin": booking.origin,
-                "destination": booking.destination,
-                "departure_date": booking.departure_date,
-                "total_passengers": booking.total_passengers,
-                "total_price": booking.total_price,
-                "created_at": booking.created_at,
-            }
-            for booking in bookings
-        ],
-        "total": await Booking.find(Booking.operator_id == str(operator.id)).count()
-    }
+    # Page and total count in one round-trip, fetching only the listed fields
+    [result] = await Booking.aggregate([
+        {"$match": {"operator_id": str(operator.id)}},
+        {"$sort": {"created_at": DESCENDING}},
+        {"$facet": {
+            "bookings": [
+                {"$skip": skip},
+                {"$limit": limit},
+                {"$project": _OPERATOR_BOOKING_FIELDS},
+            ],
+            "total": [{"$count": "n"}],
+        }},
+    ]).to_list()
+
+    return ORJSONResponse({
+        "bookings": result["bookings"],
+        "total": result["total"][0]["n"] if result["total"] else 0,
+    })
 
 
 @router.get("/sales")
 async def get_sales_analytics(
-    current_user: User = Depends(get_current_operator),
+    operator: OperatorProjection = Depends(get_operator),
     days: int = 30,
 ):
     """Get sales analytics"""
     
-    operator = await Operator.find_one(Operator.operator_code == current_user.operator_id)
-    if not operator:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Operator not found"
-        )
-    
     start_date = datetime.utcnow() - timedelta(days=days)
     
-    # Get bookings in date range
-    bookings = await Booking.find(
-        Booking.operator_id == str(operator.id),
-        Booking.created_at >= start_date
-    ).to_list()
-    
-    # Aggregate by day
-    daily_sales: Dict[str, Any] = {}
-    for booking in bookings:
-        date_key = booking.created_at.strftime("%Y-%m-%d")
-        if date_key not in daily_sales:
-            daily_sales[date_key] = {
-                "date": date_key,
-                "bookings": 0,
-                "revenue": 0.0,
-            }
-        
-        daily_sales[date_key]["bookings"] += 1
-        daily_sales[date_key]["revenue"] += booking.total_price
-    
-    return {
+    # Roll bookings up per day in the database and stream the per-day rows
+    # from the cursor; memory stays O(days) however many bookings matched
+    daily_sales = []
+    total_bookings = 0
+    total_revenue_kobo = 0
+    async for day in Booking.aggregate([
+        {"$match": {"operator_id": str(operator.id), "created_at": {"$gte": start_date}}},
+        {"$group": {
+            "_id": {"$dateToString": {"format": "%Y-%m-%d", "date": "$created_at"}},
+            "bookings": {"$sum": 1},
+            "revenue_kobo": {"$sum": "$total_price_kobo"},
+        }},
+        {"$sort": {"_id": 1}},
+        {"$project": {"_id": 0, "date": "$_id", "bookings": 1, "revenue_kobo": 1}},
+    ], batchSize=_AGGREGATE_BATCH_SIZE):
+        daily_sales.append(day)
+        total_bookings += day["bookings"]
+        total_revenue_kobo += day["revenue_kobo"]
+
+    return ORJSONResponse({
         "period_days": days,
-        "daily_sales": list(daily_sales.values()),
-        "total_bookings": len(bookings),
-        "total_revenue": sum(b.total_price for b in bookings),
-    }
+        "daily_sales": daily_sales,
+        "total_bookings": total_bookings,
+        "total_revenue_kobo": total_revenue_kobo,
+    })
 
 
 @router.get("/payouts")
 async def get_payouts(
-    current_user: User = Depends(get_current_operator),
+    operator: OperatorProjection = Depends(get_operator),
 ):
     """Get payout information"""
     
-    operator = await Operator.find_one(Operator.operator_code == current_user.operator_id)
-    if not operator:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Operator not found"
-        )
-    
-    # Get transactions
-    transactions = await Transaction.find(
-        Transaction.operator_id == str(operator.id),
-        Transaction.transaction_type == "payout"
-    ).sort([("created_at", DESCENDING)]).to_list()
-    
-    total_payout = sum(t.amount for t in transactions)
-    
-    return {
+    # Payout rows and their total in one pass over the operator's payouts
+    [result] = await Transaction.aggregate([
+        {"$match": {
+            "operator_id": str(operator.id),
+            "transaction_type": TransactionType.PAYOUT.value,
+        }},
+        {"$sort": {"created_at": DESCENDING}},
+        {"$facet": {
+            "payouts": [{"$project": _PAYOUT_FIELDS}],
+            "total": [{"$group": {"_id": None, "amount_kobo": {"$sum": "$amount_kobo"}}}],
+        }},
+    ]).to_list()
+    
+    return ORJSONResponse({
         "operator": {
             "name": operator.name,
             "commission_percentage": operator.commission_percentage,
             "subaccount_code": operator.paystack_subaccount_code,
         },
-        "payouts": [
-            {
-                "transaction_id": t.transaction_id,
-                "amount": t.amount,
-                "status": t.status,
-                "description": t.description,
-                "created_at": t.created_at,
-            }
-            for t in transactions
-        ],
-        "total_payout": total_payout,
-    }
+        "payouts": result["payouts"],
+        "total_payout_kobo": result["total"][0]["amount_kobo"] if result["total"] else 0,
+    })
@@ -2,8 +2,11 @@
 Partner authentication routes
 """
 from fastapi import APIRouter, HTTPException, status, Depends, Query
+from fastapi.responses import ORJSONResponse
 from typing import List
 from datetime import datetime
+from bson import ObjectId
+from pymongo import ReturnDocument
 
 from app.schemas.partner_auth import (
     PartnerRegister, PartnerLogin, TokenResponse,
@@ -13,8 +16,10 @@ from app.schemas.partner_auth import (
 )
 from app.services.partner_auth_service import PartnerAuthService
 from app.services.partner_service import PartnerService
+from app.services.partner_token_cache import PartnerTokenCache, get_partner_token_cache
+from app.services.partner_response_cache import PartnerResponseCache, get_partner_response_cache
 from app.models.partner import Partner, PartnerStatus
-from app.models.user import User
+from app.models.user import UserProjection
 from app.middleware.auth import get_current_partner, get_current_admin
 from app.core.security import decode_token
 import logging
@@ -24,6 +29,30 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/v1/partners/auth", tags=["Partner Authentication"])
 admin_router = APIRouter(prefix="/api/v1/admin/partners", tags=["Admin - Partner Management"])
 
+# Login rejection message per non-active status, built once at import
+_STATUS_MESSAGES = {
+    PartnerStatus.PENDING_VERIFICATION: "Please verify your email address",
+    PartnerStatus.PENDING_APPROVAL: "Your application is pending admin approval",
+    PartnerStatus.REJECTED: "Your application has been rejected",
+    PartnerStatus.SUSPENDED: "Your account has been suspended",
+    PartnerStatus.INACTIVE: "Your account is inactive",
+}
+
+# Shape of each row returned by GET /admin/partners/pending
+_PENDING_PARTNER_FIELDS = {
+    "_id": 0,
+    "id": {"$toString": "$_id"},
+    "partner_code": 1,
+    "name": 1,
+    "email": 1,
+    "company_name": 1,
+    "business_type": 1,
+    "business_description": 1,
+    "expected_monthly_volume": 1,
+    "created_at": 1,
+    "email_verified": 1,
+}
+
 
 # ============================================================================
 # PUBLIC ENDPOINTS (No Authentication Required)
@@ -113,16 +142,9 @@ async def login_partner(login_data: PartnerLogin):
         )
     
     if partner.status != PartnerStatus.ACTIVE:
-        status_messages = {
-            PartnerStatus.PENDING_VERIFICATION: "Please verify your email address",
-            PartnerStatus.PENDING_APPROVAL: "Your application is pending admin approval",
-            PartnerStatus.REJECTED: "Your application has been rejected",
-            PartnerStatus.SUSPENDED: "Your account has been suspended",
-            PartnerStatus.INACTIVE: "Your account is inactive"
-        }
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
-            detail=status_messages.get(partner.status, "Account is not active")
+            detail=_STATUS_MESSAGES.get(partner.status, "Account is not active")
         )
     
     tokens = PartnerAuthService.create_partner_tokens(partner)
@@ -133,11 +155,16 @@ async def login_partner(login_data: PartnerLogin):
 
 
 @router.post("/refresh", response_model=TokenResponse)
-async def refresh_token(refresh_data: RefreshTokenRequest):
+async def refresh_token(
+    refresh_data: RefreshTokenRequest,
+    token_cache: PartnerTokenCache = Depends(get_partner_token_cache),
+    response_cache: PartnerResponseCache = Depends(get_partner_response_cache)
+):
     """
     Refresh access token
     
-    Uses refresh token to generate a new access token.
+    Uses refresh token to generate a new access token. Each refresh token
+    is single-use: it is revoked once exchanged.
     """
     try:
         payload = decode_token(refresh_data.refresh_token)
@@ -148,25 +175,54 @@ async def refresh_token(refresh_data: RefreshTokenRequest):
                 detail="Invalid token type"
             )
         
+        jti = payload.get("jti")
+        if not jti or await token_cache.is_revoked(jti):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Token revoked"
+            )
+        
+        # Cached profile first; Mongo only when Redis doesn't know the partner
         partner_id = payload.get("sub")
-        partner = await Partner.get(partner_id)
+        profile = await token_cache.get_profile(partner_id)
+        if profile is None:
+            partner = await Partner.get(partner_id)
+            if partner:
+                profile = PartnerAuthService.token_profile(partner)
+                await token_cache.set_profile(profile)
         
-        if not partner or partner.status != PartnerStatus.ACTIVE:
+        if not profile or profile["status"] != PartnerStatus.ACTIVE:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid token"
             )
         
-        tokens = PartnerAuthService.create_partner_tokens(partner)
-        
-        return TokenResponse(**tokens)
-    
     except Exception as e:
         logger.error(f"Token refresh error: {e}")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid or expired refresh token"
         )
+    
+    # Rotation: claiming the jti is the atomic check-and-revoke, so two
+    # concurrent exchanges of one token can't both succeed. If Redis is
+    # configured but unreachable, refuse rather than let the token be reused.
+    try:
+        first_use = await token_cache.claim(jti, payload["exp"])
+    except Exception as e:
+        logger.error(f"Refresh token claim failed: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Token refresh is temporarily unavailable"
+        )
+    if not first_use:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token revoked"
+        )
+    
+    tokens = PartnerAuthService.create_tokens_for_profile(profile)
+    return TokenResponse(**tokens)
 
 
 @router.post("/forgot-password", status_code=status.HTTP_200_OK)
@@ -259,41 +315,91 @@ async def change_password(
 
 @admin_router.get("/pending", response_model=List[dict])
 async def list_pending_partners(
-    admin: User = Depends(get_current_admin),
+    admin: UserProjection = Depends(get_current_admin),
     skip: int = Query(0, ge=0),
     limit: int = Query(10, ge=1, le=100)
 ):
     """
     List pending partner applications
     
-    Returns partners with PENDING_APPROVAL status.
+    Returns partners with PENDING_APPROVAL status, newest first.
+    The total number of pending applications is sent in X-Total-Count.
     """
-    partners = await Partner.find(
-        Partner.status == PartnerStatus.PENDING_APPROVAL
-    ).skip(skip).limit(limit).to_list()
+    # Page and total in one round-trip, projected to the listed fields
+    [result] = await Partner.aggregate([
+        {"$match": {"status": PartnerStatus.PENDING_APPROVAL.value}},
+        {"$sort": {"created_at": -1}},
+        {"$facet": {
+            "partners": [
+                {"$skip": skip},
+                {"$limit": limit},
+                {"$project": _PENDING_PARTNER_FIELDS},
+            ],
+            "total": [{"$count": "n"}],
+        }},
+    ]).to_list()
+    
+    total = result["total"][0]["n"] if result["total"] else 0
+    return ORJSONResponse(result["partners"], headers={"X-Total-Count": str(total)})
+
+
+async def _transition_partner(
+    partner_id: str,
+    expected: PartnerStatus,
+    changes: dict,
+    wrong_status_detail: str
+) -> Partner:
+    """
+    Atomically move a partner out of `expected` status, applying `changes`
     
-    return [
-        {
-            "id": str(p.id),
-            "partner_code": p.partner_code,
-            "name": p.name,
-            "email": p.email,
-            "company_name": p.company_name,
-            "business_type": p.business_type,
-            "business_description": p.business_description,
-            "expected_monthly_volume": p.expected_monthly_volume,
-            "created_at": p.created_at,
-            "email_verified": p.email_verified
-        }
-        for p in partners
-    ]
+    The status check and the write are a single find_one_and_update, so two
+    admins acting at once cannot both win. 404 if the partner doesn't exist,
+    409 if it is no longer in the expected status.
+    """
+    collection = Partner.get_motor_collection()
+    oid = ObjectId(partner_id) if ObjectId.is_valid(partner_id) else None
+    
+    doc = None
+    if oid is not None:
+        doc = await collection.find_one_and_update(
+            {"_id": oid, "status": expected.value},
+            {"$set": changes, "$currentDate": {"updated_at": True}},
+            return_document=ReturnDocument.AFTER,
+        )
+    
+    if doc is None:
+        # Failure path only: tell a missing partner apart from a lost race
+        current = oid and await collection.find_one({"_id": oid}, {"status": 1})
+        if not current:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Partner not found"
+            )
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=wrong_status_detail.format(status=current["status"])
+        )
+    
+    return Partner.model_validate(doc)
+
+
+async def _refresh_partner_caches(
+    partner: Partner,
+    token_cache: PartnerTokenCache,
+    response_cache: PartnerResponseCache
+) -> None:
+    """Rewrite the cached token profile and drop cached GET bodies after a status change"""
+    await token_cache.set_profile(PartnerAuthService.token_profile(partner))
+    await response_cache.invalidate(str(partner.id))
 
 
 @admin_router.post("/{partner_id}/approve", status_code=status.HTTP_200_OK)
 async def approve_partner(
     partner_id: str,
     approval_data: PartnerApprovalRequest,
-    admin: User = Depends(get_current_admin)
+    admin: UserProjection = Depends(get_current_admin),
+    token_cache: PartnerTokenCache = Depends(get_partner_token_cache),
+    response_cache: PartnerResponseCache = Depends(get_partner_response_cache)
 ):
     """
     Approve or reject partner application
@@ -307,40 +413,31 @@ async def approve_partner(
     - Updates status to REJECTED
     - Sends rejection email
     """
-    partner = await Partner.get(partner_id)
-    
-    if not partner:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Partner not found"
-        )
-    
-    if partner.status != PartnerStatus.PENDING_APPROVAL:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Partner status is {partner.status}, expected pending_approval"
-        )
+    wrong_status = "Partner status is {status}, expected pending_approval"
     
     if approval_data.action == "approve":
-        # Approve partner
-        partner.status = PartnerStatus.ACTIVE
-        partner.approved_by = str(admin.id)
-        partner.approved_at = datetime.utcnow()
-        partner.approval_notes = approval_data.notes
+        # Generate new API credentials (replace temp ones)
+        api_key, api_secret = PartnerService.generate_api_credentials()
+        
+        changes = {
+            "status": PartnerStatus.ACTIVE.value,
+            "approved_by": str(admin.id),
+            "approved_at": datetime.utcnow(),
+            "approval_notes": approval_data.notes,
+            "api_key": api_key,
+            "api_secret": PartnerService.hash_secret(api_secret),
+        }
         
         # Set rate limits
         if approval_data.rate_limit_per_minute:
-            partner.rate_limit_per_minute = approval_data.rate_limit_per_minute
+            changes["rate_limit_per_minute"] = approval_data.rate_limit_per_minute
         if approval_data.rate_limit_per_day:
-            partner.rate_limit_per_day = approval_data.rate_limit_per_day
-        
-        # Generate new API credentials (replace temp ones)
-        api_key, api_secret = PartnerService.generate_api_credentials()
-        partner.api_key = api_key
-        partner.api_secret = PartnerService.hash_secret(api_secret)
+            changes["rate_limit_per_day"] = approval_data.rate_limit_per_day
         
-        partner.updated_at = datetime.utcnow()
-        await partner.save()
+        partner = await _transition_partner(
+            partner_id, PartnerStatus.PENDING_APPROVAL, changes, wrong_status
+        )
+        await _refresh_partner_caches(partner, token_cache, response_cache)
         
         # TODO: Send approval email with credentials
         # await send_approval_email(partner, api_key, api_secret)
@@ -358,12 +455,17 @@ async def approve_partner(
     
     elif approval_data.action == "reject":
         # Reject partner
-        partner.status = PartnerStatus.REJECTED
-        partner.rejected_reason = approval_data.reason
-        partner.rejected_at = datetime.utcnow()
-        partner.updated_at = datetime.utcnow()
-        
-        await partner.save()
+        partner = await _transition_partner(
+            partner_id,
+            PartnerStatus.PENDING_APPROVAL,
+            {
+                "status": PartnerStatus.REJECTED.value,
+                "rejected_reason": approval_data.reason,
+                "rejected_at": datetime.utcnow(),
+            },
+            wrong_status
+        )
+        await _refresh_partner_caches(partner, token_cache, response_cache)
         
         # TODO: Send rejection email
         # await send_rejection_email(partner, approval_data.reason)
@@ -381,34 +483,28 @@ async def approve_partner(
 async def suspend_partner(
     partner_id: str,
     reason: str = Query(..., min_length=10, max_length=500),
-    admin: User = Depends(get_current_admin)
+    admin: UserProjection = Depends(get_current_admin),
+    token_cache: PartnerTokenCache = Depends(get_partner_token_cache),
+    response_cache: PartnerResponseCache = Depends(get_partner_response_cache)
 ):
     """
     Suspend an active partner
     
     Prevents partner from accessing the API.
     """
-    partner = await Partner.get(partner_id)
-    
-    if not partner:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Partner not found"
-        )
-    
-    if partner.status != PartnerStatus.ACTIVE:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Can only suspend active partners"
-        )
-    
-    partner.status = PartnerStatus.SUSPENDED
-    partner.metadata["suspension_reason"] = reason
-    partner.metadata["suspended_by"] = str(admin.id)
-    partner.metadata["suspended_at"] = datetime.utcnow().isoformat()
-    partner.updated_at = datetime.utcnow()
-    
-    await partner.save()
+    # Only the changed fields are written, never the whole document
+    partner = await _transition_partner(
+        partner_id,
+        PartnerStatus.ACTIVE,
+        {
+            "status": PartnerStatus.SUSPENDED.value,
+            "metadata.suspension_reason": reason,
+            "metadata.suspended_by": str(admin.id),
+            "metadata.suspended_at": datetime.utcnow().isoformat(),
+        },
+        "Can only suspend active partners"
+    )
+    await _refresh_partner_caches(partner, token_cache, response_cache)
     
     # TODO: Send suspension notification email
     # await send_suspension_email(partner, reason)
@@ -425,33 +521,26 @@ async def suspend_partner(
 @admin_router.post("/{partner_id}/activate", status_code=status.HTTP_200_OK)
 async def activate_partner(
     partner_id: str,
-    admin: User = Depends(get_current_admin)
+    admin: UserProjection = Depends(get_current_admin),
+    token_cache: PartnerTokenCache = Depends(get_partner_token_cache),
+    response_cache: PartnerResponseCache = Depends(get_partner_response_cache)
 ):
     """
     Activate a suspended partner
     
     Restores partner access to the API.
     """
-    partner = await Partner.get(partner_id)
-    
-    if not partner:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Partner not found"
-        )
-    
-    if partner.status != PartnerStatus.SUSPENDED:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Can only activate suspended partners"
-        )
-    
-    partner.status = PartnerStatus.ACTIVE
-    partner.metadata["reactivated_by"] = str(admin.id)
-    partner.metadata["reactivated_at"] = datetime.utcnow().isoformat()
-    partner.updated_at = datetime.utcnow()
-    
-    await partner.save()
+    partner = await _transition_partner(
+        partner_id,
+        PartnerStatus.SUSPENDED,
+        {
+            "status": PartnerStatus.ACTIVE.value,
+            "metadata.reactivated_by": str(admin.id),
+            "metadata.reactivated_at": datetime.utcnow().isoformat(),
+        },
+        "Can only activate suspended partners"
+    )
+    await _refresh_partner_caches(partner, token_cache, response_cache)
     
     # TODO: Send reactivation email
     # await send_reactivation_email(partner)
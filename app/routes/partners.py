@@ -1,8 +1,9 @@
 """
 Partner API routes with comprehensive B2B management
 """
-from fastapi import APIRouter, HTTPException, status, Depends
+from fastapi import APIRouter, BackgroundTasks, HTTPException, status, Depends, Response
 from typing import List
+import httpx
 from datetime import datetime, timedelta
 
 # Schemas
@@ -17,17 +18,26 @@ from app.schemas.partner import (
 # Models
 from app.models.partner import Partner
 from app.models.booking import Booking, TransportType, BookingStatus
-from app.models.user import User
+from app.models.user import UserProjection
 
 # Services
 from app.services.partner_service import PartnerService
-from app.services.webhook_service import WebhookService
-from app.services.travu_client import TravuAPIClient
-from app.services.nrc_client import NRCAPIClient
+from app.services.partner_auth_service import PartnerAuthService
+from app.services.webhook_service import WebhookService, get_webhook_http_client
+from app.services.search_service import SearchService
+from app.services.booking_service import BookingService
+from app.services.travu_client import TravuAPIClient, get_travu_client
+from app.services.nrc_client import NRCAPIClient, get_nrc_client
+from app.services.search_cache import SearchCache, get_search_cache
+from app.services.partner_response_cache import PartnerResponseCache, get_partner_response_cache
+from app.services.partner_token_cache import PartnerTokenCache, get_partner_token_cache
+from app.services.dashboard_cache import DashboardCache, get_dashboard_cache
 
 # Middleware
 from app.middleware.auth import verify_partner_api_key, get_current_admin
 
+from app.core.responses import MsgspecResponse
+
 
 router = APIRouter(prefix="/api/v1", tags=["Partner API"])
 
@@ -39,7 +49,7 @@ router = APIRouter(prefix="/api/v1", tags=["Partner API"])
 @router.post("/partners", response_model=dict, status_code=status.HTTP_201_CREATED)
 async def create_partner(
     partner_data: PartnerCreate,
-    admin: User = Depends(get_current_admin)
+    admin: UserProjection = Depends(get_current_admin)
 ):
     """
     Create a new business partner (Admin only)
@@ -57,23 +67,7 @@ async def create_partner(
     partner, api_key, api_secret = await PartnerService.create_partner(partner_data)
     
     return {
-        "partner": PartnerResponse(
-            id=str(partner.id),
-            partner_code=partner.partner_code,
-            name=partner.name,
-            email=partner.email,
-            phone=partner.phone,
-            website=partner.website,
-            company_name=partner.company_name,
-            business_type=partner.business_type,
-            status=partner.status,
-            rate_limit_per_minute=partner.rate_limit_per_minute,
-            rate_limit_per_day=partner.rate_limit_per_day,
-            total_requests=partner.total_requests,
-            last_request_at=partner.last_request_at,
-            created_at=partner.created_at,
-            updated_at=partner.updated_at,
-        ),
+        "partner": PartnerService.to_response(partner),
         "credentials": {
             "api_key": api_key,
             "api_secret": api_secret,
@@ -86,67 +80,58 @@ async def create_partner(
 # PARTNER SELF-SERVICE ENDPOINTS
 # ============================================================================
 
+def _webhook_config_response(partner: Partner) -> WebhookConfigResponse:
+    return WebhookConfigResponse(
+        webhook_url=partner.webhook_url,
+        webhook_events=partner.webhook_events,
+        webhook_secret_preview=partner.webhook_secret_preview,
+        is_configured=bool(partner.webhook_url and partner.webhook_events),
+    )
+
+
 @router.get("/partners/me", response_model=PartnerResponse)
-async def get_current_partner(partner: Partner = Depends(verify_partner_api_key)):
+async def get_current_partner(
+    partner: Partner = Depends(verify_partner_api_key),
+    response_cache: PartnerResponseCache = Depends(get_partner_response_cache),
+):
     """Get current partner information"""
-    return PartnerResponse(
-        id=str(partner.id),
-        partner_code=partner.partner_code,
-        name=partner.name,
-        email=partner.email,
-        phone=partner.phone,
-        website=partner.website,
-        company_name=partner.company_name,
-        business_type=partner.business_type,
-        status=partner.status,
-        rate_limit_per_minute=partner.rate_limit_per_minute,
-        rate_limit_per_day=partner.rate_limit_per_day,
-        total_requests=partner.total_requests,
-        last_request_at=partner.last_request_at,
-        created_at=partner.created_at,
-        updated_at=partner.updated_at,
-    )
+    partner_id = str(partner.id)
+    body = await response_cache.get(partner_id, "me")
+    if body is None:
+        body = PartnerService.to_response(partner).model_dump_json()
+        await response_cache.set(partner_id, "me", body)
+    return Response(content=body, media_type="application/json")
 
 
 @router.put("/partners/me", response_model=PartnerResponse)
 async def update_current_partner(
     update_data: PartnerUpdate,
-    partner: Partner = Depends(verify_partner_api_key)
+    partner: Partner = Depends(verify_partner_api_key),
+    response_cache: PartnerResponseCache = Depends(get_partner_response_cache),
+    token_cache: PartnerTokenCache = Depends(get_partner_token_cache),
 ):
     """Update current partner information"""
     
-    # Update fields
+    # Only the fields that were sent are written ($set), not the whole document
+    changes = {}
     if update_data.name is not None:
-        partner.name = update_data.name
+        changes["name"] = update_data.name
     if update_data.phone is not None:
-        partner.phone = update_data.phone
+        changes["phone"] = update_data.phone
     if update_data.website is not None:
-        partner.website = str(update_data.website)
+        changes["website"] = str(update_data.website)
     if update_data.rate_limit_per_minute is not None:
-        partner.rate_limit_per_minute = update_data.rate_limit_per_minute
+        changes["rate_limit_per_minute"] = update_data.rate_limit_per_minute
     if update_data.rate_limit_per_day is not None:
-        partner.rate_limit_per_day = update_data.rate_limit_per_day
+        changes["rate_limit_per_day"] = update_data.rate_limit_per_day
     
-    partner.updated_at = datetime.utcnow()
-    await partner.save()
+    changes["updated_at"] = datetime.utcnow()
+    await partner.set(changes)
+    await response_cache.invalidate(str(partner.id))
+    # /partners/auth/refresh answers from the cached profile, which embeds the name
+    await token_cache.set_profile(PartnerAuthService.token_profile(partner))
     
-    return PartnerResponse(
-        id=str(partner.id),
-        partner_code=partner.partner_code,
-        name=partner.name,
-        email=partner.email,
-        phone=partner.phone,
-        website=partner.website,
-        company_name=partner.company_name,
-        business_type=partner.business_type,
-        status=partner.status,
-        rate_limit_per_minute=partner.rate_limit_per_minute,
-        rate_limit_per_day=partner.rate_limit_per_day,
-        total_requests=partner.total_requests,
-        last_request_at=partner.last_request_at,
-        created_at=partner.created_at,
-        updated_at=partner.updated_at,
-    )
+    return PartnerService.to_response(partner)
 
 
 # ============================================================================
@@ -213,23 +198,33 @@ async def get_usage_statistics(
     end_date = datetime.utcnow()
     start_date = end_date - timedelta(days=days)
     
-    # Get bookings for revenue calculation
-    bookings = await Booking.find(
-        Booking.created_at >= start_date,
-        Booking.created_at <= end_date
-    ).to_list()
+    # Bucket bookings per day and sum paid revenue in the database instead
+    # of loading every booking in the window
+    per_day = {
+        day["_id"]: day
+        for day in await Booking.aggregate([
+            {"$match": {"created_at": {"$gte": start_date, "$lte": end_date}}},
+            {"$group": {
+                "_id": {"$dateToString": {"format": "%Y-%m-%d", "date": "$created_at"}},
+                "bookings": {"$sum": 1},
+                "revenue_kobo": {"$sum": {"$cond": [
+                    {"$eq": ["$status", BookingStatus.PAID.value]}, "$total_price_kobo", 0
+                ]}},
+            }},
+        ]).to_list()
+    }
     
-    total_bookings = len(bookings)
-    total_revenue = sum(b.total_price for b in bookings if b.status == BookingStatus.PAID)
+    total_bookings = sum(day["bookings"] for day in per_day.values())
+    total_revenue = sum(day["revenue_kobo"] for day in per_day.values())
     
-    # Get API keys count
-    api_keys = await PartnerService.list_api_keys(str(partner.id))
-    active_keys = sum(1 for k in api_keys if k.status == "active")
+    # Only the counts are reported, so don't load and serialize every key
+    active_keys, total_keys = await PartnerService.count_api_keys(str(partner.id))
     
-    # Generate daily stats (simplified - in production, use aggregation)
+    # One entry per calendar day in the window, zero-filled where nothing was booked
     daily_stats = []
-    for i in range(days):
+    for i in range((end_date.date() - start_date.date()).days + 1):
         date = (start_date + timedelta(days=i)).strftime("%Y-%m-%d")
+        day = per_day.get(date, {})
         daily_stats.append(UsageStatsDaily(
             date=date,
             total_requests=0,  # Would come from analytics DB
@@ -238,6 +233,8 @@ async def get_usage_statistics(
             payment_requests=0,
             successful_requests=0,
             failed_requests=0,
+            bookings=day.get("bookings", 0),
+            revenue_kobo=day.get("revenue_kobo", 0),
         ))
     
     return PartnerUsageStats(
@@ -247,13 +244,13 @@ async def get_usage_statistics(
         period_end=end_date,
         total_requests=partner.total_requests,
         total_bookings=total_bookings,
-        total_revenue=total_revenue,
+        total_revenue_kobo=total_revenue,
         daily_stats=daily_stats,
         current_rate_limit_per_minute=partner.rate_limit_per_minute,
         current_rate_limit_per_day=partner.rate_limit_per_day,
         requests_today=0,  # Would come from analytics DB
         active_api_keys=active_keys,
-        total_api_keys=len(api_keys),
+        total_api_keys=total_keys,
     )
 
 
@@ -264,51 +261,55 @@ async def get_usage_statistics(
 @router.put("/partners/webhooks", response_model=WebhookConfigResponse)
 async def configure_webhooks(
     config: WebhookConfigUpdate,
-    partner: Partner = Depends(verify_partner_api_key)
+    partner: Partner = Depends(verify_partner_api_key),
+    response_cache: PartnerResponseCache = Depends(get_partner_response_cache),
 ):
     """Configure webhook settings for the partner"""
     
+    changes = {}
     if config.webhook_url is not None:
-        partner.webhook_url = str(config.webhook_url)
+        changes["webhook_url"] = str(config.webhook_url)
     
     if config.webhook_events is not None:
-        partner.webhook_events = config.webhook_events
+        changes["webhook_events"] = config.webhook_events
     
     if config.webhook_secret is not None:
-        partner.webhook_secret = config.webhook_secret
+        changes["webhook_secret"] = config.webhook_secret
+        changes["webhook_secret_preview"] = config.webhook_secret[:8] + "..."
     
-    partner.updated_at = datetime.utcnow()
-    await partner.save()
+    changes["updated_at"] = datetime.utcnow()
+    await partner.set(changes)
+    await response_cache.invalidate(str(partner.id))
     
-    return WebhookConfigResponse(
-        webhook_url=partner.webhook_url,
-        webhook_events=partner.webhook_events,
-        webhook_secret_preview=partner.webhook_secret[:8] + "..." if partner.webhook_secret else None,
-        is_configured=bool(partner.webhook_url and partner.webhook_events),
-    )
+    return _webhook_config_response(partner)
 
 
 @router.get("/partners/webhooks", response_model=WebhookConfigResponse)
-async def get_webhook_config(partner: Partner = Depends(verify_partner_api_key)):
+async def get_webhook_config(
+    partner: Partner = Depends(verify_partner_api_key),
+    response_cache: PartnerResponseCache = Depends(get_partner_response_cache),
+):
     """Get current webhook configuration"""
-    return WebhookConfigResponse(
-        webhook_url=partner.webhook_url,
-        webhook_events=partner.webhook_events,
-        webhook_secret_preview=partner.webhook_secret[:8] + "..." if partner.webhook_secret else None,
-        is_configured=bool(partner.webhook_url and partner.webhook_events),
-    )
+    partner_id = str(partner.id)
+    body = await response_cache.get(partner_id, "webhooks")
+    if body is None:
+        body = _webhook_config_response(partner).model_dump_json()
+        await response_cache.set(partner_id, "webhooks", body)
+    return Response(content=body, media_type="application/json")
 
 
 @router.post("/partners/webhooks/test", response_model=WebhookTestResponse)
 async def test_webhook(
     test_request: WebhookTestRequest,
-    partner: Partner = Depends(verify_partner_api_key)
+    partner: Partner = Depends(verify_partner_api_key),
+    http_client: httpx.AsyncClient = Depends(get_webhook_http_client),
 ):
     """Test webhook configuration by sending a test event"""
     
     success, status_code, response_time, error = await WebhookService.test_webhook(
         partner=partner,
-        event_type=test_request.event_type
+        event_type=test_request.event_type,
+        http_client=http_client,
     )
     
     return WebhookTestResponse(
@@ -326,50 +327,35 @@ async def test_webhook(
 @router.post("/search", response_model=List[SearchResult])
 async def partner_search_transport(
     search_req: SearchRequest,
-    partner: Partner = Depends(verify_partner_api_key)
+    partner: Partner = Depends(verify_partner_api_key),
+    travu_client: TravuAPIClient = Depends(get_travu_client),
+    nrc_client: NRCAPIClient = Depends(get_nrc_client),
+    search_cache: SearchCache = Depends(get_search_cache),
 ):
     """Partner API: Unified search across all transport types"""
     
-    results = []
-    
-    # Search flights
-    if TransportType.FLIGHT in search_req.transport_types:
-        travu_client = TravuAPIClient()
-        flight_results = await travu_client.search_flights(search_req)
-        results.extend(flight_results)
-    
-    # Search buses
-    if TransportType.BUS in search_req.transport_types:
-        travu_client = TravuAPIClient()
-        bus_results = await travu_client.search_buses(search_req)
-        results.extend(bus_results)
-    
-    # Search trains
-    if TransportType.TRAIN in search_req.transport_types:
-        nrc_client = NRCAPIClient()
-        train_results = await nrc_client.search_trains(search_req)
-        results.extend(train_results)
-    
-    results.sort(key=lambda x: x.price)
-    
-    # Track usage
-    await PartnerService.track_api_usage(str(partner.id), "search", True)
-    
-    return results
+    # Usage is counted by verify_partner_api_key (buffered, flushed in the
+    # background), so nothing else needs writing before responding
+    return MsgspecResponse(
+        await SearchService.search(search_req, travu_client, nrc_client, search_cache)
+    )
 
 
 @router.post("/bookings", response_model=BookingResponse, status_code=status.HTTP_201_CREATED)
 async def partner_create_booking(
     booking_data: BookingCreate,
-    partner: Partner = Depends(verify_partner_api_key)
+    background_tasks: BackgroundTasks,
+    partner: Partner = Depends(verify_partner_api_key),
+    http_client: httpx.AsyncClient = Depends(get_webhook_http_client),
+    dashboard_cache: DashboardCache = Depends(get_dashboard_cache),
 ):
     """Partner API: Create a new booking"""
     
     # Create booking (simplified - in production, integrate with actual booking service)
-    from app.utils.helpers import generate_booking_reference
+    from app.utils.helpers import generate_reference
     
     booking = Booking(
-        booking_reference=generate_booking_reference(),
+        booking_reference=generate_reference("BKG"),
         user_id=str(partner.id),  # Using partner ID as user
         transport_type=booking_data.transport_type,
         status=BookingStatus.PENDING,
@@ -377,37 +363,27 @@ async def partner_create_booking(
         destination=booking_data.destination if hasattr(booking_data, 'destination') else "Unknown",
         departure_date=datetime.utcnow(),
         total_passengers=len(booking_data.passengers),
-        total_price=0.0,  # Would be calculated from provider
+        base_price_kobo=0,  # Would be calculated from provider
+        tax_kobo=0,
+        service_fee_kobo=0,
+        total_price_kobo=0,
         currency="NGN",
         provider_reference=booking_data.provider_reference,
     )
     
     await booking.insert()
+    if booking.operator_id:
+        await dashboard_cache.invalidate(booking.operator_id)
     
-    # Send webhook notification
-    await WebhookService.notify_booking_created(partner, {
+    # Deliver the webhook after responding; it is an outbound HTTP call with
+    # retries and the partner doesn't need it to complete first
+    background_tasks.add_task(WebhookService.notify_booking_created, partner, {
         "booking_reference": booking.booking_reference,
         "status": booking.status,
         "transport_type": booking.transport_type,
-    })
+    }, http_client)
     
-    # Track usage
-    await PartnerService.track_api_usage(str(partner.id), "booking", True)
-    
-    return BookingResponse(
-        id=str(booking.id),
-        booking_reference=booking.booking_reference,
-        user_id=booking.user_id,
-        transport_type=booking.transport_type,
-        status=booking.status,
-        origin=booking.origin,
-        destination=booking.destination,
-        departure_date=booking.departure_date,
-        total_passengers=booking.total_passengers,
-        total_price=booking.total_price,
-        currency=booking.currency,
-        created_at=booking.created_at,
-    )
+    return BookingService.to_response(booking)
 
 
 @router.get("/bookings/{booking_reference}", response_model=BookingResponse)
@@ -417,24 +393,12 @@ async def partner_get_booking(
 ):
     """Partner API: Get booking by reference"""
     
-    booking = await Booking.find_one(Booking.booking_reference == booking_reference)
+    # Plain filter dict: no Beanie expression objects built per lookup
+    booking = await Booking.find_one({"booking_reference": booking_reference})
     if not booking:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Booking not found"
         )
     
-    return BookingResponse(
-        id=str(booking.id),
-        booking_reference=booking.booking_reference,
-        user_id=booking.user_id,
-        transport_type=booking.transport_type,
-        status=booking.status,
-        origin=booking.origin,
-        destination=booking.destination,
-        departure_date=booking.departure_date,
-        total_passengers=booking.total_passengers,
-        total_price=booking.total_price,
-        currency=booking.currency,
-        created_at=booking.created_at,
-    )
\ No newline at end of file
+    return BookingService.to_response(booking)
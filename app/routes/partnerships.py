@@ -1,7 +1,8 @@
-from fastapi import APIRouter, status, Response
+from fastapi import APIRouter, BackgroundTasks, Depends, status, Response
+from pymongo.errors import DuplicateKeyError
 from app.schemas.partner import PartnershipRequest, PartnershipResponses
 from app.models.partners import PartnershipInterest
-from app.services.notification_service import NotificationService
+from app.services.notification_service import NotificationService, get_notification_service
 import logging
 
 logger = logging.getLogger(__name__)
@@ -9,25 +10,38 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/partnerships", tags=["Partnerships"])
 
 
-@router.post("/", response_model=PartnershipResponses, status_code=status.HTTP_201_CREATED)
-async def indicate_partnership_request(req: PartnershipRequest, response: Response):
-    existing = await PartnershipInterest.find_one(PartnershipInterest.email == req.email)
-    if existing:
-        response.status_code = status.HTTP_200_OK
-        return existing
-    sub = PartnershipInterest(company_name=req.company_name, email=req.email, phone=req.phone, category=req.category)
-    await sub.insert()  # type: ignore
-
-    # Notify the submitter via email (best-effort)
+async def _send_acknowledgement(notifier: NotificationService, **details) -> None:
+    """Notify the submitter via email (best-effort)"""
     try:
-        notifier = NotificationService()
-        await notifier.send_partnership_acknowledgement(
-            email=req.email,
-            company_name=req.company_name,
-            category=req.category,
-            phone=req.phone,
-        )
+        await notifier.send_partnership_acknowledgement(**details)
     except Exception as e:
         logger.error(f"Failed to send partnership acknowledgement email: {e}")
 
+
+@router.post("/", response_model=PartnershipResponses, status_code=status.HTTP_201_CREATED)
+async def indicate_partnership_request(
+    req: PartnershipRequest,
+    response: Response,
+    background_tasks: BackgroundTasks,
+    notifier: NotificationService = Depends(get_notification_service),
+):
+    # Insert first and let the unique email index catch repeats: one round-trip
+    # for new submissions and no window for concurrent duplicates
+    sub = PartnershipInterest(company_name=req.company_name, email=req.email, phone=req.phone, category=req.category)
+    try:
+        await sub.insert()  # type: ignore
+    except DuplicateKeyError:
+        response.status_code = status.HTTP_200_OK
+        return await PartnershipInterest.find_one(PartnershipInterest.email == req.email)
+
+    # Email after responding; the submission doesn't wait on SMTP
+    background_tasks.add_task(
+        _send_acknowledgement,
+        notifier,
+        email=req.email,
+        company_name=req.company_name,
+        category=req.category,
+        phone=req.phone,
+    )
+
     return sub
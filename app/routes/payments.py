@@ -1,14 +1,17 @@
 """
 Payment routes
 """
+from datetime import datetime
+import orjson
 from fastapi import APIRouter, HTTPException, status, Depends, Request
 from app.schemas.payment import PaymentInitiate, PaymentResponse, PaymentWebhook, RefundRequest
 from app.models.payment import Payment, PaymentStatus, PaymentMethod, PaymentProvider
 from app.models.booking import Booking, BookingStatus
-from app.models.user import User
+from app.models.user import User, UserProjection
 from app.middleware.auth import get_current_user
-from app.services.payment_service import PaystackService
-from app.services.notification_service import NotificationService
+from app.services.payment_service import PaystackService, get_paystack_service
+from app.services.notification_service import NotificationService, get_notification_service
+from app.services.dashboard_cache import DashboardCache, get_dashboard_cache
 from app.utils.helpers import generate_reference
 
 
@@ -18,7 +21,8 @@ router = APIRouter(prefix="/payments", tags=["Payments"])
 @router.post("/initialize", response_model=PaymentResponse, status_code=status.HTTP_201_CREATED)
 async def initialize_payment(
     payment_data: PaymentInitiate,
-    current_user: User = Depends(get_current_user)
+    current_user: UserProjection = Depends(get_current_user),
+    paystack_service: PaystackService = Depends(get_paystack_service),
 ):
     """Initialize a payment for a booking"""
     
@@ -47,44 +51,41 @@ async def initialize_payment(
     # Generate payment reference
     payment_reference = generate_reference("PAY")
     
+    # Initialize payment with Paystack first so the payment record is
+    # written once, already carrying the outcome
+    result = await paystack_service.initialize_transaction(
+        email=current_user.email,
+        amount_kobo=booking.total_price_kobo,
+        reference=payment_reference,
+        callback_url=payment_data.callback_url,
+    )
+    succeeded = result.get("status") == "success"
+    
     # Create payment record
     payment = Payment(
         payment_reference=payment_reference,
         booking_id=str(booking.id),
         user_id=str(current_user.id),
-        amount=booking.total_price,
+        amount_kobo=booking.total_price_kobo,
         currency=booking.currency,
         payment_method=payment_data.payment_method,
         payment_provider=PaymentProvider.PAYSTACK,
+        provider_reference=result.get("reference") if succeeded else None,
+        status=PaymentStatus.PENDING if succeeded else PaymentStatus.FAILED,
     )
     
-    await payment.save()
-    
-    # Initialize payment with Paystack
-    paystack_service = PaystackService()
-    result = await paystack_service.initialize_transaction(
-        email=current_user.email,
-        amount=booking.total_price,
-        reference=payment_reference,
-        callback_url=payment_data.callback_url,
-    )
+    await payment.insert()
     
-    if result.get("status") == "success":
-        payment.provider_reference = result.get("reference")
-        await payment.save()
-        
+    if succeeded:
         return PaymentResponse(
             payment_reference=payment.payment_reference,
             booking_id=payment.booking_id,
-            amount=payment.amount,
+            amount_kobo=payment.amount_kobo,
             currency=payment.currency,
             status=payment.status,
             authorization_url=result.get("authorization_url"),
         )
     else:
-        payment.status = PaymentStatus.FAILED
-        await payment.save()
-        
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=result.get("message", "Payment initialization failed")
@@ -92,7 +93,12 @@ async def initialize_payment(
 
 
 @router.post("/webhook")
-async def payment_webhook(request: Request):
+async def payment_webhook(
+    request: Request,
+    notification_service: NotificationService = Depends(get_notification_service),
+    dashboard_cache: DashboardCache = Depends(get_dashboard_cache),
+    paystack_service: PaystackService = Depends(get_paystack_service),
+):
     """Handle Paystack webhooks"""
     
     # Get signature from header
@@ -107,46 +113,45 @@ async def payment_webhook(request: Request):
     body = await request.body()
     
     # Verify signature
-    paystack_service = PaystackService()
     if not paystack_service.verify_webhook_signature(body, signature):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid signature"
         )
     
-    # Parse webhook data
-    data = await request.json()
+    # Parse the already-verified bytes rather than having Starlette decode them again
+    data = orjson.loads(body)
     event = data.get("event")
     payment_data = data.get("data", {})
     
     if event == "charge.success":
         # Get payment by reference
         reference = payment_data.get("reference")
-        payment = await Payment.find_one(Payment.payment_reference == reference)
+        payment = await Payment.find_one({"payment_reference": reference})
         
         if payment:
             # Update payment status
-            payment.status = PaymentStatus.SUCCESS
-            payment.provider_reference = payment_data.get("id")
-            from datetime import datetime
-            payment.paid_at = datetime.utcnow()
-            await payment.save()
+            await payment.set({
+                "status": PaymentStatus.SUCCESS,
+                "provider_reference": payment_data.get("id"),
+                "paid_at": datetime.utcnow(),
+            })
             
             # Update booking status
             booking = await Booking.get(payment.booking_id)
             if booking:
-                booking.status = BookingStatus.PAID
-                await booking.save()
+                await booking.set({"status": BookingStatus.PAID})
+                if booking.operator_id:
+                    await dashboard_cache.invalidate(booking.operator_id)
                 
                 # Get user
                 user = await User.get(payment.user_id)
                 
                 # Send notification
-                notification_service = NotificationService()
                 await notification_service.send_payment_notification(
                     email=user.email,
                     payment_reference=reference,
-                    amount=payment.amount,
+                    amount_kobo=payment.amount_kobo,
                     status="success",
                     booking_reference=booking.booking_reference,
                     customer_name=f"{user.first_name} {user.last_name}",
@@ -158,7 +163,7 @@ async def payment_webhook(request: Request):
 @router.get("/{payment_id}", response_model=PaymentResponse)
 async def get_payment(
     payment_id: str,
-    current_user: User = Depends(get_current_user)
+    current_user: UserProjection = Depends(get_current_user)
 ):
     """Get payment details"""
     
@@ -179,7 +184,7 @@ async def get_payment(
     return PaymentResponse(
         payment_reference=payment.payment_reference,
         booking_id=payment.booking_id,
-        amount=payment.amount,
+        amount_kobo=payment.amount_kobo,
         currency=payment.currency,
         status=payment.status,
     )
@@ -188,7 +193,9 @@ async def get_payment(
 @router.post("/refund", status_code=status.HTTP_202_ACCEPTED)
 async def request_refund(
     refund_data: RefundRequest,
-    current_user: User = Depends(get_current_user)
+    current_user: UserProjection = Depends(get_current_user),
+    dashboard_cache: DashboardCache = Depends(get_dashboard_cache),
+    paystack_service: PaystackService = Depends(get_paystack_service),
 ):
     """Request a refund"""
     
@@ -208,7 +215,7 @@ async def request_refund(
         )
     
     # Get payment
-    payment = await Payment.find_one(Payment.booking_id == str(booking.id))
+    payment = await Payment.find_one({"booking_id": str(booking.id)})
     if not payment:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -223,10 +230,9 @@ async def request_refund(
         )
     
     # Initiate refund
-    paystack_service = PaystackService()
     result = await paystack_service.initiate_refund(
         reference=payment.provider_reference or payment.payment_reference,
-        amount=refund_data.amount,
+        amount_kobo=refund_data.amount_kobo,
     )
     
     if result.get("status") == "success":
@@ -238,6 +244,8 @@ async def request_refund(
         booking.status = BookingStatus.REFUNDED
         booking.cancellation_reason = refund_data.reason
         await booking.save()
+        if booking.operator_id:
+            await dashboard_cache.invalidate(booking.operator_id)
         
         return {"message": "Refund initiated successfully"}
     else:
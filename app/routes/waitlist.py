@@ -1,10 +1,11 @@
 """
 Waitlist subscription routes
 """
-from fastapi import APIRouter, status, Response, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, status, Response, HTTPException
+from pymongo.errors import DuplicateKeyError
 from app.schemas.waitlist import WaitlistSubscribeRequest, WaitlistSubscribeResponse
 from app.models.waitlist import WaitlistSubscription
-from app.services.notification_service import NotificationService
+from app.services.notification_service import NotificationService, get_notification_service
 import logging
 
 logger = logging.getLogger(__name__)
@@ -13,28 +14,36 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/waitlist", tags=["Waitlist"])
 
 
+async def _send_acknowledgement(notifier: NotificationService, **details) -> None:
+    """Send acknowledgement email (best-effort)"""
+    try:
+        await notifier.send_waitlist_acknowledgement(**details)
+    except Exception as e:
+        logger.error(f"Failed to send waitlist acknowledgement email: {e}")
+
+
 @router.post("/subscribe", response_model=WaitlistSubscribeResponse, status_code=status.HTTP_201_CREATED)
-async def subscribe_to_waitlist(req: WaitlistSubscribeRequest, response: Response):
+async def subscribe_to_waitlist(
+    req: WaitlistSubscribeRequest,
+    response: Response,
+    background_tasks: BackgroundTasks,
+    notifier: NotificationService = Depends(get_notification_service),
+):
     """Subscribe a user to the upcoming waitlist/newsletter by name and email.
-    Idempotent: if the email already exists, returns the existing subscription with 200.
+    Returns 409 if the email has already subscribed.
     """
-    existing = await WaitlistSubscription.find_one(WaitlistSubscription.email == req.email)
-    if existing:
-        # Per request: return 404 when the email has already subscribed
+    # The unique email index rejects repeats atomically, so no lookup first
+    sub = WaitlistSubscription(name=req.name, email=req.email)
+    try:
+        await sub.insert()  # type: ignore
+    except DuplicateKeyError:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Email already subscribed",
         )
 
-    sub = WaitlistSubscription(name=req.name, email=req.email)
-    await sub.save()  # type: ignore
-
-    # Send acknowledgement email (best-effort)
-    try:
-        notifier = NotificationService()
-        await notifier.send_waitlist_acknowledgement(email=sub.email, name=sub.name)
-    except Exception as e:
-        logger.error(f"Failed to send waitlist acknowledgement email: {e}")
+    # Email after responding; the subscription doesn't wait on SMTP
+    background_tasks.add_task(_send_acknowledgement, notifier, email=sub.email, name=sub.name)
 
     return WaitlistSubscribeResponse(
         id=str(sub.id),
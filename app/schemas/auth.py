@@ -38,7 +38,7 @@ class TokenData(BaseModel):
 class UserResponse(BaseModel):
     """User response schema"""
     id: str
-    email: EmailStr
+    email: str
     first_name: str
     last_name: str
     role: UserRole
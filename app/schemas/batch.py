@@ -0,0 +1,59 @@
+"""
+JSON batching schemas (same request/response shape as Microsoft Graph $batch)
+"""
+import posixpath
+from urllib.parse import unquote
+from pydantic import BaseModel, Field, field_validator
+from typing import Any, Dict, List, Literal, Optional
+
+MAX_BATCH_REQUESTS = 20
+BATCH_PATH = "/batch"
+# Set on every dispatched call so the batch endpoint can refuse to run inside a batch
+BATCH_MARKER_HEADER = "x-ovu-batched"
+
+
+class BatchRequestItem(BaseModel):
+    """One API call inside a batch"""
+    id: str = Field(..., min_length=1, max_length=64, description="Echoed back on the matching response")
+    method: Literal["GET", "POST", "PUT", "DELETE"]
+    url: str = Field(..., description="Path relative to /api/v1, e.g. /search")
+    headers: Dict[str, str] = Field(default={}, description="Overrides the batch request's credentials")
+    body: Optional[Any] = None
+
+    @field_validator("url")
+    @classmethod
+    def validate_url(cls, v):
+        """Only relative API paths, and never the batch endpoint itself"""
+        if not v.startswith("/") or v.startswith("//"):
+            raise ValueError("url must be a path relative to /api/v1, starting with '/'")
+        if "#" in v:
+            raise ValueError("url must not contain a fragment")
+        if posixpath.normpath(unquote(v.split("?", 1)[0])) == BATCH_PATH:
+            raise ValueError("Batches cannot be nested")
+        return v
+
+
+class BatchRequest(BaseModel):
+    """Batch of API calls dispatched together"""
+    requests: List[BatchRequestItem] = Field(..., min_length=1, max_length=MAX_BATCH_REQUESTS)
+
+    @field_validator("requests")
+    @classmethod
+    def validate_unique_ids(cls, v):
+        """Response ids must map back to exactly one request"""
+        if len({item.id for item in v}) != len(v):
+            raise ValueError("Request ids must be unique within a batch")
+        return v
+
+
+class BatchResponseItem(BaseModel):
+    """Result of one batched call"""
+    id: str
+    status: int
+    headers: Dict[str, str]
+    body: Optional[Any] = None
+
+
+class BatchResponse(BaseModel):
+    """Results in the same order as the submitted requests"""
+    responses: List[BatchResponseItem]
@@ -1,7 +1,8 @@
 """
 Booking schemas
 """
-from pydantic import BaseModel, Field
+import msgspec
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List
 from datetime import datetime
 
@@ -52,13 +53,15 @@ class SearchRequest(BaseModel):
 
 class SearchResult(BaseModel):
     """Search result item"""
+    model_config = ConfigDict(frozen=True)
+
     transport_type: TransportType
     provider: str
     origin: str
     destination: str
     departure_date: datetime
     arrival_date: Optional[datetime] = None
-    price: float
+    price_kobo: int
     currency: str = "NGN"
     available_seats: int
     duration_minutes: Optional[int] = None
@@ -74,6 +77,34 @@ class SearchResult(BaseModel):
     train_service: Optional[str] = None
 
 
+class SearchResultStruct(msgspec.Struct, frozen=True, gc=False):
+    """
+    msgspec mirror of SearchResult; providers build these directly since
+    every field comes from our own mapping code, and they are encoded (and
+    cached) without a pydantic round-trip
+    """
+    transport_type: TransportType
+    provider: str
+    origin: str
+    destination: str
+    departure_date: datetime
+    price_kobo: int
+    available_seats: int
+    provider_reference: str
+    arrival_date: Optional[datetime] = None
+    currency: str = "NGN"
+    duration_minutes: Optional[int] = None
+    operator_id: Optional[str] = None
+
+    # Type-specific details
+    flight_number: Optional[str] = None
+    airline: Optional[str] = None
+    bus_type: Optional[str] = None
+    bus_company: Optional[str] = None
+    train_number: Optional[str] = None
+    train_service: Optional[str] = None
+
+
 class BookingCreate(BaseModel):
     """Booking creation schema"""
     provider_reference: str
@@ -95,9 +126,28 @@ class BookingResponse(BaseModel):
     destination: str
     departure_date: datetime
     total_passengers: int
-    total_price: float
+    total_price_kobo: int
     currency: str
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    # Read-only response DTO
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
+class BookingResponseStruct(msgspec.Struct, gc=False):
+    """
+    msgspec mirror of BookingResponse for hot read paths; encoded without
+    validation since every field comes from an already-validated booking
+    """
+    id: str
+    booking_reference: str
+    user_id: str
+    transport_type: str
+    status: str
+    origin: str
+    destination: str
+    departure_date: datetime
+    total_passengers: int
+    total_price_kobo: int
+    currency: str
+    created_at: datetime
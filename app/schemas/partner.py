@@ -1,14 +1,19 @@
 """
 Partner API schemas for B2B integration
 """
-from pydantic import BaseModel, EmailStr, Field, HttpUrl
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, HttpUrl, StringConstraints
 from pydantic_mongo import PydanticObjectId
-from typing import Optional, List, Dict, Any
+from typing import Annotated, Optional, List, Dict, Any
 from datetime import datetime
 from app.models.partner import PartnerStatus, WebhookEvent
 from app.models.api_key import APIKeyStatus
 
 
+# E.164 phone number; one alias so every partner input field shares the same
+# compiled pattern instead of declaring its own
+E164Phone = Annotated[str, StringConstraints(pattern=r'^\+?[1-9]\d{1,14}$')]
+
+
 # Partnership Request (legacy - keeping for backward compatibility)
 class PartnershipRequest(BaseModel):
     company_name: str
@@ -20,7 +25,7 @@ class PartnershipRequest(BaseModel):
 class PartnershipResponses(BaseModel):
     id: PydanticObjectId
     name: Optional[str] = None
-    email: EmailStr
+    email: str
     created_at: datetime
 
     class Config:
@@ -33,7 +38,7 @@ class PartnerCreate(BaseModel):
     """Schema for creating a new business partner"""
     name: str = Field(..., min_length=2, max_length=100)
     email: EmailStr
-    phone: str
+    phone: E164Phone
     website: Optional[HttpUrl] = None
     
     # Business information
@@ -49,7 +54,7 @@ class PartnerCreate(BaseModel):
 class PartnerUpdate(BaseModel):
     """Schema for updating partner information"""
     name: Optional[str] = Field(None, min_length=2, max_length=100)
-    phone: Optional[str] = None
+    phone: Optional[E164Phone] = None
     website: Optional[HttpUrl] = None
     rate_limit_per_minute: Optional[int] = Field(None, ge=1, le=1000)
     rate_limit_per_day: Optional[int] = Field(None, ge=1, le=1000000)
@@ -60,7 +65,7 @@ class PartnerResponse(BaseModel):
     id: str
     partner_code: str
     name: str
-    email: EmailStr
+    email: str
     phone: str
     website: Optional[str] = None
     company_name: Optional[str] = None
@@ -73,6 +78,9 @@ class PartnerResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
+    # Read-only response DTO
+    model_config = ConfigDict(frozen=True)
+
 
 # API Key Management Schemas
 
@@ -100,13 +108,16 @@ class APIKeyResponse(BaseModel):
     expires_at: Optional[datetime] = None
     allowed_ips: List[str]
 
+    # Read-only response DTO
+    model_config = ConfigDict(frozen=True)
+
 
 class APIKeyCreateResponse(BaseModel):
     """Schema for API key creation response (includes full key once)"""
     key_id: str
     name: str
     api_key: str  # Full key - only shown once!
-    api_secret: str  # Full secret - only shown once!
+    api_secret: str  # Secret part of api_key (stored hashed) - only shown once!
     status: APIKeyStatus
     scopes: List[str]
     created_at: datetime
@@ -115,10 +126,10 @@ class APIKeyCreateResponse(BaseModel):
     class Config:
         json_schema_extra = {
             "example": {
-                "key_id": "key_abc123",
+                "key_id": "key_0123456789abcdef0123456789abcdef",
                 "name": "Production Key",
-                "api_key": "ovu_live_abc123def456ghi789",
-                "api_secret": "sk_live_xyz789uvw456rst123",
+                "api_key": "ovu_live_key_0123456789abcdef0123456789abcdef_xyz789uvw456rst123",
+                "api_secret": "xyz789uvw456rst123",
                 "status": "active",
                 "scopes": ["search", "booking", "payment"],
                 "created_at": "2024-12-20T12:00:00Z",
@@ -147,6 +158,11 @@ class UsageStatsDaily(BaseModel):
     payment_requests: int
     successful_requests: int
     failed_requests: int
+    bookings: int = 0
+    revenue_kobo: int = 0  # Paid bookings only
+
+    # Read-only response DTO
+    model_config = ConfigDict(frozen=True)
 
 
 class PartnerUsageStats(BaseModel):
@@ -159,7 +175,7 @@ class PartnerUsageStats(BaseModel):
     # Overall stats
     total_requests: int
     total_bookings: int
-    total_revenue: float
+    total_revenue_kobo: int
     
     # Daily breakdown
     daily_stats: List[UsageStatsDaily]
@@ -173,6 +189,9 @@ class PartnerUsageStats(BaseModel):
     active_api_keys: int
     total_api_keys: int
 
+    # Read-only response DTO
+    model_config = ConfigDict(frozen=True)
+
 
 # Webhook Configuration Schemas
 
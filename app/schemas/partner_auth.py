@@ -1,10 +1,35 @@
 """
 Partner authentication schemas
 """
-from pydantic import BaseModel, EmailStr, Field, validator
+from pydantic import BaseModel, EmailStr, Field, field_validator, validator
 from typing import Optional
 from datetime import datetime
 import re
+from app.schemas.partner import E164Phone
+
+# Strong passwords pass in one anchored scan; the per-rule patterns below only
+# run on rejection, to say which rule failed
+_PASSWORD_RE = re.compile(
+    r'^(?=.*[A-Z])(?=.*[a-z])(?=.*\d)(?=.*[!@#$%^&*(),.?":{}|<>]).{8,}$', re.DOTALL
+)
+_PASSWORD_RULES = (
+    (re.compile(r'[A-Z]'), 'Password must contain at least one uppercase letter'),
+    (re.compile(r'[a-z]'), 'Password must contain at least one lowercase letter'),
+    (re.compile(r'\d'), 'Password must contain at least one number'),
+    (re.compile(r'[!@#$%^&*(),.?":{}|<>]'), 'Password must contain at least one special character'),
+)
+
+
+def _validate_password(cls, v: str) -> str:
+    """Validate password strength"""
+    if _PASSWORD_RE.match(v):
+        return v
+    if len(v) < 8:
+        raise ValueError('Password must be at least 8 characters long')
+    for pattern, message in _PASSWORD_RULES:
+        if not pattern.search(v):
+            raise ValueError(message)
+    return v
 
 
 class PartnerRegister(BaseModel):
@@ -12,7 +37,7 @@ class PartnerRegister(BaseModel):
     name: str = Field(..., min_length=2, max_length=100)
     email: EmailStr
     password: str = Field(..., min_length=8)
-    phone: str = Field(..., pattern=r'^\+?[1-9]\d{1,14}$')
+    phone: E164Phone
     website: Optional[str] = None
     company_name: str = Field(..., min_length=2, max_length=200)
     business_type: str = Field(..., description="e.g., travel_agency, corporate, reseller")
@@ -20,20 +45,7 @@ class PartnerRegister(BaseModel):
     business_description: Optional[str] = Field(None, max_length=1000)
     expected_monthly_volume: Optional[int] = Field(None, ge=0)
     
-    @validator('password')
-    def validate_password(cls, v):
-        """Validate password strength"""
-        if len(v) < 8:
-            raise ValueError('Password must be at least 8 characters long')
-        if not re.search(r'[A-Z]', v):
-            raise ValueError('Password must contain at least one uppercase letter')
-        if not re.search(r'[a-z]', v):
-            raise ValueError('Password must contain at least one lowercase letter')
-        if not re.search(r'\d', v):
-            raise ValueError('Password must contain at least one number')
-        if not re.search(r'[!@#$%^&*(),.?":{}|<>]', v):
-            raise ValueError('Password must contain at least one special character')
-        return v
+    validate_password = field_validator('password')(_validate_password)
     
     @validator('business_type')
     def validate_business_type(cls, v):
@@ -74,20 +86,7 @@ class ResetPasswordRequest(BaseModel):
     token: str
     new_password: str
     
-    @validator('new_password')
-    def validate_password(cls, v):
-        """Validate password strength"""
-        if len(v) < 8:
-            raise ValueError('Password must be at least 8 characters long')
-        if not re.search(r'[A-Z]', v):
-            raise ValueError('Password must contain at least one uppercase letter')
-        if not re.search(r'[a-z]', v):
-            raise ValueError('Password must contain at least one lowercase letter')
-        if not re.search(r'\d', v):
-            raise ValueError('Password must contain at least one number')
-        if not re.search(r'[!@#$%^&*(),.?":{}|<>]', v):
-            raise ValueError('Password must contain at least one special character')
-        return v
+    validate_password = field_validator('new_password')(_validate_password)
 
 
 class ChangePasswordRequest(BaseModel):
@@ -95,20 +94,7 @@ class ChangePasswordRequest(BaseModel):
     current_password: str
     new_password: str
     
-    @validator('new_password')
-    def validate_password(cls, v):
-        """Validate password strength"""
-        if len(v) < 8:
-            raise ValueError('Password must be at least 8 characters long')
-        if not re.search(r'[A-Z]', v):
-            raise ValueError('Password must contain at least one uppercase letter')
-        if not re.search(r'[a-z]', v):
-            raise ValueError('Password must contain at least one lowercase letter')
-        if not re.search(r'\d', v):
-            raise ValueError('Password must contain at least one number')
-        if not re.search(r'[!@#$%^&*(),.?":{}|<>]', v):
-            raise ValueError('Password must contain at least one special character')
-        return v
+    validate_password = field_validator('new_password')(_validate_password)
 
 
 class PartnerApprovalRequest(BaseModel):
@@ -17,7 +17,7 @@ class PaymentResponse(BaseModel):
     """Payment response schema"""
     payment_reference: str
     booking_id: str
-    amount: float
+    amount_kobo: int
     currency: str
     status: str
     payment_url: Optional[str] = None
@@ -37,4 +37,4 @@ class RefundRequest(BaseModel):
     """Refund request schema"""
     booking_id: str
     reason: str
-    amount: Optional[float] = None  # None means full refund
+    amount_kobo: Optional[int] = None  # None means full refund
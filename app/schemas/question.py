@@ -14,7 +14,7 @@ class QuestionRequest(BaseModel):
 
 class QuestionResponse(BaseModel):
     id: str
-    email: EmailStr
+    email: str
     question: str
     name: Optional[str] = None
     created_at: datetime
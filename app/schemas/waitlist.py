@@ -14,7 +14,7 @@ class WaitlistSubscribeRequest(BaseModel):
 class WaitlistSubscribeResponse(BaseModel):
     id: str
     name: Optional[str] = None
-    email: EmailStr
+    email: str
     created_at: datetime
 
     class Config:
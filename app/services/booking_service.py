@@ -0,0 +1,69 @@
+"""
+Booking persistence and response helpers
+"""
+from collections import defaultdict
+from typing import Dict, List, Sequence, Type, Union
+from app.models.booking import Booking, BookingListProjection, TransportType
+from app.schemas.booking import (
+    BookingResponse,
+    BookingResponseStruct,
+    TransportType as SchemaTransportType,
+)
+
+# Model -> schema transport type, resolved once instead of per row
+_SCHEMA_TRANSPORT_TYPES = {t: SchemaTransportType(t.value) for t in TransportType}
+
+
+class BookingService:
+    """Service for writing bookings and shaping them for responses"""
+
+    @staticmethod
+    def to_response(booking: Union[Booking, BookingListProjection]) -> BookingResponse:
+        """Map any booking document (or list projection row) to BookingResponse"""
+        # Documents were validated on load/insert, so skip re-validating every row
+        return BookingResponse.model_construct(
+            id=str(booking.id),
+            booking_reference=booking.booking_reference,
+            user_id=booking.user_id,
+            transport_type=_SCHEMA_TRANSPORT_TYPES[booking.transport_type],
+            status=booking.status,
+            origin=booking.origin,
+            destination=booking.destination,
+            departure_date=booking.departure_date,
+            total_passengers=booking.total_passengers,
+            total_price_kobo=booking.total_price_kobo,
+            currency=booking.currency,
+            created_at=booking.created_at,
+        )
+
+    @staticmethod
+    def to_struct(booking: Union[Booking, BookingListProjection]) -> BookingResponseStruct:
+        """Map a booking to the msgspec response DTO (same JSON as to_response)"""
+        return BookingResponseStruct(
+            id=str(booking.id),
+            booking_reference=booking.booking_reference,
+            user_id=booking.user_id,
+            transport_type=booking.transport_type.value,
+            status=booking.status.value,
+            origin=booking.origin,
+            destination=booking.destination,
+            departure_date=booking.departure_date,
+            total_passengers=booking.total_passengers,
+            total_price_kobo=booking.total_price_kobo,
+            currency=booking.currency,
+            created_at=booking.created_at,
+        )
+
+    @staticmethod
+    async def bulk_create(bookings: Sequence[Booking]) -> None:
+        """
+        Insert many new bookings with one insert_many per collection
+        Flight/bus/train bookings live in separate collections, so documents
+        are grouped by their concrete class before inserting
+        """
+        by_model: Dict[Type[Booking], List[Booking]] = defaultdict(list)
+        for booking in bookings:
+            by_model[type(booking)].append(booking)
+
+        for model, docs in by_model.items():
+            await model.insert_many(docs)
@@ -0,0 +1,72 @@
+"""
+Short-lived Redis cache for operator dashboard payloads
+"""
+import logging
+from typing import Any, Dict, Optional
+import orjson
+from fastapi import Request
+from redis.asyncio import Redis
+
+logger = logging.getLogger(__name__)
+
+
+class DashboardCache:
+    """
+    Caches each operator's /operators/dashboard payload. Entries expire after
+    ttl_seconds and are dropped early when a booking or payment for the
+    operator changes. Fails open: any Redis error is treated as a miss.
+    """
+
+    def __init__(self, redis: Optional[Redis], ttl_seconds: int = 60):
+        self.redis = redis
+        self.ttl_seconds = ttl_seconds
+
+    @property
+    def enabled(self) -> bool:
+        return self.redis is not None
+
+    @staticmethod
+    def make_key(operator_id: str) -> str:
+        return f"dashboard:{operator_id}"
+
+    async def get(self, operator_id: str) -> Optional[Dict[str, Any]]:
+        """Return the cached payload, or None on a miss"""
+        if not self.enabled:
+            return None
+
+        try:
+            cached = await self.redis.get(self.make_key(operator_id))
+        except Exception as e:
+            logger.error(f"Dashboard cache read error: {e}")
+            return None
+
+        if cached is None:
+            return None
+        return orjson.loads(cached)
+
+    async def set(self, operator_id: str, payload: Dict[str, Any]) -> None:
+        """Store a payload for ttl_seconds"""
+        if not self.enabled:
+            return
+
+        try:
+            await self.redis.setex(
+                self.make_key(operator_id), self.ttl_seconds, orjson.dumps(payload)
+            )
+        except Exception as e:
+            logger.error(f"Dashboard cache write error: {e}")
+
+    async def invalidate(self, operator_id: str) -> None:
+        """Drop an operator's cached payload after its bookings/payments change"""
+        if not self.enabled:
+            return
+
+        try:
+            await self.redis.delete(self.make_key(operator_id))
+        except Exception as e:
+            logger.error(f"Dashboard cache invalidate error: {e}")
+
+
+def get_dashboard_cache(request: Request) -> DashboardCache:
+    """FastAPI dependency returning the app-wide DashboardCache"""
+    return request.app.state.dashboard_cache
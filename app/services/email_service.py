@@ -1,48 +1,68 @@
 """
 Email service using Resend
 """
+import asyncio
 import resend
 import logging
 from typing import Optional, Dict, Any
 from datetime import datetime
 from pathlib import Path
-from jinja2 import Template
-from app.core.config import settings
+from jinja2 import Environment, FileSystemLoader, Template, TemplateNotFound
+from app.core.config import get_settings
 
 
 logger = logging.getLogger(__name__)
 
+TEMPLATES_DIR = Path(__file__).parent.parent / "templates" / "emails"
+
+# One environment per process: every EmailService instance shares its compiled
+# templates, and files are never re-checked on disk after the first load
+_TEMPLATE_ENV = Environment(
+    loader=FileSystemLoader(TEMPLATES_DIR),
+    auto_reload=False,
+    cache_size=-1,
+)
+
+# Email type -> subject line, formatted with the type's render context. Each
+# type renders the template of the same name
+EMAIL_SUBJECTS: Dict[str, str] = {
+    "welcome": "Welcome to Ovu Transport! 🎉",
+    "booking_confirmation": "Booking Confirmation - {booking_reference}",
+    "ticket": "Your E-Ticket - {ticket_number}",
+    "payment_success": "Payment Successful - {payment_reference}",
+    "payment_failed": "Payment Failed - {payment_reference}",
+    "booking_cancelled": "Booking Cancelled - {booking_reference}",
+    "waitlist_signup": "You're on the Ovu waitlist",
+    "partnership_signup": "Thanks for your partnership interest",
+}
+
+EMAIL_TEMPLATES = tuple(EMAIL_SUBJECTS)
+
+
+def preload_templates() -> None:
+    """
+    Compile every email template at startup so the first send of each kind
+    doesn't read and parse a file inside a request
+    """
+    for name in EMAIL_TEMPLATES:
+        _TEMPLATE_ENV.get_template(f"{name}.html")
+
 
 class EmailService:
     """Email service using Resend for transactional emails"""
     
     def __init__(self):
         """Initialize Resend email service"""
+        settings = get_settings()
         resend.api_key = settings.RESEND_API_KEY
         self.from_email = settings.RESEND_FROM_EMAIL
-        self.templates_dir = Path(__file__).parent.parent / "templates" / "emails"
-        self._template_cache: Dict[str, Template] = {}
     
     def _load_template(self, template_name: str) -> Template:
-        """Load and return email template with caching"""
-        # Check cache first
-        if template_name in self._template_cache:
-            return self._template_cache[template_name]
-        
-        template_path = self.templates_dir / f"{template_name}.html"
-        
-        if not template_path.exists():
+        """Load and return email template (parsed once per process)"""
+        try:
+            return _TEMPLATE_ENV.get_template(f"{template_name}.html")
+        except TemplateNotFound:
             raise FileNotFoundError(f"Email template not found: {template_name}")
-        
-        with open(template_path, 'r', encoding='utf-8') as f:
-            template_content = f.read()
-        
-        template = Template(template_content)
-        
-        # Cache the template
-        self._template_cache[template_name] = template
-        
-        return template
     
     def _render_template(self, template_name: str, context: Dict[str, Any]) -> str:
         """Render email template with context"""
@@ -54,6 +74,53 @@ class EmailService:
         
         return template.render(**context)
     
+    def render_message(
+        self,
+        email_type: str,
+        to_email: str,
+        context: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """
+        Render one email of a type from EMAIL_SUBJECTS; the result holds
+        send_email's keyword arguments
+        """
+        subject = EMAIL_SUBJECTS[email_type].format(**context)
+        context.setdefault('subject', subject)
+        return {
+            "to_email": to_email,
+            "subject": subject,
+            "html_content": self._render_template(email_type, context),
+        }
+    
+    async def send_templated(
+        self,
+        email_type: str,
+        to_email: str,
+        context: Dict[str, Any],
+    ) -> bool:
+        """Render and send one email of a type from EMAIL_SUBJECTS"""
+        return await self.send_email(**self.render_message(email_type, to_email, context))
+    
+    def _email_params(
+        self,
+        to_email: str,
+        subject: str,
+        html_content: str,
+        reply_to: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Build the Resend payload for one email"""
+        params = {
+            "from": self.from_email,
+            "to": [to_email],
+            "subject": subject,
+            "html": html_content,
+        }
+        
+        if reply_to:
+            params["reply_to"] = reply_to
+        
+        return params
+    
     async def send_email(
         self,
         to_email: str,
@@ -63,17 +130,10 @@ class EmailService:
     ) -> bool:
         """Send email using Resend"""
         try:
-            params = {
-                "from": self.from_email,
-                "to": [to_email],
-                "subject": subject,
-                "html": html_content,
-            }
+            params = self._email_params(to_email, subject, html_content, reply_to)
             
-            if reply_to:
-                params["reply_to"] = reply_to
-            
-            response = resend.Emails.send(params)
+            # The Resend SDK is blocking; keep the HTTP call off the event loop
+            response = await asyncio.to_thread(resend.Emails.send, params)
             
             # Check if email was sent successfully
             return response.get("id") is not None
@@ -94,13 +154,7 @@ class EmailService:
             'dashboard_url': dashboard_url,
         }
         
-        html_content = self._render_template('welcome', context)
-        
-        return await self.send_email(
-            to_email=to_email,
-            subject="Welcome to Ovu Transport! 🎉",
-            html_content=html_content,
-        )
+        return await self.send_templated('welcome', to_email, context)
     
     async def send_booking_confirmation(
         self,
@@ -128,13 +182,7 @@ class EmailService:
             'booking_url': f"{booking_url}/{booking_reference}",
         }
         
-        html_content = self._render_template('booking_confirmation', context)
-        
-        return await self.send_email(
-            to_email=to_email,
-            subject=f"Booking Confirmation - {booking_reference}",
-            html_content=html_content,
-        )
+        return await self.send_templated('booking_confirmation', to_email, context)
     
     async def send_ticket(
         self,
@@ -158,13 +206,7 @@ class EmailService:
             'ticket_url': ticket_url,
         }
         
-        html_content = self._render_template('ticket', context)
-        
-        return await self.send_email(
-            to_email=to_email,
-            subject=f"Your E-Ticket - {ticket_number}",
-            html_content=html_content,
-        )
+        return await self.send_templated('ticket', to_email, context)
     
     async def send_payment_success(
         self,
@@ -188,13 +230,7 @@ class EmailService:
             'booking_url': f"{booking_url}/{booking_reference}",
         }
         
-        html_content = self._render_template('payment_success', context)
-        
-        return await self.send_email(
-            to_email=to_email,
-            subject=f"Payment Successful - {payment_reference}",
-            html_content=html_content,
-        )
+        return await self.send_templated('payment_success', to_email, context)
     
     async def send_payment_failed(
         self,
@@ -216,13 +252,7 @@ class EmailService:
             'retry_payment_url': f"{retry_payment_url}/{booking_reference}",
         }
         
-        html_content = self._render_template('payment_failed', context)
-        
-        return await self.send_email(
-            to_email=to_email,
-            subject=f"Payment Failed - {payment_reference}",
-            html_content=html_content,
-        )
+        return await self.send_templated('payment_failed', to_email, context)
     
     async def send_booking_cancelled(
         self,
@@ -248,13 +278,7 @@ class EmailService:
             'search_url': search_url,
         }
         
-        html_content = self._render_template('booking_cancelled', context)
-        
-        return await self.send_email(
-            to_email=to_email,
-            subject=f"Booking Cancelled - {booking_reference}",
-            html_content=html_content,
-        )
+        return await self.send_templated('booking_cancelled', to_email, context)
 
     async def send_waitlist_subscription(
         self,
@@ -265,16 +289,9 @@ class EmailService:
         context = {
             'name': name,
             'email': to_email,
-            'subject': "You're on the Ovu waitlist",
         }
 
-        html_content = self._render_template('waitlist_signup', context)
-
-        return await self.send_email(
-            to_email=to_email,
-            subject=context['subject'],
-            html_content=html_content,
-        )
+        return await self.send_templated('waitlist_signup', to_email, context)
 
     async def send_partnership_acknowledgement(
         self,
@@ -289,13 +306,6 @@ class EmailService:
             'category': category,
             'email': to_email,
             'phone': phone,
-            'subject': "Thanks for your partnership interest",
         }
 
-        html_content = self._render_template('partnership_signup', context)
-
-        return await self.send_email(
-            to_email=to_email,
-            subject=context['subject'],
-            html_content=html_content,
-        )
+        return await self.send_templated('partnership_signup', to_email, context)
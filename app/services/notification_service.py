@@ -3,26 +3,49 @@ Notification service for email, SMS, and WhatsApp
 """
 import logging
 import httpx
-from typing import Optional, List
+from fastapi import Request
+from typing import Optional, List, TypedDict
 from twilio.rest import Client
-from app.core.config import settings
+from app.core.config import get_settings
 from app.services.email_service import EmailService
+from app.utils.helpers import from_kobo
 from datetime import datetime
 
 
 logger = logging.getLogger(__name__)
 
 
+class BookingConfirmationDetails(TypedDict, total=False):
+    """Template values for a booking confirmation (plain dict, not validated)"""
+    customer_name: str
+    transport_type: str
+    origin: str
+    destination: str
+    departure_date: str
+    total_passengers: int
+    total_price_kobo: int
+
+
+class TicketDetails(TypedDict, total=False):
+    """Template values for an e-ticket notification (plain dict, not validated)"""
+    customer_name: str
+    booking_reference: str
+    origin: str
+    destination: str
+    departure_date: str
+
+
 class NotificationService:
     """Unified notification service"""
     
     def __init__(self):
+        self.settings = get_settings()
         self.email_service = EmailService()
         self.twilio_client = None
-        if settings.TWILIO_ACCOUNT_SID and settings.TWILIO_AUTH_TOKEN:
+        if self.settings.TWILIO_ACCOUNT_SID and self.settings.TWILIO_AUTH_TOKEN:
             self.twilio_client = Client(
-                settings.TWILIO_ACCOUNT_SID,
-                settings.TWILIO_AUTH_TOKEN
+                self.settings.TWILIO_ACCOUNT_SID,
+                self.settings.TWILIO_AUTH_TOKEN
             )
     
     async def send_email(
@@ -57,7 +80,7 @@ class NotificationService:
         try:
             message = self.twilio_client.messages.create(
                 body=message,
-                from_=settings.TWILIO_PHONE_NUMBER,
+                from_=self.settings.TWILIO_PHONE_NUMBER,
                 to=to_phone
             )
             
@@ -79,7 +102,7 @@ class NotificationService:
             
             message = self.twilio_client.messages.create(
                 body=message,
-                from_=settings.TWILIO_WHATSAPP_NUMBER,
+                from_=self.settings.TWILIO_WHATSAPP_NUMBER,
                 to=whatsapp_to
             )
             
@@ -93,7 +116,7 @@ class NotificationService:
         email: str,
         phone: Optional[str],
         booking_reference: str,
-        booking_details: dict,
+        booking_details: BookingConfirmationDetails,
     ) -> None:
         """Send booking confirmation via multiple channels"""
         
@@ -107,7 +130,7 @@ class NotificationService:
             destination=booking_details.get('destination', ''),
             departure_date=booking_details.get('departure_date', ''),
             total_passengers=booking_details.get('total_passengers', 1),
-            total_price=booking_details.get('total_price', 0),
+            total_price=from_kobo(booking_details.get('total_price_kobo', 0)),
         )
         
         # Send SMS if phone number is provided
@@ -137,7 +160,7 @@ class NotificationService:
         phone: Optional[str],
         ticket_number: str,
         ticket_url: str,
-        booking_details: Optional[dict] = None,
+        booking_details: Optional[TicketDetails] = None,
     ) -> None:
         """Send e-ticket notification"""
         
@@ -163,7 +186,7 @@ class NotificationService:
         self,
         email: str,
         payment_reference: str,
-        amount: float,
+        amount_kobo: int,
         status: str,
         booking_reference: str = "",
         customer_name: str = "Customer",
@@ -176,7 +199,7 @@ class NotificationService:
                 customer_name=customer_name,
                 payment_reference=payment_reference,
                 booking_reference=booking_reference,
-                amount=amount,
+                amount=from_kobo(amount_kobo),
                 payment_date=datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S"),
             )
         else:
@@ -185,5 +208,10 @@ class NotificationService:
                 customer_name=customer_name,
                 payment_reference=payment_reference,
                 booking_reference=booking_reference,
-                amount=amount,
+                amount=from_kobo(amount_kobo),
             )
+
+
+def get_notification_service(request: Request) -> NotificationService:
+    """FastAPI dependency returning the app-wide NotificationService"""
+    return request.app.state.notification_service
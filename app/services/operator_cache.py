@@ -0,0 +1,70 @@
+"""
+Redis cache for operator lookups by operator code
+"""
+import logging
+from typing import Optional
+from fastapi import Request
+from redis.asyncio import Redis
+from app.models.operator import Operator, OperatorProjection
+
+logger = logging.getLogger(__name__)
+
+
+class OperatorCache:
+    """
+    Read-through cache in front of Operator.find_one(operator_code == ...).
+    Operators rarely change, so every operator route can skip the Mongo
+    lookup on a hit. Fails open: Redis errors fall back to the database.
+    """
+
+    def __init__(self, redis: Optional[Redis], ttl_seconds: int = 300):
+        self.redis = redis
+        self.ttl_seconds = ttl_seconds
+
+    @property
+    def enabled(self) -> bool:
+        return self.redis is not None
+
+    @staticmethod
+    def make_key(operator_code: str) -> str:
+        return f"operator:{operator_code}"
+
+    async def get(self, operator_code: str) -> Optional[OperatorProjection]:
+        """Return the operator, loading and caching it on a miss"""
+        if self.enabled:
+            try:
+                cached = await self.redis.get(self.make_key(operator_code))
+            except Exception as e:
+                logger.error(f"Operator cache read error: {e}")
+                cached = None
+            if cached is not None:
+                return OperatorProjection.model_validate_json(cached)
+
+        operator = await Operator.find_one(
+            Operator.operator_code == operator_code
+        ).project(OperatorProjection)
+
+        if operator is not None and self.enabled:
+            try:
+                await self.redis.setex(
+                    self.make_key(operator_code), self.ttl_seconds, operator.model_dump_json()
+                )
+            except Exception as e:
+                logger.error(f"Operator cache write error: {e}")
+
+        return operator
+
+    async def invalidate(self, operator_code: str) -> None:
+        """Drop a cached operator; call after writing to it"""
+        if not self.enabled:
+            return
+
+        try:
+            await self.redis.delete(self.make_key(operator_code))
+        except Exception as e:
+            logger.error(f"Operator cache invalidate error: {e}")
+
+
+def get_operator_cache(request: Request) -> OperatorCache:
+    """FastAPI dependency returning the app-wide OperatorCache"""
+    return request.app.state.operator_cache
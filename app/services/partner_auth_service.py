@@ -4,10 +4,11 @@ Partner authentication service
 import secrets
 from datetime import datetime, timedelta
 from typing import Optional, Tuple
+from uuid import uuid4
 from app.models.partner import Partner, PartnerStatus
 from app.schemas.partner_auth import PartnerRegister
 from app.services.partner_service import PartnerService
-from app.core.security import create_access_token, get_password_hash, verify_password
+from app.core.security import create_access_token, get_password_hash_async, verify_password_async
 import logging
 
 logger = logging.getLogger(__name__)
@@ -17,14 +18,14 @@ class PartnerAuthService:
     """Service for partner authentication operations"""
     
     @staticmethod
-    def hash_password(password: str) -> str:
+    async def hash_password(password: str) -> str:
         """Hash a password"""
-        return get_password_hash(password)
+        return await get_password_hash_async(password)
     
     @staticmethod
-    def verify_password(plain_password: str, hashed_password: str) -> bool:
+    async def verify_password(plain_password: str, hashed_password: str) -> bool:
         """Verify a password against its hash"""
-        return verify_password(plain_password, hashed_password)
+        return await verify_password_async(plain_password, hashed_password)
     
     @staticmethod
     def generate_verification_token() -> str:
@@ -69,7 +70,7 @@ class PartnerAuthService:
             tax_id=registration_data.tax_id,
             business_description=registration_data.business_description,
             expected_monthly_volume=registration_data.expected_monthly_volume,
-            password_hash=PartnerAuthService.hash_password(registration_data.password),
+            password_hash=await PartnerAuthService.hash_password(registration_data.password),
             email_verified=False,
             email_verification_token=verification_token,
             email_verification_expires=verification_expires,
@@ -122,25 +123,45 @@ class PartnerAuthService:
         if not partner.password_hash:
             return None
         
-        if not PartnerAuthService.verify_password(password, partner.password_hash):
+        if not await PartnerAuthService.verify_password(password, partner.password_hash):
             return None
         
         return partner
     
+    @staticmethod
+    def token_profile(partner: Partner) -> dict:
+        """Partner summary embedded in token responses (and cached for refresh)"""
+        return {
+            "id": str(partner.id),
+            "partner_code": partner.partner_code,
+            "name": partner.name,
+            "email": partner.email,
+            "company_name": partner.company_name,
+            "status": partner.status,
+            "email_verified": partner.email_verified
+        }
+    
     @staticmethod
     def create_partner_tokens(partner: Partner) -> dict:
         """Create JWT tokens for partner"""
+        return PartnerAuthService.create_tokens_for_profile(
+            PartnerAuthService.token_profile(partner)
+        )
+    
+    @staticmethod
+    def create_tokens_for_profile(profile: dict) -> dict:
+        """Create JWT tokens from a token profile without loading the partner"""
         # Access token (1 hour)
         access_token_expires = timedelta(hours=1)
         access_token = create_access_token(
-            data={"sub": str(partner.id), "type": "partner"},
+            data={"sub": profile["id"], "type": "partner"},
             expires_delta=access_token_expires
         )
         
-        # Refresh token (7 days)
+        # Refresh token (7 days); jti lets a single token be revoked
         refresh_token_expires = timedelta(days=7)
         refresh_token = create_access_token(
-            data={"sub": str(partner.id), "type": "partner_refresh"},
+            data={"sub": profile["id"], "type": "partner_refresh", "jti": uuid4().hex},
             expires_delta=refresh_token_expires
         )
         
@@ -149,15 +170,7 @@ class PartnerAuthService:
             "refresh_token": refresh_token,
             "token_type": "bearer",
             "expires_in": int(access_token_expires.total_seconds()),
-            "partner": {
-                "id": str(partner.id),
-                "partner_code": partner.partner_code,
-                "name": partner.name,
-                "email": partner.email,
-                "company_name": partner.company_name,
-                "status": partner.status,
-                "email_verified": partner.email_verified
-            }
+            "partner": profile
         }
     
     @staticmethod
@@ -194,7 +207,7 @@ class PartnerAuthService:
             raise ValueError("Reset token expired")
         
         # Update password
-        partner.password_hash = PartnerAuthService.hash_password(new_password)
+        partner.password_hash = await PartnerAuthService.hash_password(new_password)
         partner.reset_token = None
         partner.reset_token_expires = None
         partner.updated_at = datetime.utcnow()
@@ -210,10 +223,10 @@ class PartnerAuthService:
         if not partner.password_hash:
             raise ValueError("No password set for this account")
         
-        if not PartnerAuthService.verify_password(current_password, partner.password_hash):
+        if not await PartnerAuthService.verify_password(current_password, partner.password_hash):
             raise ValueError("Current password is incorrect")
         
-        partner.password_hash = PartnerAuthService.hash_password(new_password)
+        partner.password_hash = await PartnerAuthService.hash_password(new_password)
         partner.updated_at = datetime.utcnow()
         
         await partner.save()
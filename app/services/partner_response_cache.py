@@ -0,0 +1,72 @@
+"""
+Short-lived Redis cache for per-partner GET responses
+"""
+import logging
+from typing import Optional
+from fastapi import Request
+from redis.asyncio import Redis
+
+logger = logging.getLogger(__name__)
+
+# Cached views of a partner; invalidate() drops all of them
+PARTNER_VIEWS = ("me", "webhooks")
+
+
+class PartnerResponseCache:
+    """
+    Caches the serialized JSON body of GET /partners/me and
+    GET /partners/webhooks. Keys always include the partner ID, so one
+    partner can never be served another's body. The PUT handlers and the
+    admin status changes drop a partner's entries after writing. Fails open:
+    any Redis error is treated as a miss.
+    """
+
+    def __init__(self, redis: Optional[Redis], ttl_seconds: int = 60):
+        self.redis = redis
+        self.ttl_seconds = ttl_seconds
+
+    @property
+    def enabled(self) -> bool:
+        return self.redis is not None
+
+    @staticmethod
+    def make_key(partner_id: str, view: str) -> str:
+        return f"partner:{partner_id}:{view}"
+
+    async def get(self, partner_id: str, view: str) -> Optional[str]:
+        """Return the cached JSON body, or None on a miss"""
+        if not self.enabled:
+            return None
+
+        try:
+            return await self.redis.get(self.make_key(partner_id, view))
+        except Exception as e:
+            logger.error(f"Partner response cache read error: {e}")
+            return None
+
+    async def set(self, partner_id: str, view: str, body: str) -> None:
+        """Store a JSON body for ttl_seconds"""
+        if not self.enabled:
+            return
+
+        try:
+            await self.redis.setex(self.make_key(partner_id, view), self.ttl_seconds, body)
+        except Exception as e:
+            logger.error(f"Partner response cache write error: {e}")
+
+    async def invalidate(self, partner_id: str) -> None:
+        """Drop every cached view of a partner; call after writing to it"""
+        if not self.enabled:
+            return
+
+        try:
+            await self.redis.delete(
+                *(self.make_key(partner_id, view) for view in PARTNER_VIEWS)
+            )
+        except Exception as e:
+            logger.error(f"Partner response cache invalidate error: {e}")
+
+
+def get_partner_response_cache(request: Request) -> PartnerResponseCache:
+    """FastAPI dependency returning the app-wide PartnerResponseCache"""
+    return request.app.state.partner_response_cache
@@ -1,22 +1,54 @@
 """
 Partner service for B2B business logic
 """
+import re
 import secrets
 import hashlib
 import hmac
 from datetime import datetime, timedelta
-from typing import Optional, List
+from typing import Dict, Iterable, Optional, List, Tuple
+from beanie import PydanticObjectId
+from beanie.operators import In
+from app.core.config import get_fast_settings
 from app.models.partner import Partner, PartnerStatus
 from app.models.api_key import APIKey, APIKeyStatus
+from app.services.usage_tracker import usage_tracker
 from app.schemas.partner import (
-    PartnerCreate, APIKeyCreate, APIKeyCreateResponse,
+    PartnerCreate, PartnerResponse, APIKeyCreate, APIKeyCreateResponse,
     APIKeyResponse, APIKeyRotateResponse
 )
 
 
+# Keys issued through the APIKey model: ovu_live_<key_id>_<secret>
+API_KEY_PATTERN = re.compile(r"^ovu_live_(key_[0-9a-f]{32})_(.+)$")
+
+
 class PartnerService:
     """Service for partner management operations"""
     
+    @staticmethod
+    def to_response(partner: Partner) -> PartnerResponse:
+        """Map a partner document to PartnerResponse"""
+        # Documents were validated on load/insert, so skip re-validating
+        # (enums, datetimes) on every response
+        return PartnerResponse.model_construct(
+            id=str(partner.id),
+            partner_code=partner.partner_code,
+            name=partner.name,
+            email=partner.email,
+            phone=partner.phone,
+            website=partner.website,
+            company_name=partner.company_name,
+            business_type=partner.business_type,
+            status=partner.status,
+            rate_limit_per_minute=partner.rate_limit_per_minute,
+            rate_limit_per_day=partner.rate_limit_per_day,
+            total_requests=partner.total_requests,
+            last_request_at=partner.last_request_at,
+            created_at=partner.created_at,
+            updated_at=partner.updated_at,
+        )
+    
     @staticmethod
     def generate_partner_code(company_name: str) -> str:
         """Generate unique partner code"""
@@ -39,16 +71,50 @@ class PartnerService:
         
         return api_key, api_secret
     
+    @staticmethod
+    def generate_keyed_api_key(key_id: str) -> tuple[str, str]:
+        """
+        Generate an API key bound to an APIKey document
+        Returns: (api_key, key_secret)
+        """
+        key_secret = secrets.token_urlsafe(32)
+        return f"ovu_live_{key_id}_{key_secret}", key_secret
+    
+    @staticmethod
+    def parse_api_key(api_key: str) -> Optional[tuple[str, str]]:
+        """
+        Split a keyed API key into its parts
+        Returns: (key_id, key_secret), or None for legacy/malformed keys
+        """
+        match = API_KEY_PATTERN.match(api_key)
+        if not match:
+            return None
+        return match.group(1), match.group(2)
+    
     @staticmethod
     def hash_secret(secret: str) -> str:
-        """Hash API secret for storage"""
+        """
+        Hash API key/secret for storage
+        Keys are high-entropy random tokens, so a peppered HMAC-SHA256 is
+        sufficient and cheap enough to compute on every request (unlike bcrypt)
+        """
+        settings = get_fast_settings()
+        pepper = settings.API_KEY_PEPPER or settings.SECRET_KEY
+        return hmac.new(pepper.encode(), secret.encode(), hashlib.sha256).hexdigest()
+    
+    @staticmethod
+    def legacy_hash_secret(secret: str) -> str:
+        """Unpeppered SHA-256, how secrets were hashed before hash_secret used HMAC"""
         return hashlib.sha256(secret.encode()).hexdigest()
     
     @staticmethod
     def verify_secret(secret: str, hashed_secret: str) -> bool:
-        """Verify API secret against hash"""
+        """Verify API secret against hash, accepting legacy SHA-256 hashes on a miss"""
         return hmac.compare_digest(
-            hashlib.sha256(secret.encode()).hexdigest(),
+            PartnerService.hash_secret(secret),
+            hashed_secret
+        ) or hmac.compare_digest(
+            PartnerService.legacy_hash_secret(secret),
             hashed_secret
         )
     
@@ -89,17 +155,7 @@ class PartnerService:
         
         await partner.insert()
         
-        # Also create an APIKey entry for better management
-        key_id = PartnerService.generate_key_id()
-        api_key_doc = APIKey(
-            key_id=key_id,
-            key_hash=api_secret_hash,
-            name="Default API Key",
-            partner_id=str(partner.id),
-            status=APIKeyStatus.ACTIVE,
-        )
-        await api_key_doc.insert()
-        
+        # The initial key is partner.api_key; managed keys come from create_api_key
         return partner, api_key, api_secret
     
     @staticmethod
@@ -109,10 +165,10 @@ class PartnerService:
     ) -> APIKeyCreateResponse:
         """Create a new API key for a partner"""
         
-        # Generate credentials
-        api_key, api_secret = PartnerService.generate_api_credentials()
-        key_hash = PartnerService.hash_secret(api_secret)
+        # Generate credentials; only the secret's HMAC is stored
         key_id = PartnerService.generate_key_id()
+        api_key, key_secret = PartnerService.generate_keyed_api_key(key_id)
+        key_hash = PartnerService.hash_secret(key_secret)
         
         # Calculate expiration if specified
         expires_at = None
@@ -138,7 +194,7 @@ class PartnerService:
             key_id=key_id,
             name=key_data.name,
             api_key=api_key,
-            api_secret=api_secret,
+            api_secret=key_secret,
             status=APIKeyStatus.ACTIVE,
             scopes=key_data.scopes,
             created_at=api_key_doc.created_at,
@@ -150,8 +206,9 @@ class PartnerService:
         """List all API keys for a partner"""
         keys = await APIKey.find(APIKey.partner_id == partner_id).to_list()
         
+        # Keys were validated on load, so skip re-validating every row
         return [
-            APIKeyResponse(
+            APIKeyResponse.model_construct(
                 key_id=key.key_id,
                 name=key.name,
                 key_preview=key.key_id[:8] + "...",
@@ -168,6 +225,20 @@ class PartnerService:
             for key in keys
         ]
     
+    @staticmethod
+    async def count_api_keys(partner_id: str) -> Tuple[int, int]:
+        """
+        Count a partner's API keys without loading them
+        Returns: (active, total); answered from the partner_id_status index
+        """
+        rows = await APIKey.aggregate([
+            {"$match": {"partner_id": partner_id}},
+            {"$group": {"_id": "$status", "n": {"$sum": 1}}},
+        ]).to_list()
+        
+        counts = {row["_id"]: row["n"] for row in rows}
+        return counts.get(APIKeyStatus.ACTIVE.value, 0), sum(counts.values())
+    
     @staticmethod
     async def revoke_api_key(partner_id: str, key_id: str) -> bool:
         """Revoke an API key"""
@@ -223,6 +294,52 @@ class PartnerService:
             new_api_secret=new_key.api_secret,
         )
     
+    @staticmethod
+    async def resolve_api_key(api_key: str) -> Optional[tuple[APIKey, Partner]]:
+        """
+        Resolve a keyed API key to its active APIKey document and owning partner
+        Fetches both in one round-trip via $lookup, then checks the secret in constant time
+        """
+        parsed = PartnerService.parse_api_key(api_key)
+        if not parsed:
+            return None
+        
+        key_id, key_secret = parsed
+        results = await APIKey.aggregate([
+            {"$match": {"key_id": key_id}},
+            {"$limit": 1},
+            {"$lookup": {
+                "from": Partner.get_collection_name(),
+                "let": {"partner_id": {"$toObjectId": "$partner_id"}},
+                "pipeline": [{"$match": {"$expr": {"$eq": ["$_id", "$$partner_id"]}}}],
+                "as": "partner",
+            }},
+        ]).to_list()
+        
+        if not results or not results[0]["partner"]:
+            return None
+        
+        raw = results[0]
+        partner = Partner.model_validate(raw.pop("partner")[0])
+        api_key_doc = APIKey.model_validate(raw)
+        
+        if api_key_doc.status != APIKeyStatus.ACTIVE:
+            return None
+        
+        if api_key_doc.expires_at and api_key_doc.expires_at < datetime.utcnow():
+            return None
+        
+        key_hash = PartnerService.hash_secret(key_secret)
+        if not hmac.compare_digest(key_hash, api_key_doc.key_hash):
+            if not hmac.compare_digest(
+                PartnerService.legacy_hash_secret(key_secret), api_key_doc.key_hash
+            ):
+                return None
+            # Stored before hashes were peppered; upgrade it now the secret is known
+            await api_key_doc.set({APIKey.key_hash: key_hash})
+        
+        return api_key_doc, partner
+    
     @staticmethod
     async def verify_api_key(api_key: str) -> Optional[Partner]:
         """
@@ -232,19 +349,34 @@ class PartnerService:
         # Try legacy API key first
         partner = await Partner.find_one(Partner.api_key == api_key)
         if partner and partner.status == PartnerStatus.ACTIVE:
-            # Update usage tracking
-            partner.total_requests += 1
-            partner.last_request_at = datetime.utcnow()
-            await partner.save()
+            usage_tracker.record(str(partner.id))
             return partner
         
         # Try new APIKey model
-        # Note: In production, you'd hash the incoming key and compare
-        # For now, we're using the key_id as the lookup
-        # This is a simplified version - in production, implement proper key verification
+        resolved = await PartnerService.resolve_api_key(api_key)
+        if resolved:
+            api_key_doc, partner = resolved
+            if partner.status == PartnerStatus.ACTIVE:
+                usage_tracker.record(str(partner.id), str(api_key_doc.id))
+                return partner
         
         return None
     
+    @staticmethod
+    async def get_many(partner_ids: Iterable[str]) -> Dict[str, Partner]:
+        """
+        Load several partners with one $in query, keyed by str(id)
+        Invalid ids are skipped and missing partners are simply absent
+        """
+        object_ids = {
+            PydanticObjectId(pid) for pid in partner_ids if PydanticObjectId.is_valid(pid)
+        }
+        if not object_ids:
+            return {}
+
+        partners = await Partner.find(In(Partner.id, list(object_ids))).to_list()
+        return {str(p.id): p for p in partners}
+
     @staticmethod
     async def track_api_usage(
         partner_id: str,
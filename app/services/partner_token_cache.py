@@ -0,0 +1,95 @@
+"""
+Redis state for partner refresh tokens: revoked JTIs and cached partner profiles
+"""
+import logging
+import time
+from typing import Any, Dict, Optional
+import orjson
+from fastapi import Request
+from redis.asyncio import Redis
+
+logger = logging.getLogger(__name__)
+
+
+class PartnerTokenCache:
+    """
+    Lets /partners/auth/refresh answer without touching Mongo. Revoked refresh
+    token IDs are kept until the token would have expired anyway, and each
+    partner's token profile (including status) is cached and rewritten
+    whenever an admin changes the status. Reads fail open: Redis errors fall
+    back to the database. claim() does not: it raises so /refresh can refuse
+    instead of letting a refresh token be exchanged twice. Without Redis
+    configured at all, refresh tokens stay reusable until they expire.
+    """
+
+    def __init__(self, redis: Optional[Redis], ttl_seconds: int = 3600):
+        self.redis = redis
+        self.ttl_seconds = ttl_seconds
+
+    @property
+    def enabled(self) -> bool:
+        return self.redis is not None
+
+    @staticmethod
+    def make_jti_key(jti: str) -> str:
+        return f"revoked_jti:{jti}"
+
+    @staticmethod
+    def make_status_key(partner_id: str) -> str:
+        return f"partner_status:{partner_id}"
+
+    async def is_revoked(self, jti: str) -> bool:
+        """True if the refresh token with this ID was already revoked"""
+        if not self.enabled:
+            return False
+
+        try:
+            return bool(await self.redis.exists(self.make_jti_key(jti)))
+        except Exception as e:
+            logger.error(f"Partner token cache read error: {e}")
+            return False
+
+    async def claim(self, jti: str, expires_at: int) -> bool:
+        """
+        Mark a refresh token ID used until its exp claim passes
+
+        Check and revoke are one SET NX, so of two concurrent claims only one
+        gets True. Redis errors propagate to the caller.
+        """
+        if not self.enabled:
+            return True
+
+        ttl = max(expires_at - int(time.time()), 1)
+        return bool(await self.redis.set(self.make_jti_key(jti), 1, nx=True, ex=ttl))
+
+    async def get_profile(self, partner_id: str) -> Optional[Dict[str, Any]]:
+        """Return the cached token profile, or None on a miss"""
+        if not self.enabled:
+            return None
+
+        try:
+            cached = await self.redis.get(self.make_status_key(partner_id))
+        except Exception as e:
+            logger.error(f"Partner token cache read error: {e}")
+            return None
+
+        if cached is None:
+            return None
+        return orjson.loads(cached)
+
+    async def set_profile(self, profile: Dict[str, Any]) -> None:
+        """Store a partner's token profile; call after changing the partner's status"""
+        if not self.enabled:
+            return
+
+        try:
+            await self.redis.setex(
+                self.make_status_key(profile["id"]), self.ttl_seconds, orjson.dumps(profile)
+            )
+        except Exception as e:
+            logger.error(f"Partner token cache write error: {e}")
+
+
+def get_partner_token_cache(request: Request) -> PartnerTokenCache:
+    """FastAPI dependency returning the app-wide PartnerTokenCache"""
+    return request.app.state.partner_token_cache
@@ -5,9 +5,11 @@ import httpx
 import hmac
 import hashlib
 import logging
+from fastapi import Request
 from typing import Optional, List, Dict, Any
-from app.core.config import settings
+from app.core.config import get_settings
 from app.models.payment import SplitConfig
+from app.utils.helpers import format_currency
 
 logger = logging.getLogger(__name__)
 
@@ -15,27 +17,31 @@ logger = logging.getLogger(__name__)
 class PaystackService:
     """Paystack payment integration"""
     
-    def __init__(self):
-        self.secret_key = settings.PAYSTACK_SECRET_KEY
+    def __init__(self, http_client: Optional[httpx.AsyncClient] = None):
+        # Shared pooled client from the app lifespan; standalone instances make their own
+        self.http = http_client or httpx.AsyncClient()
+        self.settings = get_settings()
+        self.secret_key = self.settings.PAYSTACK_SECRET_KEY
         self.base_url = "https://api.paystack.co"
         # Paystack uses the same API endpoint for both test and live keys
         # The environment is determined by the secret key prefix (sk_test_ or sk_live_)
+        # Keyed once; each webhook check copies this instead of re-keying HMAC-SHA512
+        self._webhook_hmac = hmac.new(
+            self.settings.PAYSTACK_WEBHOOK_SECRET.encode('utf-8'), digestmod=hashlib.sha512
+        )
         
     async def initialize_transaction(
         self,
         email: str,
-        amount: float,
+        amount_kobo: int,
         reference: str,
         callback_url: Optional[str] = None,
         split_config: Optional[List[SplitConfig]] = None,
     ) -> Dict[str, Any]:
         """Initialize a payment transaction"""
         
-        # Amount in kobo (Paystack uses kobo for NGN)
-        amount_kobo = int(amount * 100)
-        
-        if settings.is_development:
-            logger.info(f"[DEV] Initializing payment: {reference} for {email} - Amount: NGN {amount}")
+        if self.settings.is_development:
+            logger.info(f"[DEV] Initializing payment: {reference} for {email} - Amount: {format_currency(amount_kobo)}")
         
         payload = {
             "email": email,
@@ -52,99 +58,97 @@ class PaystackService:
             for split in split_config:
                 subaccounts.append({
                     "subaccount": split.subaccount_code,
-                    "share": int(split.share_percentage) if not split.share_amount else int(split.share_amount * 100),
+                    "share": int(split.share_percentage) if not split.share_amount_kobo else split.share_amount_kobo,
                 })
             payload["subaccount"] = subaccounts[0]["subaccount"] if len(subaccounts) == 1 else None
             if len(subaccounts) > 1:
                 payload["split"] = {"type": "percentage", "subaccounts": subaccounts}
         
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.post(
-                    f"{self.base_url}/transaction/initialize",
-                    json=payload,
-                    headers={
-                        "Authorization": f"Bearer {self.secret_key}",
-                        "Content-Type": "application/json",
-                    },
-                    timeout=30.0,
-                )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    if settings.is_development:
-                        logger.info(f"[DEV] Payment initialized successfully: {reference}")
-                    return {
-                        "status": "success",
-                        "authorization_url": data["data"]["authorization_url"],
-                        "access_code": data["data"]["access_code"],
-                        "reference": data["data"]["reference"],
-                    }
-                else:
-                    error_msg = response.json().get("message", "Payment initialization failed")
-                    if settings.is_development:
-                        logger.error(f"[DEV] Payment initialization failed: {error_msg}")
-                    return {
-                        "status": "error",
-                        "message": error_msg,
-                    }
-            except Exception as e:
-                error_msg = str(e)
-                if settings.is_development:
-                    logger.error(f"[DEV] Error initializing payment: {error_msg}")
-                else:
-                    logger.error(f"Error initializing payment for reference {reference}")
+        try:
+            response = await self.http.post(
+                f"{self.base_url}/transaction/initialize",
+                json=payload,
+                headers={
+                    "Authorization": f"Bearer {self.secret_key}",
+                    "Content-Type": "application/json",
+                },
+                timeout=30.0,
+            )
+            
+            if response.status_code == 200:
+                data = response.json()
+                if self.settings.is_development:
+                    logger.info(f"[DEV] Payment initialized successfully: {reference}")
+                return {
+                    "status": "success",
+                    "authorization_url": data["data"]["authorization_url"],
+                    "access_code": data["data"]["access_code"],
+                    "reference": data["data"]["reference"],
+                }
+            else:
+                error_msg = response.json().get("message", "Payment initialization failed")
+                if self.settings.is_development:
+                    logger.error(f"[DEV] Payment initialization failed: {error_msg}")
                 return {
                     "status": "error",
-                    "message": error_msg if settings.is_development else "Payment initialization failed",
+                    "message": error_msg,
                 }
+        except Exception as e:
+            error_msg = str(e)
+            if self.settings.is_development:
+                logger.error(f"[DEV] Error initializing payment: {error_msg}")
+            else:
+                logger.error(f"Error initializing payment for reference {reference}")
+            return {
+                "status": "error",
+                "message": error_msg if self.settings.is_development else "Payment initialization failed",
+            }
     
     async def verify_transaction(self, reference: str) -> Dict[str, Any]:
         """Verify a payment transaction"""
         
-        if settings.is_development:
+        if self.settings.is_development:
             logger.info(f"[DEV] Verifying transaction: {reference}")
         
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(
-                    f"{self.base_url}/transaction/verify/{reference}",
-                    headers={
-                        "Authorization": f"Bearer {self.secret_key}",
-                    },
-                    timeout=30.0,
-                )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    if settings.is_development:
-                        logger.info(f"[DEV] Transaction verified successfully: {reference}")
-                    return {
-                        "status": "success",
-                        "data": data["data"],
-                    }
-                else:
-                    if settings.is_development:
-                        logger.error(f"[DEV] Transaction verification failed: {reference}")
-                    return {
-                        "status": "error",
-                        "message": "Verification failed",
-                    }
-            except Exception as e:
-                error_msg = str(e)
-                if settings.is_development:
-                    logger.error(f"[DEV] Error verifying payment: {error_msg}")
-                else:
-                    logger.error(f"Error verifying payment for reference {reference}")
+        try:
+            response = await self.http.get(
+                f"{self.base_url}/transaction/verify/{reference}",
+                headers={
+                    "Authorization": f"Bearer {self.secret_key}",
+                },
+                timeout=30.0,
+            )
+            
+            if response.status_code == 200:
+                data = response.json()
+                if self.settings.is_development:
+                    logger.info(f"[DEV] Transaction verified successfully: {reference}")
+                return {
+                    "status": "success",
+                    "data": data["data"],
+                }
+            else:
+                if self.settings.is_development:
+                    logger.error(f"[DEV] Transaction verification failed: {reference}")
                 return {
                     "status": "error",
-                    "message": error_msg if settings.is_development else "Verification failed",
+                    "message": "Verification failed",
                 }
+        except Exception as e:
+            error_msg = str(e)
+            if self.settings.is_development:
+                logger.error(f"[DEV] Error verifying payment: {error_msg}")
+            else:
+                logger.error(f"Error verifying payment for reference {reference}")
+            return {
+                "status": "error",
+                "message": error_msg if self.settings.is_development else "Verification failed",
+            }
     
     async def create_subaccount(self, operator_data: dict) -> Dict[str, Any]:
         """Create a subaccount for an operator"""
         
-        if settings.is_development:
+        if self.settings.is_development:
             logger.info(f"[DEV] Creating subaccount for: {operator_data.get('business_name')}")
         
         payload = {
@@ -154,106 +158,104 @@ class PaystackService:
             "percentage_charge": operator_data.get("percentage_charge", 10.0),
         }
         
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.post(
-                    f"{self.base_url}/subaccount",
-                    json=payload,
-                    headers={
-                        "Authorization": f"Bearer {self.secret_key}",
-                        "Content-Type": "application/json",
-                    },
-                    timeout=30.0,
-                )
-                
-                if response.status_code == 200 or response.status_code == 201:
-                    data = response.json()
-                    if settings.is_development:
-                        logger.info(f"[DEV] Subaccount created: {data['data']['subaccount_code']}")
-                    return {
-                        "status": "success",
-                        "subaccount_code": data["data"]["subaccount_code"],
-                    }
-                else:
-                    error_msg = response.json().get("message", "Subaccount creation failed")
-                    if settings.is_development:
-                        logger.error(f"[DEV] Subaccount creation failed: {error_msg}")
-                    return {
-                        "status": "error",
-                        "message": error_msg,
-                    }
-            except Exception as e:
-                error_msg = str(e)
-                if settings.is_development:
-                    logger.error(f"[DEV] Error creating subaccount: {error_msg}")
-                else:
-                    logger.error(f"Error creating subaccount for business: {operator_data.get('business_name', 'unknown')}")
+        try:
+            response = await self.http.post(
+                f"{self.base_url}/subaccount",
+                json=payload,
+                headers={
+                    "Authorization": f"Bearer {self.secret_key}",
+                    "Content-Type": "application/json",
+                },
+                timeout=30.0,
+            )
+            
+            if response.status_code == 200 or response.status_code == 201:
+                data = response.json()
+                if self.settings.is_development:
+                    logger.info(f"[DEV] Subaccount created: {data['data']['subaccount_code']}")
+                return {
+                    "status": "success",
+                    "subaccount_code": data["data"]["subaccount_code"],
+                }
+            else:
+                error_msg = response.json().get("message", "Subaccount creation failed")
+                if self.settings.is_development:
+                    logger.error(f"[DEV] Subaccount creation failed: {error_msg}")
                 return {
                     "status": "error",
-                    "message": error_msg if settings.is_development else "Subaccount creation failed",
+                    "message": error_msg,
                 }
+        except Exception as e:
+            error_msg = str(e)
+            if self.settings.is_development:
+                logger.error(f"[DEV] Error creating subaccount: {error_msg}")
+            else:
+                logger.error(f"Error creating subaccount for business: {operator_data.get('business_name', 'unknown')}")
+            return {
+                "status": "error",
+                "message": error_msg if self.settings.is_development else "Subaccount creation failed",
+            }
     
-    async def initiate_refund(self, reference: str, amount: Optional[float] = None) -> Dict[str, Any]:
+    async def initiate_refund(self, reference: str, amount_kobo: Optional[int] = None) -> Dict[str, Any]:
         """Initiate a refund"""
         
-        if settings.is_development:
+        if self.settings.is_development:
             logger.info(f"[DEV] Initiating refund for: {reference}")
         
         payload = {
             "transaction": reference,
         }
         
-        if amount:
-            payload["amount"] = int(amount * 100)  # Convert to kobo
+        if amount_kobo:
+            payload["amount"] = amount_kobo
         
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.post(
-                    f"{self.base_url}/refund",
-                    json=payload,
-                    headers={
-                        "Authorization": f"Bearer {self.secret_key}",
-                        "Content-Type": "application/json",
-                    },
-                    timeout=30.0,
-                )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    if settings.is_development:
-                        logger.info(f"[DEV] Refund initiated successfully: {reference}")
-                    return {
-                        "status": "success",
-                        "data": data["data"],
-                    }
-                else:
-                    error_msg = response.json().get("message", "Refund failed")
-                    if settings.is_development:
-                        logger.error(f"[DEV] Refund failed: {error_msg}")
-                    return {
-                        "status": "error",
-                        "message": error_msg,
-                    }
-            except Exception as e:
-                error_msg = str(e)
-                if settings.is_development:
-                    logger.error(f"[DEV] Error initiating refund: {error_msg}")
-                else:
-                    logger.error(f"Error initiating refund for reference {reference}")
+        try:
+            response = await self.http.post(
+                f"{self.base_url}/refund",
+                json=payload,
+                headers={
+                    "Authorization": f"Bearer {self.secret_key}",
+                    "Content-Type": "application/json",
+                },
+                timeout=30.0,
+            )
+            
+            if response.status_code == 200:
+                data = response.json()
+                if self.settings.is_development:
+                    logger.info(f"[DEV] Refund initiated successfully: {reference}")
+                return {
+                    "status": "success",
+                    "data": data["data"],
+                }
+            else:
+                error_msg = response.json().get("message", "Refund failed")
+                if self.settings.is_development:
+                    logger.error(f"[DEV] Refund failed: {error_msg}")
                 return {
                     "status": "error",
-                    "message": error_msg if settings.is_development else "Refund failed",
+                    "message": error_msg,
                 }
+        except Exception as e:
+            error_msg = str(e)
+            if self.settings.is_development:
+                logger.error(f"[DEV] Error initiating refund: {error_msg}")
+            else:
+                logger.error(f"Error initiating refund for reference {reference}")
+            return {
+                "status": "error",
+                "message": error_msg if self.settings.is_development else "Refund failed",
+            }
     
     def verify_webhook_signature(self, payload: bytes, signature: str) -> bool:
-        """Verify Paystack webhook signature"""
+        """Verify Paystack webhook signature (constant-time compare)"""
         
-        webhook_secret = settings.PAYSTACK_WEBHOOK_SECRET
+        mac = self._webhook_hmac.copy()
+        mac.update(payload)
         
-        computed_signature = hmac.new(
-            webhook_secret.encode('utf-8'),
-            payload,
-            hashlib.sha512
-        ).hexdigest()
-        
-        return hmac.compare_digest(computed_signature, signature)
+        return hmac.compare_digest(mac.hexdigest(), signature)
+
+
+def get_paystack_service(request: Request) -> PaystackService:
+    """FastAPI dependency returning the app-wide PaystackService"""
+    return request.app.state.paystack_service
@@ -0,0 +1,75 @@
+"""
+Short-lived Redis cache for transport search results
+"""
+import hashlib
+import logging
+from typing import List, Optional
+import msgspec
+from fastapi import Request
+from redis.asyncio import Redis
+from app.schemas.booking import SearchRequest, SearchResultStruct
+
+logger = logging.getLogger(__name__)
+
+_results_decoder = msgspec.json.Decoder(List[SearchResultStruct])
+
+
+class SearchCache:
+    """
+    Caches provider search results per canonical search request so repeated
+    searches for popular routes skip the provider fan-out. Fails open: any
+    Redis error is treated as a miss.
+    """
+
+    def __init__(self, redis: Optional[Redis], ttl_seconds: int = 60):
+        self.redis = redis
+        self.ttl_seconds = ttl_seconds
+
+    @property
+    def enabled(self) -> bool:
+        return self.redis is not None
+
+    @staticmethod
+    def make_key(search_req: SearchRequest) -> str:
+        """Cache key for a search, independent of transport type ordering"""
+        canonical = search_req.model_copy(
+            update={"transport_types": sorted(set(search_req.transport_types))}
+        )
+        digest = hashlib.blake2b(
+            canonical.model_dump_json().encode(), digest_size=16
+        ).hexdigest()
+        return f"search:{digest}"
+
+    async def get(self, search_req: SearchRequest) -> Optional[List[SearchResultStruct]]:
+        """Return cached results, or None on a miss"""
+        if not self.enabled:
+            return None
+
+        try:
+            cached = await self.redis.get(self.make_key(search_req))
+        except Exception as e:
+            logger.error(f"Search cache read error: {e}")
+            return None
+
+        if cached is None:
+            return None
+        return _results_decoder.decode(cached)
+
+    async def set(self, search_req: SearchRequest, results: List[SearchResultStruct]) -> None:
+        """Store results for ttl_seconds"""
+        if not self.enabled:
+            return
+
+        try:
+            await self.redis.setex(
+                self.make_key(search_req),
+                self.ttl_seconds,
+                msgspec.json.encode(results),
+            )
+        except Exception as e:
+            logger.error(f"Search cache write error: {e}")
+
+
+def get_search_cache(request: Request) -> SearchCache:
+    """FastAPI dependency returning the app-wide SearchCache"""
+    return request.app.state.search_cache
@@ -0,0 +1,64 @@
+"""
+Unified transport search across providers
+"""
+import asyncio
+import heapq
+import logging
+from operator import attrgetter
+from typing import Awaitable, List, Optional
+from app.schemas.booking import SearchRequest, SearchResultStruct
+from app.models.booking import TransportType
+from app.services.travu_client import TravuAPIClient
+from app.services.nrc_client import NRCAPIClient
+from app.services.search_cache import SearchCache
+
+logger = logging.getLogger(__name__)
+
+_by_price = attrgetter("price_kobo")
+
+
+class SearchService:
+    """Fans a search out to every selected provider concurrently"""
+
+    @staticmethod
+    async def search(
+        search_req: SearchRequest,
+        travu_client: TravuAPIClient,
+        nrc_client: NRCAPIClient,
+        cache: Optional[SearchCache] = None,
+    ) -> List[SearchResultStruct]:
+        """Search all requested transport types, cheapest first"""
+        if cache is not None:
+            cached = await cache.get(search_req)
+            if cached is not None:
+                return cached
+
+        tasks: List[Awaitable[List[SearchResultStruct]]] = []
+
+        if TransportType.FLIGHT in search_req.transport_types:
+            tasks.append(travu_client.search_flights(search_req))
+        if TransportType.BUS in search_req.transport_types:
+            tasks.append(travu_client.search_buses(search_req))
+        if TransportType.TRAIN in search_req.transport_types:
+            tasks.append(nrc_client.search_trains(search_req))
+
+        # Total latency is the slowest provider rather than the sum of all of them
+        provider_lists: List[List[SearchResultStruct]] = []
+        complete = True
+        for provider_results in await asyncio.gather(*tasks, return_exceptions=True):
+            if isinstance(provider_results, BaseException):
+                logger.error(f"Provider search failed: {provider_results}")
+                complete = False
+                continue
+            provider_results.sort(key=_by_price)
+            provider_lists.append(provider_results)
+
+        # Each provider list is already ordered, so merge instead of re-sorting everything
+        results = list(heapq.merge(*provider_lists, key=_by_price))
+
+        # Partial results are returned but never cached, so one provider error
+        # isn't served to every identical search for the cache TTL
+        if cache is not None and complete:
+            await cache.set(search_req, results)
+
+        return results
@@ -0,0 +1,108 @@
+"""
+Buffered usage tracking for partner API requests
+"""
+import asyncio
+import logging
+import time
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, Optional
+from beanie import PydanticObjectId
+from pymongo import UpdateOne
+from app.models.partner import Partner
+from app.models.api_key import APIKey
+
+logger = logging.getLogger(__name__)
+
+
+class UsageTracker:
+    """
+    Accumulates partner/API key request counts in memory and periodically
+    flushes them to MongoDB with a single unordered bulk $inc per collection,
+    keeping usage writes off the request path
+    """
+
+    def __init__(self, flush_interval: float = 5.0):
+        self.flush_interval = flush_interval
+        self._partner_counts: Dict[str, int] = defaultdict(int)
+        self._partner_last_seen: Dict[str, float] = {}
+        self._api_key_counts: Dict[str, int] = defaultdict(int)
+        self._api_key_last_seen: Dict[str, float] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def record(self, partner_id: str, api_key_id: Optional[str] = None) -> None:
+        """Record one request for a partner (and the API key document used, if any)"""
+        # Epoch floats are cheap on the request path; converted once at flush
+        now = time.time()
+        self._partner_counts[partner_id] += 1
+        self._partner_last_seen[partner_id] = now
+        if api_key_id:
+            self._api_key_counts[api_key_id] += 1
+            self._api_key_last_seen[api_key_id] = now
+
+    @staticmethod
+    def _build_updates(
+        counts: Dict[str, int],
+        last_seen: Dict[str, float],
+        timestamp_field: str
+    ) -> list:
+        return [
+            UpdateOne(
+                {"_id": PydanticObjectId(doc_id)},
+                {
+                    "$inc": {"total_requests": count},
+                    "$max": {timestamp_field: datetime.utcfromtimestamp(last_seen[doc_id])},
+                }
+            )
+            for doc_id, count in counts.items()
+        ]
+
+    async def flush(self) -> None:
+        """Write buffered counts to MongoDB"""
+        if not self._partner_counts and not self._api_key_counts:
+            return
+
+        # Swap buffers first so requests arriving mid-flush are kept for the next one
+        partner_counts, self._partner_counts = self._partner_counts, defaultdict(int)
+        partner_last_seen, self._partner_last_seen = self._partner_last_seen, {}
+        api_key_counts, self._api_key_counts = self._api_key_counts, defaultdict(int)
+        api_key_last_seen, self._api_key_last_seen = self._api_key_last_seen, {}
+
+        if partner_counts:
+            await Partner.get_motor_collection().bulk_write(
+                self._build_updates(partner_counts, partner_last_seen, "last_request_at"),
+                ordered=False
+            )
+        if api_key_counts:
+            await APIKey.get_motor_collection().bulk_write(
+                self._build_updates(api_key_counts, api_key_last_seen, "last_used_at"),
+                ordered=False
+            )
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Failed to flush usage counters: {e}", exc_info=True)
+
+    def start(self) -> None:
+        """Start the background flusher"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background flusher and write any remaining counts"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+
+# Global usage tracker instance
+usage_tracker = UsageTracker()
@@ -2,17 +2,21 @@
 Webhook service for partner notifications
 """
 import asyncio
+import contextlib
 import httpx
 import hmac
 import hashlib
 import json
 from datetime import datetime
 from typing import Dict, Any, Optional
+from fastapi import Request
 from app.models.partner import Partner, WebhookEvent
 import logging
 
 logger = logging.getLogger(__name__)
 
+WEBHOOK_TIMEOUT_SECONDS = 10.0
+
 
 class WebhookService:
     """Service for webhook delivery and management"""
@@ -31,10 +35,13 @@ class WebhookService:
         partner: Partner,
         event_type: WebhookEvent,
         payload: Dict[str, Any],
-        max_retries: int = 3
+        max_retries: int = 3,
+        http_client: Optional[httpx.AsyncClient] = None
     ) -> tuple[bool, Optional[int], Optional[str]]:
         """
         Send webhook to partner
+        Pass the app's shared http_client to reuse its keep-alive connections;
+        without one a client is opened (and closed) for this delivery
         Returns: (success, status_code, error_message)
         """
         if not partner.webhook_url:
@@ -71,13 +78,19 @@ class WebhookService:
         # Send webhook with retries
         last_error = None
         
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        client_context = (
+            contextlib.nullcontext(http_client)
+            if http_client is not None
+            else httpx.AsyncClient(timeout=WEBHOOK_TIMEOUT_SECONDS)
+        )
+        async with client_context as client:
             for attempt in range(max_retries):
                 try:
                     response = await client.post(
                         partner.webhook_url,
                         content=payload_str,
-                        headers=headers
+                        headers=headers,
+                        timeout=WEBHOOK_TIMEOUT_SECONDS
                     )
                     
                     if response.status_code in [200, 201, 202, 204]:
@@ -120,7 +133,8 @@ class WebhookService:
     @staticmethod
     async def test_webhook(
         partner: Partner,
-        event_type: WebhookEvent = WebhookEvent.BOOKING_CREATED
+        event_type: WebhookEvent = WebhookEvent.BOOKING_CREATED,
+        http_client: Optional[httpx.AsyncClient] = None
     ) -> tuple[bool, Optional[int], Optional[float], Optional[str]]:
         """
         Test webhook configuration
@@ -143,7 +157,8 @@ class WebhookService:
             partner=partner,
             event_type=event_type,
             payload=test_payload,
-            max_retries=1  # Only one attempt for tests
+            max_retries=1,  # Only one attempt for tests
+            http_client=http_client
         )
         
         end_time = datetime.utcnow()
@@ -152,55 +167,90 @@ class WebhookService:
         return success, status_code, response_time_ms, error
     
     @staticmethod
-    async def notify_booking_created(partner: Partner, booking_data: Dict[str, Any]):
+    async def notify_booking_created(
+        partner: Partner,
+        booking_data: Dict[str, Any],
+        http_client: Optional[httpx.AsyncClient] = None
+    ):
         """Send booking created webhook"""
         await WebhookService.send_webhook(
             partner=partner,
             event_type=WebhookEvent.BOOKING_CREATED,
-            payload=booking_data
+            payload=booking_data,
+            http_client=http_client
         )
     
     @staticmethod
-    async def notify_booking_confirmed(partner: Partner, booking_data: Dict[str, Any]):
+    async def notify_booking_confirmed(
+        partner: Partner,
+        booking_data: Dict[str, Any],
+        http_client: Optional[httpx.AsyncClient] = None
+    ):
         """Send booking confirmed webhook"""
         await WebhookService.send_webhook(
             partner=partner,
             event_type=WebhookEvent.BOOKING_CONFIRMED,
-            payload=booking_data
+            payload=booking_data,
+            http_client=http_client
         )
     
     @staticmethod
-    async def notify_booking_cancelled(partner: Partner, booking_data: Dict[str, Any]):
+    async def notify_booking_cancelled(
+        partner: Partner,
+        booking_data: Dict[str, Any],
+        http_client: Optional[httpx.AsyncClient] = None
+    ):
         """Send booking cancelled webhook"""
         await WebhookService.send_webhook(
             partner=partner,
             event_type=WebhookEvent.BOOKING_CANCELLED,
-            payload=booking_data
+            payload=booking_data,
+            http_client=http_client
         )
     
     @staticmethod
-    async def notify_payment_success(partner: Partner, payment_data: Dict[str, Any]):
+    async def notify_payment_success(
+        partner: Partner,
+        payment_data: Dict[str, Any],
+        http_client: Optional[httpx.AsyncClient] = None
+    ):
         """Send payment success webhook"""
         await WebhookService.send_webhook(
             partner=partner,
             event_type=WebhookEvent.PAYMENT_SUCCESS,
-            payload=payment_data
+            payload=payment_data,
+            http_client=http_client
         )
     
     @staticmethod
-    async def notify_payment_failed(partner: Partner, payment_data: Dict[str, Any]):
+    async def notify_payment_failed(
+        partner: Partner,
+        payment_data: Dict[str, Any],
+        http_client: Optional[httpx.AsyncClient] = None
+    ):
         """Send payment failed webhook"""
         await WebhookService.send_webhook(
             partner=partner,
             event_type=WebhookEvent.PAYMENT_FAILED,
-            payload=payment_data
+            payload=payment_data,
+            http_client=http_client
         )
     
     @staticmethod
-    async def notify_ticket_generated(partner: Partner, ticket_data: Dict[str, Any]):
+    async def notify_ticket_generated(
+        partner: Partner,
+        ticket_data: Dict[str, Any],
+        http_client: Optional[httpx.AsyncClient] = None
+    ):
         """Send ticket generated webhook"""
         await WebhookService.send_webhook(
             partner=partner,
             event_type=WebhookEvent.TICKET_GENERATED,
-            payload=ticket_data
+            payload=ticket_data,
+            http_client=http_client
         )
+
+
+def get_webhook_http_client(request: Request) -> httpx.AsyncClient:
+    """FastAPI dependency returning the app-wide HTTP client for webhook delivery"""
+    return request.app.state.http_client
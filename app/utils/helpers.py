@@ -2,16 +2,21 @@
 Utility functions
 """
 import secrets
-import string
+import time
 from datetime import datetime, timedelta
-from typing import Optional
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Optional, Union
 
 
 def generate_reference(prefix: str = "REF") -> str:
-    """Generate a unique reference code"""
-    timestamp = datetime.utcnow().strftime("%Y%m%d%H%M%S")
-    random_part = ''.join(secrets.choice(string.ascii_uppercase + string.digits) for _ in range(6))
-    return f"{prefix}-{timestamp}-{random_part}"
+    """
+    Generate a unique, time-ordered reference code (uuid7-style layout: 48-bit
+    millisecond timestamp + 80 random bits, as 32 hex chars). New references
+    always land at the right edge of the unique index instead of at random pages,
+    and two in the same millisecond collide with probability 2**-80
+    """
+    millis = time.time_ns() // 1_000_000
+    return f"{prefix}-{millis:012X}{secrets.randbits(80):020X}"
 
 
 def generate_api_key() -> str:
@@ -24,14 +29,24 @@ def generate_api_secret() -> str:
     return secrets.token_urlsafe(48)
 
 
-def calculate_commission(amount: float, percentage: float) -> float:
-    """Calculate commission amount"""
-    return round(amount * (percentage / 100), 2)
+def to_kobo(amount: Union[int, float, str, Decimal]) -> int:
+    """Convert a major-unit amount (e.g. naira from a provider) to integer kobo"""
+    return int((Decimal(str(amount)) * 100).to_integral_value(ROUND_HALF_UP))
 
 
-def format_currency(amount: float, currency: str = "NGN") -> str:
-    """Format currency amount"""
-    return f"{currency} {amount:,.2f}"
+def from_kobo(amount_kobo: int) -> float:
+    """Convert integer kobo to major units, for display only"""
+    return amount_kobo / 100
+
+
+def calculate_commission(amount_kobo: int, percentage: float) -> int:
+    """Calculate commission amount in kobo"""
+    return round(amount_kobo * percentage / 100)
+
+
+def format_currency(amount_kobo: int, currency: str = "NGN") -> str:
+    """Format a kobo amount in major units"""
+    return f"{currency} {from_kobo(amount_kobo):,.2f}"
 
 
 def parse_phone_number(phone: str) -> str:
@@ -3,12 +3,27 @@ Main FastAPI application
 """
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from contextlib import asynccontextmanager
 import logging
-from app.core.config import settings
+import httpx
+from app.core.config import get_settings
 from app.core.database import connect_to_mongo, close_mongo_connection
-from app.routes import auth, bookings, payments, operators, partners, waitlist, partnerships, questions
+from app.core.security import warm_up
+from app.core.log_queue import start_queue_logging, stop_queue_logging
+from app.middleware.rate_limit import rate_limiter
+from app.services.usage_tracker import usage_tracker
+from app.services.travu_client import TravuAPIClient
+from app.services.nrc_client import NRCAPIClient
+from app.services.notification_service import NotificationService
+from app.services.email_service import preload_templates
+from app.services.payment_service import PaystackService
+from app.services.search_cache import SearchCache
+from app.services.operator_cache import OperatorCache
+from app.services.dashboard_cache import DashboardCache
+from app.services.partner_token_cache import PartnerTokenCache
+from app.services.partner_response_cache import PartnerResponseCache
+from app.routes import auth, bookings, payments, operators, partners, waitlist, partnerships, questions, batch
 
 # Configure logging
 logging.basicConfig(
@@ -17,21 +32,59 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+settings = get_settings()
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan events"""
     # Startup
+    log_listener = start_queue_logging()
     logger.info("Starting Ovu Transport Aggregator...")
     await connect_to_mongo()
     logger.info("Connected to MongoDB")
+    await rate_limiter.connect()
+    usage_tracker.start()
+    await warm_up()
+    preload_templates()
+    
+    # Provider, Paystack and webhook calls share one keep-alive connection pool for the app's lifetime
+    http_client = httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+    )
+    app.state.http_client = http_client
+    app.state.travu_client = TravuAPIClient(http_client)
+    app.state.nrc_client = NRCAPIClient(http_client)
+    app.state.paystack_service = PaystackService(http_client)
+    app.state.notification_service = NotificationService()
+    # Caches reuse the rate limiter's Redis pool and are skipped when Redis is down
+    cache_redis = rate_limiter.redis if rate_limiter.enabled else None
+    app.state.search_cache = SearchCache(
+        cache_redis, ttl_seconds=settings.SEARCH_CACHE_TTL_SECONDS
+    )
+    app.state.operator_cache = OperatorCache(
+        cache_redis, ttl_seconds=settings.OPERATOR_CACHE_TTL_SECONDS
+    )
+    app.state.dashboard_cache = DashboardCache(
+        cache_redis, ttl_seconds=settings.DASHBOARD_CACHE_TTL_SECONDS
+    )
+    app.state.partner_token_cache = PartnerTokenCache(
+        cache_redis, ttl_seconds=settings.PARTNER_STATUS_CACHE_TTL_SECONDS
+    )
+    app.state.partner_response_cache = PartnerResponseCache(
+        cache_redis, ttl_seconds=settings.PARTNER_RESPONSE_CACHE_TTL_SECONDS
+    )
     
     yield
     
     # Shutdown
     logger.info("Shutting down Ovu Transport Aggregator...")
+    await http_client.aclose()
+    await usage_tracker.stop()
+    await rate_limiter.close()
     await close_mongo_connection()
     logger.info("Closed MongoDB connection")
+    stop_queue_logging(log_listener)
 
 
 # Create FastAPI app
@@ -42,6 +95,7 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 
@@ -102,6 +156,7 @@ app.include_router(bookings.router, prefix="/api/v1")
 app.include_router(payments.router, prefix="/api/v1")
 app.include_router(operators.router, prefix="/api/v1")
 app.include_router(partners.router)
+app.include_router(batch.router)
 
 # Partner authentication routes
 from app.routes import partner_auth
@@ -0,0 +1,34 @@
+"""
+One-off migration: store webhook_secret_preview on partners that already
+have a webhook_secret
+
+Run once per environment after deploying the webhook_secret_preview field:
+
+    python -m scripts.backfill_webhook_secret_preview
+
+Only partners still missing the preview are matched, so re-running is a no-op.
+"""
+import asyncio
+from motor.motor_asyncio import AsyncIOMotorClient
+from app.core.config import get_settings
+
+
+async def migrate() -> None:
+    settings = get_settings()
+    client = AsyncIOMotorClient(settings.MONGODB_URL)
+    db = client[settings.MONGODB_DB_NAME]
+
+    try:
+        result = await db["partners"].update_many(
+            {"webhook_secret": {"$type": "string"}, "webhook_secret_preview": {"$exists": False}},
+            [{"$set": {"webhook_secret_preview": {
+                "$concat": [{"$substrCP": ["$webhook_secret", 0, 8]}, "..."]
+            }}}],
+        )
+        print(f"partners: {result.modified_count} migrated")
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(migrate())
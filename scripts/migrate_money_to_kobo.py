@@ -0,0 +1,74 @@
+"""
+One-off migration: float money fields -> integer kobo (*_kobo) fields
+
+Run once per environment after deploying the *_kobo models:
+
+    python -m scripts.migrate_money_to_kobo
+
+Each update only matches documents that still carry the old field, so
+re-running is a no-op.
+"""
+import asyncio
+from motor.motor_asyncio import AsyncIOMotorClient
+from app.core.config import get_settings
+
+BOOKING_COLLECTIONS = ("bookings", "flight_bookings", "bus_bookings", "train_bookings")
+BOOKING_FIELDS = ("base_price", "tax", "service_fee", "total_price")
+
+
+def _to_kobo(field: str) -> dict:
+    """Aggregation expression rounding a naira field to whole kobo"""
+    return {"$toLong": {"$round": [{"$multiply": [f"${field}", 100]}, 0]}}
+
+
+def _rename_pipeline(fields) -> list:
+    return [
+        {"$set": {f"{field}_kobo": _to_kobo(field) for field in fields}},
+        {"$unset": list(fields)},
+    ]
+
+
+async def migrate() -> None:
+    settings = get_settings()
+    client = AsyncIOMotorClient(settings.MONGODB_URL)
+    db = client[settings.MONGODB_DB_NAME]
+
+    try:
+        for name in BOOKING_COLLECTIONS:
+            result = await db[name].update_many(
+                {"total_price": {"$exists": True}}, _rename_pipeline(BOOKING_FIELDS)
+            )
+            print(f"{name}: {result.modified_count} migrated")
+
+        for name in ("payments", "transactions"):
+            result = await db[name].update_many(
+                {"amount": {"$exists": True}}, _rename_pipeline(("amount",))
+            )
+            print(f"{name}: {result.modified_count} migrated")
+
+        # Fixed-amount split shares live inside the payments' split_config array
+        result = await db["payments"].update_many(
+            {"split_config.share_amount": {"$exists": True}},
+            [{"$set": {"split_config": {"$map": {
+                "input": "$split_config",
+                "as": "split",
+                "in": {"$mergeObjects": [
+                    {"$arrayToObject": {"$filter": {
+                        "input": {"$objectToArray": "$$split"},
+                        "cond": {"$ne": ["$$this.k", "share_amount"]},
+                    }}},
+                    {"share_amount_kobo": {"$cond": [
+                        {"$eq": [{"$ifNull": ["$$split.share_amount", None]}, None]},
+                        None,
+                        {"$toLong": {"$round": [{"$multiply": ["$$split.share_amount", 100]}, 0]}},
+                    ]}},
+                ]},
+            }}}}],
+        )
+        print(f"payments split_config: {result.modified_count} migrated")
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(migrate())
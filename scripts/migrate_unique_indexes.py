@@ -0,0 +1,115 @@
+"""
+Migration: replace the plain reference/code/email indexes with unique ones
+
+Earlier releases indexed these fields without a unique constraint, under
+MongoDB's default names (booking_reference_1, email_1, ...). The models now
+declare the same indexes as unique, and MongoDB refuses to build an index
+whose keys match an existing one with different options, so startup index
+sync fails until the old index is replaced. For every unique index declared
+on a model this:
+
+1. reports values stored more than once; with --delete-duplicates it keeps
+   the oldest document per value and deletes the rest,
+2. drops any other index on the same keys,
+3. creates the unique index.
+
+Collections that still hold duplicates are skipped and the script exits
+non-zero, so a deploy stops before the app would fail to start. Runs as the
+fly.io release_command; collections already migrated are left alone:
+
+    python -m scripts.migrate_unique_indexes [--delete-duplicates]
+"""
+import asyncio
+import sys
+from typing import Iterator, List, Tuple
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorCollection
+from pymongo import IndexModel
+from app.core.config import get_settings
+from app.models.user import User
+from app.models.booking import Booking, FlightBooking, BusBooking, TrainBooking
+from app.models.payment import Payment, Transaction
+from app.models.ticket import Ticket
+from app.models.operator import Operator
+from app.models.partner import Partner
+from app.models.api_key import APIKey
+from app.models.waitlist import WaitlistSubscription
+from app.models.partners import PartnershipInterest
+
+MODELS = (
+    User, Booking, FlightBooking, BusBooking, TrainBooking, Payment, Transaction,
+    Ticket, Operator, Partner, APIKey, WaitlistSubscription, PartnershipInterest,
+)
+
+
+def unique_indexes() -> Iterator[Tuple[str, IndexModel]]:
+    """(collection, index) for every unique index the models declare"""
+    for model in MODELS:
+        for index in model.Settings.indexes:
+            if isinstance(index, IndexModel) and index.document.get("unique"):
+                yield model.Settings.name, index
+
+
+async def _duplicates(collection: AsyncIOMotorCollection, fields: List[str]) -> list:
+    """Groups of _ids (oldest first) sharing one value of the index keys"""
+    cursor = collection.aggregate([
+        {"$group": {
+            "_id": {field: f"${field}" for field in fields},
+            "ids": {"$push": "$_id"},
+            "count": {"$sum": 1},
+        }},
+        {"$match": {"count": {"$gt": 1}}},
+    ], allowDiskUse=True)
+    return [(group["_id"], sorted(group["ids"])) async for group in cursor]
+
+
+async def migrate_index(
+    collection: AsyncIOMotorCollection, index: IndexModel, delete_duplicates: bool
+) -> bool:
+    """Make one declared index unique; False if duplicates block it"""
+    name = index.document["name"]
+    keys = list(index.document["key"].items())
+    existing = await collection.index_information()
+
+    if existing.get(name, {}).get("unique") and existing[name]["key"] == keys:
+        print(f"{collection.name}.{name}: already unique")
+        return True
+
+    duplicates = await _duplicates(collection, [field for field, _ in keys])
+    if duplicates and not delete_duplicates:
+        for value, ids in duplicates:
+            print(f"{collection.name}.{name}: {value} stored {len(ids)} times ({ids})")
+        return False
+    for _, ids in duplicates:
+        await collection.delete_many({"_id": {"$in": ids[1:]}})
+    if duplicates:
+        print(f"{collection.name}.{name}: deleted duplicates of {len(duplicates)} values")
+
+    for other, info in existing.items():
+        if info["key"] == keys:
+            await collection.drop_index(other)
+            print(f"{collection.name}.{other}: dropped")
+
+    await collection.create_indexes([index])
+    print(f"{collection.name}.{name}: created unique")
+    return True
+
+
+async def migrate(delete_duplicates: bool = False) -> bool:
+    settings = get_settings()
+    client = AsyncIOMotorClient(settings.MONGODB_URL)
+    db = client[settings.MONGODB_DB_NAME]
+
+    ok = True
+    try:
+        for collection, index in unique_indexes():
+            ok &= await migrate_index(db[collection], index, delete_duplicates)
+    finally:
+        client.close()
+
+    if not ok:
+        print("Duplicates found; resolve them or re-run with --delete-duplicates")
+    return ok
+
+
+if __name__ == "__main__":
+    sys.exit(0 if asyncio.run(migrate("--delete-duplicates" in sys.argv[1:])) else 1)
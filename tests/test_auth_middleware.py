@@ -0,0 +1,93 @@
+"""
+Unit tests for the authenticated-user cache
+"""
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from bson import ObjectId
+from fastapi.security import HTTPAuthorizationCredentials
+from pydantic import ValidationError
+from app.core.security import create_access_token
+from app.middleware import auth as auth_middleware
+from app.models.user import UserProjection, UserRole
+from app.routes import auth as auth_routes
+from app.schemas.auth import UserLogin, UserRegister
+
+
+def _projection(user_id: ObjectId) -> UserProjection:
+    return UserProjection(
+        id=user_id, email="ada@ovu.ng", first_name="Ada", last_name="Obi",
+        role=UserRole.CUSTOMER, is_active=True, is_verified=False,
+    )
+
+
+def _credentials(user_id: ObjectId) -> HTTPAuthorizationCredentials:
+    token = create_access_token(data={"sub": str(user_id)})
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+
+def _stored_user(user_id: ObjectId):
+    # Stand-in for a User document (Beanie needs init_beanie to build real ones)
+    user = MagicMock(id=user_id, email="ada@ovu.ng", is_active=True, role="customer")
+    user.save = AsyncMock()
+    return user
+
+
+@pytest.fixture(autouse=True)
+def empty_user_cache():
+    auth_middleware._user_cache.clear()
+    yield
+    auth_middleware._user_cache.clear()
+
+
+class TestUserCache:
+    """Test suite for get_current_user caching"""
+
+    @pytest.mark.asyncio
+    async def test_cached_user_is_shared_read_only(self):
+        """Test repeat requests reuse one frozen projection that can't be modified"""
+        uid = ObjectId()
+        user_model = MagicMock()
+        user_model.find_one.return_value.project = AsyncMock(return_value=_projection(uid))
+
+        with patch.object(auth_middleware, "User", user_model):
+            first = await auth_middleware.get_current_user(_credentials(uid))
+            second = await auth_middleware.get_current_user(_credentials(uid))
+
+        assert first is second
+        user_model.find_one.return_value.project.assert_awaited_once_with(UserProjection)
+        with pytest.raises(ValidationError):
+            first.role = UserRole.ADMIN
+        assert not hasattr(first, "password_hash")
+
+    @pytest.mark.asyncio
+    async def test_login_invalidates_cached_user(self):
+        """Test logging in drops the user's cached projection"""
+        uid = ObjectId()
+        auth_middleware._user_cache[str(uid)] = _projection(uid)
+        user_model = MagicMock()
+        user_model.find_one = AsyncMock(return_value=_stored_user(uid))
+
+        with patch.object(auth_routes, "User", user_model), \
+                patch.object(auth_routes, "verify_password_async", AsyncMock(return_value=True)):
+            await auth_routes.login(UserLogin(email="ada@ovu.ng", password="Secret123!"))
+
+        assert str(uid) not in auth_middleware._user_cache
+
+    @pytest.mark.asyncio
+    async def test_register_invalidates_cached_user(self):
+        """Test creating a user drops any cached projection under its id"""
+        uid = ObjectId()
+        auth_middleware._user_cache[str(uid)] = _projection(uid)
+        user_model = MagicMock(return_value=_stored_user(uid))
+        user_model.find_one = AsyncMock(return_value=None)
+        notification_service = MagicMock()
+        notification_service.email_service.send_welcome_email = AsyncMock()
+        registration = UserRegister(
+            email="ada@ovu.ng", password="Secret123!", first_name="Ada", last_name="Obi",
+        )
+
+        with patch.object(auth_routes, "User", user_model), \
+                patch.object(auth_routes, "UserResponse", MagicMock()):
+            await auth_routes.register(registration, notification_service)
+
+        assert str(uid) not in auth_middleware._user_cache
@@ -248,7 +248,7 @@ class TestUsageAnalyticsEndpoints:
         assert "partner_name" in data
         assert "total_requests" in data
         assert "total_bookings" in data
-        assert "total_revenue" in data
+        assert "total_revenue_kobo" in data
         assert "daily_stats" in data
         assert "active_api_keys" in data
         assert "total_api_keys" in data
@@ -0,0 +1,114 @@
+"""
+Unit tests for JSON batching
+"""
+import asyncio
+import httpx
+import pytest
+from fastapi import FastAPI, Header
+from pydantic import ValidationError
+from app.routes import batch
+from app.middleware.auth import verify_partner_api_key
+from app.schemas.batch import BatchRequest
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+    app.include_router(batch.router)
+    app.dependency_overrides[verify_partner_api_key] = lambda: object()
+    in_flight = {"now": 0, "peak": 0}
+    app.state.in_flight = in_flight
+
+    @app.post("/api/v1/echo", status_code=201)
+    async def echo(body: dict):
+        in_flight["now"] += 1
+        in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+        await asyncio.sleep(0.01)
+        in_flight["now"] -= 1
+        return body
+
+    @app.get("/api/v1/whoami")
+    async def whoami(x_api_key: str = Header(None)):
+        return {"api_key": x_api_key}
+
+    return app
+
+
+async def _post_batch(app: FastAPI, requests):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await client.post(
+            "/api/v1/batch", json={"requests": requests}, headers={"X-API-Key": "ovu_key"}
+        )
+
+
+class TestBatch:
+    """Test suite for the batch endpoint"""
+
+    @pytest.mark.asyncio
+    async def test_responses_in_request_order(self):
+        """Test every call is answered under its id, in order, with its own status"""
+        response = await _post_batch(_app(), [
+            {"id": "1", "method": "POST", "url": "/echo", "body": {"n": 1}},
+            {"id": "2", "method": "GET", "url": "/missing"},
+            {"id": "3", "method": "GET", "url": "/whoami"},
+        ])
+
+        assert response.status_code == 200
+        items = response.json()["responses"]
+        assert [(i["id"], i["status"]) for i in items] == [("1", 201), ("2", 404), ("3", 200)]
+        assert items[0]["body"] == {"n": 1}
+
+    @pytest.mark.asyncio
+    async def test_credentials_forwarded_unless_overridden(self):
+        """Test the batch's API key reaches each call and item headers win"""
+        response = await _post_batch(_app(), [
+            {"id": "a", "method": "GET", "url": "/whoami"},
+            {"id": "b", "method": "GET", "url": "/whoami", "headers": {"X-API-Key": "other"}},
+        ])
+
+        bodies = [i["body"] for i in response.json()["responses"]]
+        assert bodies == [{"api_key": "ovu_key"}, {"api_key": "other"}]
+
+    @pytest.mark.asyncio
+    async def test_calls_dispatched_concurrently(self):
+        """Test batched calls overlap instead of running back to back"""
+        app = _app()
+
+        await _post_batch(app, [
+            {"id": str(i), "method": "POST", "url": "/echo", "body": {}} for i in range(3)
+        ])
+
+        assert app.state.in_flight["peak"] == 3
+
+    def test_rejects_nested_and_absolute_urls(self):
+        """Test a batch can't call itself or leave the API"""
+        for url in (
+            "/batch", "/x/../batch", "/./batch", "/%62atch", "/batch#x",
+            "//evil.example/x", "https://evil.example/x",
+        ):
+            with pytest.raises(ValidationError):
+                BatchRequest(requests=[{"id": "1", "method": "GET", "url": url}])
+
+    @pytest.mark.asyncio
+    async def test_nested_batch_refused_at_dispatch(self):
+        """Test the batch endpoint refuses calls dispatched from another batch"""
+        app = _app()
+        # model_construct skips the url validator so the endpoint's own guard is reached
+        item = batch.BatchRequestItem.model_construct(
+            id="1", method="POST", url="/batch", headers={},
+            body={"requests": [{"id": "x", "method": "GET", "url": "/whoami"}]},
+        )
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            result = await batch._dispatch(client, item, {"x-api-key": "ovu_key"})
+
+        assert result.status == 400
+        assert result.body == {"detail": "Batches cannot be nested"}
+
+    def test_rejects_duplicate_ids(self):
+        """Test each response id maps to exactly one request"""
+        with pytest.raises(ValidationError):
+            BatchRequest(requests=[
+                {"id": "1", "method": "GET", "url": "/whoami"},
+                {"id": "1", "method": "GET", "url": "/whoami"},
+            ])
@@ -0,0 +1,69 @@
+"""
+Unit tests for booking persistence helpers
+"""
+import json
+import pytest
+from datetime import datetime
+from unittest.mock import AsyncMock, patch
+from bson import ObjectId
+from app.models.booking import FlightBooking, BusBooking, BookingStatus, TransportType
+from app.schemas.booking import TransportType as SchemaTransportType
+from app.core.responses import MsgspecResponse
+from app.services.booking_service import BookingService
+
+
+def _flight_booking(booking_id: ObjectId) -> FlightBooking:
+    return FlightBooking.model_construct(
+        id=booking_id,
+        booking_reference="BKG-1",
+        user_id="user-1",
+        transport_type=TransportType.FLIGHT,
+        status=BookingStatus.PENDING,
+        origin="Lagos",
+        destination="Abuja",
+        departure_date=datetime(2025, 1, 15, 8, 0),
+        total_passengers=2,
+        total_price_kobo=9_400_000,
+        currency="NGN",
+        created_at=datetime(2025, 1, 1),
+    )
+
+
+class TestBookingService:
+    """Test suite for BookingService"""
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_groups_by_collection(self):
+        """Test each booking type is inserted with a single insert_many"""
+        flights = [
+            FlightBooking.model_construct(booking_reference="BKG-1"),
+            FlightBooking.model_construct(booking_reference="BKG-2"),
+        ]
+        bus = BusBooking.model_construct(booking_reference="BKG-3")
+
+        with patch.object(FlightBooking, "insert_many", AsyncMock()) as flight_insert, \
+             patch.object(BusBooking, "insert_many", AsyncMock()) as bus_insert:
+            await BookingService.bulk_create([flights[0], bus, flights[1]])
+
+        flight_insert.assert_awaited_once_with(flights)
+        bus_insert.assert_awaited_once_with([bus])
+
+    def test_to_response_maps_booking_fields(self):
+        """Test a stored booking maps onto BookingResponse without re-validation"""
+        booking_id = ObjectId()
+        booking = _flight_booking(booking_id)
+
+        response = BookingService.to_response(booking)
+
+        assert response.id == str(booking_id)
+        assert response.transport_type is SchemaTransportType.FLIGHT
+        assert response.model_dump(mode="json")["status"] == "pending"
+        assert response.total_price_kobo == 9_400_000
+
+    def test_struct_renders_same_json_as_response(self):
+        """Test the msgspec DTO serializes identically to BookingResponse"""
+        booking = _flight_booking(ObjectId())
+
+        rendered = MsgspecResponse(BookingService.to_struct(booking)).body
+
+        assert json.loads(rendered) == BookingService.to_response(booking).model_dump(mode="json")
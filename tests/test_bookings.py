@@ -2,6 +2,10 @@
 Test booking endpoints
 """
 import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from bson import ObjectId
+from fastapi import BackgroundTasks
+from app.routes import bookings, partners
 
 
 @pytest.mark.asyncio
@@ -23,3 +27,37 @@ async def test_get_bookings():
     """Test getting user bookings"""
     # Placeholder test
     assert True
+
+
+class TestDashboardInvalidation:
+    """Test booking writes drop the operator's cached dashboard"""
+
+    @pytest.mark.asyncio
+    async def test_cancel_invalidates_operator_dashboard(self):
+        """Test cancelling a booking invalidates its operator's dashboard"""
+        model = MagicMock()
+        model.find_one.return_value.update = AsyncMock(return_value=MagicMock(operator_id="op1"))
+        dashboard_cache = AsyncMock()
+
+        with patch.object(bookings, "_BOOKING_MODELS", (model,)), \
+                patch.object(bookings, "_user_booking_filters", return_value=[]):
+            result = await bookings.cancel_booking(str(ObjectId()), MagicMock(), dashboard_cache)
+
+        assert result == {"message": "Booking cancelled successfully"}
+        dashboard_cache.invalidate.assert_awaited_once_with("op1")
+
+    @pytest.mark.asyncio
+    async def test_partner_booking_invalidates_operator_dashboard(self):
+        """Test a partner-created booking invalidates its operator's dashboard"""
+        booking_model = MagicMock()
+        booking_model.return_value = MagicMock(operator_id="op1", insert=AsyncMock())
+        dashboard_cache = AsyncMock()
+        booking_data = MagicMock(passengers=[MagicMock()])
+
+        with patch.object(partners, "Booking", booking_model), \
+                patch.object(partners, "BookingService", MagicMock()):
+            await partners.partner_create_booking(
+                booking_data, BackgroundTasks(), MagicMock(), MagicMock(), dashboard_cache
+            )
+
+        dashboard_cache.invalidate.assert_awaited_once_with("op1")
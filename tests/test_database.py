@@ -0,0 +1,37 @@
+"""
+Unit tests for the per-loop MongoDB client registry
+"""
+import asyncio
+import pytest
+from app.core.database import Database
+
+
+class TestDatabase:
+    """Test suite for Database client registry"""
+
+    @pytest.mark.asyncio
+    async def test_client_reused_within_loop(self):
+        """Test repeated lookups on one loop share a single client"""
+        database = Database()
+        assert database.client is None
+
+        client = database.get_client()
+        assert database.get_client() is client
+        assert database.client is client
+
+        database.close_client()
+        assert database.client is None
+
+    def test_each_loop_gets_own_client(self):
+        """Test clients are not shared across event loops"""
+        database = Database()
+
+        async def lookup():
+            return database.get_client()
+
+        first = asyncio.run(lookup())
+        second = asyncio.run(lookup())
+
+        assert first is not second
+        first.close()
+        second.close()
@@ -3,7 +3,7 @@ Tests for email service
 """
 import pytest
 from unittest.mock import Mock, patch, AsyncMock
-from app.services.email_service import EmailService
+from app.services.email_service import EMAIL_TEMPLATES, EmailService, preload_templates
 from app.services.notification_service import NotificationService
 
 
@@ -13,7 +13,8 @@ class TestEmailService:
     @pytest.fixture
     def email_service(self):
         """Create email service instance for testing"""
-        with patch('app.services.email_service.settings') as mock_settings:
+        with patch('app.services.email_service.get_settings') as get_settings:
+            mock_settings = get_settings.return_value
             mock_settings.RESEND_API_KEY = "test_api_key"
             mock_settings.RESEND_FROM_EMAIL = "test@example.com"
             service = EmailService()
@@ -29,6 +30,23 @@ class TestEmailService:
         template = email_service._load_template('welcome')
         assert template is not None
     
+    def test_templates_shared_across_instances(self, email_service):
+        """Test a template is parsed once and reused by every EmailService"""
+        with patch('app.services.email_service.get_settings'):
+            other = EmailService()
+        assert other._load_template('welcome') is email_service._load_template('welcome')
+    
+    def test_preload_covers_every_template(self, email_service):
+        """Test startup preloading compiles each template the service renders"""
+        preload_templates()
+        for name in EMAIL_TEMPLATES:
+            assert email_service._load_template(name) is not None
+    
+    def test_missing_template(self, email_service):
+        """Test an unknown template name raises FileNotFoundError"""
+        with pytest.raises(FileNotFoundError):
+            email_service._load_template('does_not_exist')
+    
     def test_render_template(self, email_service):
         """Test template rendering"""
         context = {
@@ -206,6 +224,22 @@ class TestEmailService:
             )
             
             assert result is False
+    
+    def test_render_message(self, email_service):
+        """Test render_message returns send_email's arguments with a formatted subject"""
+        message = email_service.render_message('ticket', "p1@example.com", {
+            'customer_name': "Passenger 1",
+            'ticket_number': "TKT1",
+            'booking_reference': "BKG123456",
+            'origin': "Lagos",
+            'destination': "Abuja",
+            'departure_date': "2025-01-15 08:00",
+            'ticket_url': "https://example.com/ticket",
+        })
+        
+        assert set(message) == {"to_email", "subject", "html_content"}
+        assert message["subject"] == "Your E-Ticket - TKT1"
+        assert "Passenger 1" in message["html_content"]
 
 
 class TestNotificationService:
@@ -214,7 +248,7 @@ class TestNotificationService:
     @pytest.fixture
     def notification_service(self):
         """Create notification service instance for testing"""
-        with patch('app.services.notification_service.settings'):
+        with patch('app.services.notification_service.get_settings'):
             service = NotificationService()
             service.email_service = Mock()
             return service
@@ -236,7 +270,7 @@ class TestNotificationService:
                 "destination": "Abuja",
                 "departure_date": "2024-01-15 10:00",
                 "total_passengers": 2,
-                "total_price": 50000.0,
+                "total_price_kobo": 5_000_000,
             }
         )
         
@@ -251,13 +285,14 @@ class TestNotificationService:
         await notification_service.send_payment_notification(
             email="user@example.com",
             payment_reference="PAY123456",
-            amount=50000.0,
+            amount_kobo=5_000_000,
             status="success",
             booking_reference="BKG123456",
             customer_name="John Doe",
         )
         
         notification_service.email_service.send_payment_success.assert_called_once()
+        assert notification_service.email_service.send_payment_success.call_args.kwargs["amount"] == 50000.0
     
     @pytest.mark.asyncio
     async def test_send_payment_notification_failed(self, notification_service):
@@ -267,7 +302,7 @@ class TestNotificationService:
         await notification_service.send_payment_notification(
             email="user@example.com",
             payment_reference="PAY123456",
-            amount=50000.0,
+            amount_kobo=5_000_000,
             status="failed",
             booking_reference="BKG123456",
             customer_name="John Doe",
@@ -0,0 +1,49 @@
+"""
+Unit tests for utility helpers
+"""
+from unittest.mock import patch
+from app.utils.helpers import format_currency, generate_reference, to_kobo
+
+
+class TestGenerateReference:
+    """Test suite for generate_reference"""
+
+    def test_format(self):
+        """Test references are the prefix plus 32 uppercase hex chars"""
+        reference = generate_reference("BKG")
+
+        prefix, body = reference.split("-")
+        assert prefix == "BKG"
+        assert len(body) == 32
+        assert body == body.upper()
+        int(body, 16)
+
+    def test_time_ordered(self):
+        """Test references from later milliseconds sort after earlier ones"""
+        with patch("app.utils.helpers.time.time_ns", return_value=1_700_000_000_000_000_000):
+            earlier = generate_reference("BKG")
+        with patch("app.utils.helpers.time.time_ns", return_value=1_700_000_000_001_000_000):
+            later = generate_reference("BKG")
+
+        assert earlier < later
+
+    def test_unique_within_a_millisecond(self):
+        """Test references minted in the same millisecond differ by their random bits"""
+        with patch("app.utils.helpers.time.time_ns", return_value=1_700_000_000_000_000_000):
+            references = {generate_reference("BKG") for _ in range(10_000)}
+
+        assert len(references) == 10_000
+
+
+class TestMoneyHelpers:
+    """Test suite for kobo conversion helpers"""
+
+    def test_to_kobo_rounds_to_nearest(self):
+        """Test float and string naira amounts convert without float drift"""
+        assert to_kobo(45000.0) == 4_500_000
+        assert to_kobo("19.99") == 1999
+        assert to_kobo(0.295) == 30
+
+    def test_format_currency(self):
+        """Test kobo amounts format in major units"""
+        assert format_currency(4_712_550) == "NGN 47,125.50"
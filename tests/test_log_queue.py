@@ -0,0 +1,43 @@
+"""
+Unit tests for queue-based logging setup
+"""
+import logging
+from logging.handlers import QueueHandler
+from app.core.log_queue import start_queue_logging, stop_queue_logging
+
+
+class _Collecting(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+class TestQueueLogging:
+    """Test suite for start/stop_queue_logging"""
+
+    def test_records_reach_original_handlers(self):
+        """Test root handlers move behind the queue and get restored on stop"""
+        root = logging.getLogger()
+        saved = list(root.handlers)
+        for handler in saved:
+            root.removeHandler(handler)
+        collector = _Collecting()
+        root.addHandler(collector)
+
+        try:
+            listener = start_queue_logging()
+            assert [type(h) for h in root.handlers] == [QueueHandler]
+            assert start_queue_logging() is None
+
+            logging.getLogger("ovu.test").warning("queued %s", "record")
+            stop_queue_logging(listener)
+
+            assert collector.messages == ["queued record"]
+            assert root.handlers == [collector]
+        finally:
+            root.removeHandler(collector)
+            for handler in saved:
+                root.addHandler(handler)
@@ -0,0 +1,73 @@
+"""
+Unit tests for the operator lookup cache
+"""
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from bson import ObjectId
+from app.models.operator import OperatorProjection, OperatorStatus, OperatorType
+from app.services.operator_cache import OperatorCache
+
+
+def _operator() -> OperatorProjection:
+    return OperatorProjection(
+        id=ObjectId(),
+        name="GUO Transport",
+        operator_code="GUO",
+        operator_type=OperatorType.BUS_COMPANY,
+        status=OperatorStatus.ACTIVE,
+        commission_percentage=10.0,
+    )
+
+
+def _operator_model(found):
+    # Field expressions like Operator.operator_code need an initialized Beanie,
+    # so stand in for the whole model
+    model = MagicMock()
+    model.find_one.return_value.project = AsyncMock(return_value=found)
+    return model
+
+
+class TestOperatorCache:
+    """Test suite for OperatorCache"""
+
+    @pytest.mark.asyncio
+    async def test_miss_loads_and_caches(self):
+        """Test a miss reads Mongo once and the next lookup is served from Redis"""
+        store = {}
+        redis = AsyncMock()
+        redis.setex.side_effect = lambda key, ttl, value: store.__setitem__(key, value)
+        redis.get.side_effect = lambda key: store.get(key)
+        cache = OperatorCache(redis, ttl_seconds=120)
+        operator = _operator()
+        model = _operator_model(operator)
+
+        with patch("app.services.operator_cache.Operator", model):
+            first = await cache.get("GUO")
+            second = await cache.get("GUO")
+
+        assert first == operator
+        assert second.model_dump() == operator.model_dump()
+        assert model.find_one.call_count == 1
+        assert redis.setex.call_args.args[:2] == ("operator:GUO", 120)
+
+    @pytest.mark.asyncio
+    async def test_redis_error_falls_back_to_db(self):
+        """Test Redis failures are treated as a miss"""
+        redis = AsyncMock()
+        redis.get.side_effect = ConnectionError("redis down")
+        redis.setex.side_effect = ConnectionError("redis down")
+        operator = _operator()
+
+        with patch("app.services.operator_cache.Operator", _operator_model(operator)):
+            assert await OperatorCache(redis).get("GUO") == operator
+
+    @pytest.mark.asyncio
+    async def test_unknown_operator_not_cached(self):
+        """Test a missing operator returns None without writing to Redis"""
+        redis = AsyncMock()
+        redis.get.return_value = None
+
+        with patch("app.services.operator_cache.Operator", _operator_model(None)):
+            assert await OperatorCache(redis).get("NOPE") is None
+
+        redis.setex.assert_not_called()
@@ -0,0 +1,216 @@
+"""
+Unit tests for operator dashboard routes
+"""
+import orjson
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from bson import ObjectId
+from fastapi import HTTPException
+from app.models.operator import OperatorProjection, OperatorStatus, OperatorType
+from app.routes import operators
+from app.services.dashboard_cache import DashboardCache
+
+
+def _operator() -> OperatorProjection:
+    return OperatorProjection(
+        id=ObjectId(),
+        name="GUO Transport",
+        operator_code="GUO",
+        operator_type=OperatorType.BUS_COMPANY,
+        status=OperatorStatus.ACTIVE,
+        commission_percentage=10.0,
+    )
+
+
+def _json(response):
+    return orjson.loads(response.body)
+
+
+def _aggregate_returning(rows):
+    aggregate = MagicMock()
+    aggregate.return_value.to_list = AsyncMock(return_value=rows)
+    return aggregate
+
+
+def _aggregate_streaming(rows):
+    async def cursor():
+        for row in rows:
+            yield row
+
+    return MagicMock(side_effect=lambda *args, **kwargs: cursor())
+
+
+class TestOperatorDashboard:
+    """Test suite for get_dashboard"""
+
+    @pytest.mark.asyncio
+    async def test_stats_read_from_single_facet(self):
+        """Test counts and revenue come from one aggregation"""
+        aggregate = _aggregate_returning([{
+            "total": [{"n": 12}],
+            "today": [{"n": 3}],
+            "revenue": [{"_id": None, "total": 9_400_000, "today": 800_000}],
+        }])
+
+        with patch.object(operators.Booking, "aggregate", aggregate):
+            result = _json(await operators.get_dashboard(_operator(), DashboardCache(None)))
+
+        aggregate.assert_called_once()
+        assert result["stats"] == {
+            "total_bookings": 12,
+            "today_bookings": 3,
+            "total_revenue_kobo": 9_400_000,
+            "today_revenue_kobo": 800_000,
+        }
+
+    @pytest.mark.asyncio
+    async def test_empty_facets_default_to_zero(self):
+        """Test an operator with no bookings gets zeroed stats"""
+        aggregate = _aggregate_returning([{"total": [], "today": [], "revenue": []}])
+
+        with patch.object(operators.Booking, "aggregate", aggregate):
+            result = _json(await operators.get_dashboard(_operator(), DashboardCache(None)))
+
+        assert result["stats"] == {
+            "total_bookings": 0,
+            "today_bookings": 0,
+            "total_revenue_kobo": 0,
+            "today_revenue_kobo": 0,
+        }
+
+
+    @pytest.mark.asyncio
+    async def test_cached_dashboard_skips_aggregation(self):
+        """Test a cached payload is returned without querying Mongo"""
+        operator = _operator()
+        payload = {"operator": {"name": operator.name}, "stats": {"total_bookings": 5}}
+        dashboard_cache = AsyncMock()
+        dashboard_cache.get.return_value = payload
+        aggregate = _aggregate_returning([])
+
+        with patch.object(operators.Booking, "aggregate", aggregate):
+            result = _json(await operators.get_dashboard(operator, dashboard_cache))
+
+        assert result == payload
+        aggregate.assert_not_called()
+        dashboard_cache.get.assert_awaited_once_with(str(operator.id))
+
+    @pytest.mark.asyncio
+    async def test_computed_dashboard_is_cached(self):
+        """Test a freshly computed payload is stored for the operator"""
+        operator = _operator()
+        dashboard_cache = AsyncMock()
+        dashboard_cache.get.return_value = None
+        aggregate = _aggregate_returning([{"total": [], "today": [], "revenue": []}])
+
+        with patch.object(operators.Booking, "aggregate", aggregate):
+            result = _json(await operators.get_dashboard(operator, dashboard_cache))
+
+        dashboard_cache.set.assert_awaited_once_with(str(operator.id), result)
+
+
+class TestOperatorBookings:
+    """Test suite for get_operator_bookings"""
+
+    @pytest.mark.asyncio
+    async def test_page_and_total_from_single_facet(self):
+        """Test the page rows and total count come from one aggregation"""
+        row = {"id": str(ObjectId()), "booking_reference": "BKG-1", "total_price_kobo": 800_000}
+        aggregate = _aggregate_returning([{"bookings": [row], "total": [{"n": 41}]}])
+
+        with patch.object(operators.Booking, "aggregate", aggregate):
+            result = _json(await operators.get_operator_bookings(
+                _operator(), skip=20, limit=20
+            ))
+
+        aggregate.assert_called_once()
+        assert result == {"bookings": [row], "total": 41}
+
+
+class TestOperatorSales:
+    """Test suite for get_sales_analytics"""
+
+    @pytest.mark.asyncio
+    async def test_daily_rows_streamed_and_totalled(self):
+        """Test per-day rows are read from the cursor and summed as they arrive"""
+        days = [
+            {"date": "2025-01-01", "bookings": 2, "revenue_kobo": 1_600_000},
+            {"date": "2025-01-02", "bookings": 1, "revenue_kobo": 350_000},
+        ]
+        aggregate = _aggregate_streaming(days)
+
+        with patch.object(operators.Booking, "aggregate", aggregate):
+            result = _json(await operators.get_sales_analytics(_operator(), days=7))
+
+        assert result == {
+            "period_days": 7,
+            "daily_sales": days,
+            "total_bookings": 3,
+            "total_revenue_kobo": 1_950_000,
+        }
+        assert aggregate.call_args.kwargs == {"batchSize": 500}
+
+    @pytest.mark.asyncio
+    async def test_no_sales_in_period(self):
+        """Test an empty window returns zeroed totals"""
+        with patch.object(operators.Booking, "aggregate", _aggregate_streaming([])):
+            result = _json(await operators.get_sales_analytics(_operator(), days=7))
+
+        assert result == {
+            "period_days": 7,
+            "daily_sales": [],
+            "total_bookings": 0,
+            "total_revenue_kobo": 0,
+        }
+
+
+class TestGetOperator:
+    """Test suite for the get_operator dependency"""
+
+    @pytest.mark.asyncio
+    async def test_missing_operator_is_404(self):
+        """Test an operator user without an Operator record gets a 404"""
+        operator_cache = AsyncMock()
+        operator_cache.get.return_value = None
+
+        with pytest.raises(HTTPException) as exc_info:
+            await operators.get_operator(MagicMock(operator_id="NOPE"), operator_cache)
+
+        assert exc_info.value.status_code == 404
+        operator_cache.get.assert_awaited_once_with("NOPE")
+
+
+
+class TestOperatorPayouts:
+    """Test suite for get_payouts"""
+
+    @pytest.mark.asyncio
+    async def test_rows_and_total_from_single_facet(self):
+        """Test payout rows and their total come from one aggregation"""
+        rows = [
+            {"transaction_id": "TXN-2", "amount_kobo": 250_000, "status": "completed"},
+            {"transaction_id": "TXN-1", "amount_kobo": 1_000_000, "status": "completed"},
+        ]
+        transaction_model = MagicMock()
+        transaction_model.aggregate = _aggregate_returning(
+            [{"payouts": rows, "total": [{"_id": None, "amount_kobo": 1_250_000}]}]
+        )
+
+        with patch.object(operators, "Transaction", transaction_model):
+            result = _json(await operators.get_payouts(_operator()))
+
+        transaction_model.aggregate.assert_called_once()
+        assert result["payouts"] == rows
+        assert result["total_payout_kobo"] == 1_250_000
+
+    @pytest.mark.asyncio
+    async def test_no_payouts(self):
+        """Test an operator without payouts gets a zero total"""
+        transaction_model = MagicMock()
+        transaction_model.aggregate = _aggregate_returning([{"payouts": [], "total": []}])
+
+        with patch.object(operators, "Transaction", transaction_model):
+            result = _json(await operators.get_payouts(_operator()))
+
+        assert result["payouts"] == []
+        assert result["total_payout_kobo"] == 0
@@ -0,0 +1,149 @@
+"""
+Unit tests for admin partner status transitions
+"""
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from bson import ObjectId
+from fastapi import HTTPException
+from app.models.partner import PartnerStatus
+from app.routes import partner_auth
+from app.schemas.partner_auth import PartnerApprovalRequest
+from app.services.partner_token_cache import PartnerTokenCache
+from app.services.partner_response_cache import PartnerResponseCache
+
+
+def _partner_model(updated=None, current=None):
+    # Partner.get_motor_collection / model_validate need an initialized Beanie
+    model = MagicMock()
+    collection = model.get_motor_collection.return_value
+    collection.find_one_and_update = AsyncMock(return_value=updated)
+    collection.find_one = AsyncMock(return_value=current)
+    model.model_validate.side_effect = lambda doc: MagicMock(
+        id=doc["_id"], status=PartnerStatus(doc["status"]), email="ada@acme.ng"
+    )
+    return model, collection
+
+
+def _admin():
+    return MagicMock(id=ObjectId(), email="admin@ovu.ng")
+
+
+def _caches():
+    # Redis-less caches: every call is a no-op
+    return PartnerTokenCache(None), PartnerResponseCache(None)
+
+
+class TestPartnerTransitions:
+    """Test suite for approve/suspend/activate"""
+
+    @pytest.mark.asyncio
+    async def test_suspend_is_single_guarded_update(self):
+        """Test suspension is one find_one_and_update filtered on ACTIVE"""
+        pid = ObjectId()
+        model, collection = _partner_model(updated={"_id": pid, "status": "suspended"})
+
+        with patch("app.routes.partner_auth.Partner", model):
+            body = await partner_auth.suspend_partner(
+                str(pid), "Repeated abuse of the API", _admin(), *_caches()
+            )
+
+        [query, update] = collection.find_one_and_update.call_args.args
+        assert query == {"_id": pid, "status": "active"}
+        assert update["$set"]["status"] == "suspended"
+        assert update["$set"]["metadata.suspension_reason"] == "Repeated abuse of the API"
+        assert update["$currentDate"] == {"updated_at": True}
+        model.get.assert_not_called()
+        collection.find_one.assert_not_called()
+        assert body["status"] == PartnerStatus.SUSPENDED
+
+    @pytest.mark.asyncio
+    async def test_activate_sets_only_changed_fields(self):
+        """Test reactivation filters on SUSPENDED and writes only its fields"""
+        pid = ObjectId()
+        model, collection = _partner_model(updated={"_id": pid, "status": "active"})
+
+        with patch("app.routes.partner_auth.Partner", model):
+            body = await partner_auth.activate_partner(str(pid), _admin(), *_caches())
+
+        [query, update] = collection.find_one_and_update.call_args.args
+        assert query == {"_id": pid, "status": "suspended"}
+        assert set(update["$set"]) == {
+            "status", "metadata.reactivated_by", "metadata.reactivated_at"
+        }
+        assert body["status"] == PartnerStatus.ACTIVE
+
+    @pytest.mark.asyncio
+    async def test_approve_issues_credentials(self):
+        """Test approval moves PENDING_APPROVAL to ACTIVE with fresh API keys"""
+        pid = ObjectId()
+        model, collection = _partner_model(updated={"_id": pid, "status": "active"})
+        approval = PartnerApprovalRequest(action="approve", rate_limit_per_minute=120)
+
+        with patch("app.routes.partner_auth.Partner", model):
+            body = await partner_auth.approve_partner(
+                str(pid), approval, _admin(), *_caches()
+            )
+
+        [query, update] = collection.find_one_and_update.call_args.args
+        assert query == {"_id": pid, "status": "pending_approval"}
+        assert update["$set"]["api_key"] == body["api_key"]
+        assert update["$set"]["api_secret"] != body["api_secret"]
+        assert update["$set"]["rate_limit_per_minute"] == 120
+        assert "rate_limit_per_day" not in update["$set"]
+
+    @pytest.mark.asyncio
+    async def test_transitions_drop_cached_responses(self):
+        """Test every status change drops the partner's cached /me and /webhooks bodies"""
+        pid = ObjectId()
+        redis = AsyncMock()
+        response_cache = PartnerResponseCache(redis)
+        transitions = [
+            ("active", lambda: partner_auth.approve_partner(
+                str(pid), PartnerApprovalRequest(action="approve"), _admin(),
+                PartnerTokenCache(None), response_cache)),
+            ("rejected", lambda: partner_auth.approve_partner(
+                str(pid), PartnerApprovalRequest(action="reject", reason="Incomplete application"),
+                _admin(), PartnerTokenCache(None), response_cache)),
+            ("suspended", lambda: partner_auth.suspend_partner(
+                str(pid), "Repeated abuse of the API", _admin(),
+                PartnerTokenCache(None), response_cache)),
+            ("active", lambda: partner_auth.activate_partner(
+                str(pid), _admin(), PartnerTokenCache(None), response_cache)),
+        ]
+
+        for new_status, transition in transitions:
+            redis.delete.reset_mock()
+            model, _ = _partner_model(updated={"_id": pid, "status": new_status})
+            with patch("app.routes.partner_auth.Partner", model):
+                await transition()
+
+            redis.delete.assert_awaited_once_with(
+                f"partner:{pid}:me", f"partner:{pid}:webhooks"
+            )
+
+    @pytest.mark.asyncio
+    async def test_lost_race_conflicts(self):
+        """Test a partner no longer in the expected status yields 409"""
+        pid = ObjectId()
+        model, _ = _partner_model(current={"_id": pid, "status": "suspended"})
+
+        with patch("app.routes.partner_auth.Partner", model):
+            with pytest.raises(HTTPException) as exc_info:
+                await partner_auth.suspend_partner(
+                    str(pid), "Repeated abuse of the API", _admin(), *_caches()
+                )
+
+        assert exc_info.value.status_code == 409
+
+    @pytest.mark.asyncio
+    async def test_missing_partner_not_found(self):
+        """Test unknown and malformed ids yield 404"""
+        model, collection = _partner_model()
+
+        with patch("app.routes.partner_auth.Partner", model):
+            for pid in (str(ObjectId()), "not-an-id"):
+                with pytest.raises(HTTPException) as exc_info:
+                    await partner_auth.activate_partner(pid, _admin(), *_caches())
+                assert exc_info.value.status_code == 404
+
+        assert collection.find_one_and_update.await_count == 1
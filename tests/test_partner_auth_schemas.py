@@ -0,0 +1,42 @@
+"""
+Unit tests for partner auth schema validation
+"""
+import pytest
+from pydantic import ValidationError
+from app.schemas.partner import PartnerUpdate
+from app.schemas.partner_auth import ChangePasswordRequest, ResetPasswordRequest
+
+
+class TestPasswordStrength:
+    """Test suite for the shared password validator"""
+
+    def test_strong_password_accepted(self):
+        """Test a password meeting every rule passes on both request types"""
+        assert ResetPasswordRequest(token="t", new_password="Abcdef1!").new_password == "Abcdef1!"
+        assert ChangePasswordRequest(current_password="x", new_password="Abcdef1!")
+
+    @pytest.mark.parametrize("password, message", [
+        ("Ab1!", "at least 8 characters"),
+        ("abcdef1!", "uppercase letter"),
+        ("ABCDEF1!", "lowercase letter"),
+        ("Abcdefg!", "number"),
+        ("Abcdefg1", "special character"),
+    ])
+    def test_weak_password_names_failed_rule(self, password, message):
+        """Test rejections still say which rule was broken"""
+        with pytest.raises(ValidationError) as exc_info:
+            ResetPasswordRequest(token="t", new_password=password)
+
+        assert message in str(exc_info.value)
+
+
+class TestPhoneFormat:
+    """Test suite for the shared E.164 phone type"""
+
+    def test_partner_update_checks_phone(self):
+        """Test partner updates apply the same phone pattern as registration"""
+        assert PartnerUpdate(phone="+2348012345678").phone == "+2348012345678"
+        assert PartnerUpdate().phone is None
+
+        with pytest.raises(ValidationError):
+            PartnerUpdate(phone="0801-234")
@@ -1,12 +1,17 @@
 """
 Unit tests for partner service
 """
+import hashlib
 import pytest
 from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from bson import ObjectId
+from app.services import partner_service
 from app.services.partner_service import PartnerService
 from app.models.partner import Partner, PartnerStatus
 from app.models.api_key import APIKey, APIKeyStatus
-from app.schemas.partner import PartnerCreate, APIKeyCreate
+from app.schemas.partner import PartnerCreate, PartnerResponse, APIKeyCreate
 
 
 class TestPartnerService:
@@ -55,6 +60,59 @@ class TestPartnerService:
         assert key_id.startswith("key_")
         assert len(key_id) > 10
     
+    def test_keyed_api_key_round_trip(self):
+        """Test keyed API keys embed and parse back their key ID and secret"""
+        key_id = PartnerService.generate_key_id()
+        api_key, key_secret = PartnerService.generate_keyed_api_key(key_id)
+        
+        assert api_key.startswith("ovu_live_")
+        assert PartnerService.parse_api_key(api_key) == (key_id, key_secret)
+    
+    def test_parse_legacy_api_key(self):
+        """Test legacy keys are not mistaken for keyed API keys"""
+        api_key, _ = PartnerService.generate_api_credentials()
+        
+        assert PartnerService.parse_api_key(api_key) is None
+        assert PartnerService.parse_api_key("ovu_live_key_nothex_secret") is None
+    
+    @pytest.mark.asyncio
+    async def test_create_api_key_returns_stored_secret(self):
+        """Test the returned secret is the key's own and verifies against key_hash"""
+        api_key_model = MagicMock()
+        api_key_model.return_value.insert = AsyncMock()
+        api_key_model.return_value.created_at = datetime.utcnow()
+        partner = MagicMock(id=ObjectId())
+        
+        with patch.object(partner_service, "APIKey", api_key_model):
+            response = await PartnerService.create_api_key(partner, APIKeyCreate(name="Prod"))
+        
+        key_hash = api_key_model.call_args.kwargs["key_hash"]
+        assert PartnerService.parse_api_key(response.api_key) == (response.key_id, response.api_secret)
+        assert PartnerService.verify_secret(response.api_secret, key_hash)
+    
+    @pytest.mark.asyncio
+    async def test_create_partner_issues_only_partner_key(self):
+        """Test the returned key is the partner's own, with no unusable APIKey row"""
+        partner_model = MagicMock()
+        partner_model.return_value.insert = AsyncMock()
+        api_key_model = MagicMock()
+        partner_data = PartnerCreate(
+            name="Test Agency",
+            email="test@agency.com",
+            phone="+2348012345678",
+            company_name="Test Agency Inc",
+            business_type="travel_agency",
+        )
+        
+        with patch.object(partner_service, "Partner", partner_model), \
+                patch.object(partner_service, "APIKey", api_key_model):
+            _, api_key, api_secret = await PartnerService.create_partner(partner_data)
+        
+        fields = partner_model.call_args.kwargs
+        assert fields["api_key"] == api_key
+        assert PartnerService.verify_secret(api_secret, fields["api_secret"])
+        api_key_model.assert_not_called()
+    
     @pytest.mark.asyncio
     async def test_create_partner(self):
         """Test partner creation"""
@@ -283,6 +341,37 @@ class TestPartnerService:
         
         # Cleanup
         await partner.delete()
+    
+    @pytest.mark.asyncio
+    async def test_get_many(self):
+        """Test loading several partners in one query"""
+        created = []
+        for i in range(2):
+            partner_data = PartnerCreate(
+                name=f"Batch Test {i}",
+                email=f"batch{i}@test.com",
+                phone="+2348012345678",
+                company_name=f"Batch Test {i} Inc",
+                business_type="reseller",
+                rate_limit_per_minute=60,
+                rate_limit_per_day=10000
+            )
+            partner, _, _ = await PartnerService.create_partner(partner_data)
+            created.append(partner)
+        
+        ids = [str(p.id) for p in created]
+        partners = await PartnerService.get_many(ids + ["not-an-id"])
+        
+        assert set(partners) == set(ids)
+        
+        # Cleanup
+        for partner in created:
+            await partner.delete()
+    
+    @pytest.mark.asyncio
+    async def test_get_many_skips_invalid_ids(self):
+        """Test no query is made when none of the ids are ObjectIds"""
+        assert await PartnerService.get_many(["not-an-id", ""]) == {}
 
 
 class TestPartnerCodeGeneration:
@@ -307,6 +396,36 @@ class TestPartnerCodeGeneration:
         assert all(c.isalnum() or c == "-" for c in code)
 
 
+class TestPartnerResponse:
+    """Test mapping partner documents to responses"""
+    
+    def test_to_response_matches_validated_json(self):
+        """Test skipping validation renders the same JSON as model_validate"""
+        now = datetime(2025, 1, 1, 12, 0)
+        partner = SimpleNamespace(
+            id=ObjectId(),
+            partner_code="ACME-1234",
+            name="Acme",
+            email="ops@acme.ng",
+            phone="+2348012345678",
+            website=None,
+            company_name="Acme Ltd",
+            business_type="travel_agency",
+            status=PartnerStatus.ACTIVE,
+            rate_limit_per_minute=60,
+            rate_limit_per_day=10000,
+            total_requests=5,
+            last_request_at=None,
+            created_at=now,
+            updated_at=now,
+        )
+        
+        response = PartnerService.to_response(partner)
+        expected = PartnerResponse.model_validate({**vars(partner), "id": str(partner.id)})
+        
+        assert response.model_dump(mode="json") == expected.model_dump(mode="json")
+
+
 class TestSecretHashing:
     """Test secret hashing security"""
     
@@ -326,6 +445,39 @@ class TestSecretHashing:
         
         assert hash1 != hash2
     
+    def test_legacy_sha256_hash_still_verifies(self):
+        """Test hashes stored before the peppered HMAC keep verifying"""
+        legacy = hashlib.sha256(b"test_secret").hexdigest()
+        
+        assert PartnerService.hash_secret("test_secret") != legacy
+        assert PartnerService.verify_secret("test_secret", legacy) is True
+        assert PartnerService.verify_secret("wrong", legacy) is False
+    
+    @pytest.mark.asyncio
+    async def test_legacy_key_hash_rehashed_on_use(self):
+        """Test a keyed API key with a legacy hash authenticates and is upgraded"""
+        key_id = PartnerService.generate_key_id()
+        api_key, key_secret = PartnerService.generate_keyed_api_key(key_id)
+        api_key_doc = MagicMock(
+            status=APIKeyStatus.ACTIVE, expires_at=None,
+            key_hash=hashlib.sha256(key_secret.encode()).hexdigest(),
+        )
+        api_key_doc.set = AsyncMock()
+        api_key_model = MagicMock()
+        api_key_model.aggregate.return_value.to_list = AsyncMock(
+            return_value=[{"key_id": key_id, "partner": [{"_id": ObjectId()}]}]
+        )
+        api_key_model.model_validate.return_value = api_key_doc
+        
+        with patch.object(partner_service, "APIKey", api_key_model), \
+                patch.object(partner_service, "Partner", MagicMock()):
+            resolved = await PartnerService.resolve_api_key(api_key)
+        
+        assert resolved is not None
+        api_key_doc.set.assert_awaited_once_with(
+            {api_key_model.key_hash: PartnerService.hash_secret(key_secret)}
+        )
+    
     def test_timing_safe_comparison(self):
         """Test that verification uses timing-safe comparison"""
         secret = "test_secret"
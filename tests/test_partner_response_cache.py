@@ -0,0 +1,95 @@
+"""
+Unit tests for the partner GET response cache
+"""
+import orjson
+import pytest
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from bson import ObjectId
+from app.routes import partners
+from app.services.partner_response_cache import PartnerResponseCache
+
+
+def _memory_redis():
+    store = {}
+    redis = AsyncMock()
+    redis.setex.side_effect = lambda key, ttl, value: store.__setitem__(key, value)
+    redis.get.side_effect = lambda key: store.get(key)
+    redis.delete.side_effect = lambda *keys: [store.pop(key, None) for key in keys]
+    return redis
+
+
+def _partner(partner_id: str, webhook_url: str):
+    return MagicMock(
+        id=partner_id,
+        webhook_url=webhook_url,
+        webhook_events=["booking.confirmed"],
+        webhook_secret="whsec_0123456789",
+        webhook_secret_preview="whsec_01...",
+    )
+
+
+class TestPartnerResponseCache:
+    """Test suite for PartnerResponseCache"""
+
+    @pytest.mark.asyncio
+    async def test_second_read_served_from_cache(self):
+        """Test a cached body is returned as-is until invalidated"""
+        cache = PartnerResponseCache(_memory_redis())
+        partner = _partner("p1", "https://acme.ng/hooks")
+
+        first = await partners.get_webhook_config(partner, cache)
+        partner.webhook_url = "https://acme.ng/changed"
+        second = await partners.get_webhook_config(partner, cache)
+
+        assert second.body == first.body
+        assert orjson.loads(first.body)["webhook_url"] == "https://acme.ng/hooks"
+
+        await cache.invalidate("p1")
+        third = await partners.get_webhook_config(partner, cache)
+        assert orjson.loads(third.body)["webhook_url"] == "https://acme.ng/changed"
+
+    @pytest.mark.asyncio
+    async def test_keys_scoped_per_partner(self):
+        """Test one partner's cached body is never served to another"""
+        cache = PartnerResponseCache(_memory_redis())
+
+        await partners.get_webhook_config(_partner("p1", "https://one.ng/hooks"), cache)
+        other = await partners.get_webhook_config(_partner("p2", "https://two.ng/hooks"), cache)
+
+        assert orjson.loads(other.body)["webhook_url"] == "https://two.ng/hooks"
+        assert PartnerResponseCache.make_key("p2", "webhooks") == "partner:p2:webhooks"
+
+    @pytest.mark.asyncio
+    async def test_redis_error_is_a_miss(self):
+        """Test Redis failures fall back to building the response"""
+        redis = AsyncMock()
+        redis.get.side_effect = ConnectionError("redis down")
+        redis.setex.side_effect = ConnectionError("redis down")
+
+        response = await partners.get_webhook_config(
+            _partner("p1", "https://acme.ng/hooks"), PartnerResponseCache(redis)
+        )
+
+        assert orjson.loads(response.body)["is_configured"] is True
+
+    @pytest.mark.asyncio
+    async def test_me_built_from_partner_attributes(self):
+        """Test /partners/me is validated straight from the partner's attributes"""
+        partner_id = ObjectId()
+        partner = SimpleNamespace(
+            id=partner_id, partner_code="ACME1234", name="Acme", email="ops@acme.ng",
+            phone="+2348012345678", website=None, company_name="Acme Ltd",
+            business_type="reseller", status="active", rate_limit_per_minute=60,
+            rate_limit_per_day=10_000, total_requests=5, last_request_at=None,
+            created_at=datetime(2025, 1, 1), updated_at=datetime(2025, 1, 2),
+            api_secret="never-serialized",
+        )
+
+        response = await partners.get_current_partner(partner, PartnerResponseCache(None))
+        body = orjson.loads(response.body)
+
+        assert body["id"] == str(partner_id)
+        assert body["status"] == "active"
+        assert "api_secret" not in body
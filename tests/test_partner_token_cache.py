@@ -0,0 +1,200 @@
+"""
+Unit tests for partner refresh token state
+"""
+import asyncio
+import time
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from fastapi import HTTPException
+from app.core.security import decode_token
+from app.models.partner import PartnerStatus
+from app.routes import partner_auth, partners
+from app.schemas.partner import PartnerUpdate
+from app.schemas.partner_auth import RefreshTokenRequest
+from app.services.partner_response_cache import PartnerResponseCache
+from app.services.partner_auth_service import PartnerAuthService
+from app.services.partner_token_cache import PartnerTokenCache
+
+
+def _profile(status=PartnerStatus.ACTIVE) -> dict:
+    return {
+        "id": "64b000000000000000000001",
+        "partner_code": "ACME1234",
+        "name": "Ada",
+        "email": "ada@acme.ng",
+        "company_name": "Acme",
+        "status": status,
+        "email_verified": True,
+    }
+
+
+def _memory_redis():
+    store = {}
+    redis = AsyncMock()
+    redis.setex.side_effect = lambda key, ttl, value: store.__setitem__(key, value)
+    redis.get.side_effect = lambda key: store.get(key)
+    redis.exists.side_effect = lambda key: int(key in store)
+
+    def set_nx(key, value, nx=False, ex=None):
+        if nx and key in store:
+            return None
+        store[key] = value
+        return True
+
+    redis.set.side_effect = set_nx
+    return redis
+
+
+def _refresh_request(profile: dict) -> RefreshTokenRequest:
+    tokens = PartnerAuthService.create_tokens_for_profile(profile)
+    return RefreshTokenRequest(refresh_token=tokens["refresh_token"])
+
+
+class TestPartnerTokenCache:
+    """Test suite for PartnerTokenCache"""
+
+    @pytest.mark.asyncio
+    async def test_claim_is_single_use_and_expires_with_token(self):
+        """Test only the first claim of a jti succeeds, denied for the token's lifetime"""
+        redis = _memory_redis()
+        cache = PartnerTokenCache(redis)
+
+        assert await cache.claim("abc", int(time.time()) + 100) is True
+        assert await cache.claim("abc", int(time.time()) + 100) is False
+
+        assert await cache.is_revoked("abc") is True
+        key, _ = redis.set.call_args.args
+        assert key == "revoked_jti:abc"
+        assert redis.set.call_args.kwargs["nx"] is True
+        assert 0 < redis.set.call_args.kwargs["ex"] <= 100
+
+    @pytest.mark.asyncio
+    async def test_redis_error_fails_open(self):
+        """Test Redis failures read as a miss / not revoked"""
+        redis = AsyncMock()
+        redis.get.side_effect = ConnectionError("redis down")
+        redis.exists.side_effect = ConnectionError("redis down")
+        cache = PartnerTokenCache(redis)
+
+        assert await cache.get_profile("p1") is None
+        assert await cache.is_revoked("abc") is False
+
+
+class TestRefreshToken:
+    """Test suite for the partner refresh endpoint"""
+
+    @pytest.mark.asyncio
+    async def test_cached_profile_skips_mongo(self):
+        """Test an active cached partner refreshes without Partner.get"""
+        cache = PartnerTokenCache(_memory_redis())
+        await cache.set_profile(_profile())
+        partner_model = MagicMock()
+
+        with patch("app.routes.partner_auth.Partner", partner_model):
+            response = await partner_auth.refresh_token(_refresh_request(_profile()), cache)
+
+        partner_model.get.assert_not_called()
+        assert response.partner["status"] == PartnerStatus.ACTIVE
+        assert decode_token(response.refresh_token)["type"] == "partner_refresh"
+
+    @pytest.mark.asyncio
+    async def test_refresh_token_is_single_use(self):
+        """Test an exchanged refresh token is rejected the second time"""
+        cache = PartnerTokenCache(_memory_redis())
+        await cache.set_profile(_profile())
+        request = _refresh_request(_profile())
+
+        await partner_auth.refresh_token(request, cache)
+        with pytest.raises(HTTPException) as exc_info:
+            await partner_auth.refresh_token(request, cache)
+        assert exc_info.value.status_code == 401
+
+    @pytest.mark.asyncio
+    async def test_concurrent_refreshes_only_one_wins(self):
+        """Test two simultaneous exchanges of one token can't both succeed"""
+        cache = PartnerTokenCache(_memory_redis())
+        await cache.set_profile(_profile())
+        request = _refresh_request(_profile())
+
+        results = await asyncio.gather(
+            partner_auth.refresh_token(request, cache),
+            partner_auth.refresh_token(request, cache),
+            return_exceptions=True,
+        )
+
+        assert sum(isinstance(r, HTTPException) for r in results) == 1
+
+    @pytest.mark.asyncio
+    async def test_redis_down_fails_closed(self):
+        """Test refresh is refused when the token can't be marked used"""
+        redis = AsyncMock()
+        redis.get.return_value = None
+        redis.exists.return_value = 0
+        redis.set.side_effect = ConnectionError("redis down")
+        cache = PartnerTokenCache(redis)
+        partner = MagicMock(
+            id=_profile()["id"], partner_code="ACME1234", company_name="Acme",
+            email="ada@acme.ng", status=PartnerStatus.ACTIVE, email_verified=True,
+        )
+        partner.name = "Ada"
+        partner_model = MagicMock()
+        partner_model.get = AsyncMock(return_value=partner)
+
+        with patch("app.routes.partner_auth.Partner", partner_model):
+            with pytest.raises(HTTPException) as exc_info:
+                await partner_auth.refresh_token(_refresh_request(_profile()), cache)
+
+        assert exc_info.value.status_code == 503
+
+    @pytest.mark.asyncio
+    async def test_suspended_partner_rejected(self):
+        """Test a cached non-active status rejects the token without Mongo"""
+        cache = PartnerTokenCache(_memory_redis())
+        await cache.set_profile(_profile(PartnerStatus.SUSPENDED))
+        partner_model = MagicMock()
+
+        with patch("app.routes.partner_auth.Partner", partner_model):
+            with pytest.raises(HTTPException) as exc_info:
+                await partner_auth.refresh_token(_refresh_request(_profile()), cache)
+
+        assert exc_info.value.status_code == 401
+        partner_model.get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_miss_loads_partner_and_caches(self):
+        """Test an unknown partner is read from Mongo once and cached"""
+        cache = PartnerTokenCache(_memory_redis())
+        partner = MagicMock(
+            id=_profile()["id"], partner_code="ACME1234", company_name="Acme",
+            email="ada@acme.ng", status=PartnerStatus.ACTIVE, email_verified=True,
+        )
+        partner.name = "Ada"
+        partner_model = MagicMock()
+        partner_model.get = AsyncMock(return_value=partner)
+
+        with patch("app.routes.partner_auth.Partner", partner_model):
+            await partner_auth.refresh_token(_refresh_request(_profile()), cache)
+
+        partner_model.get.assert_awaited_once()
+        assert await cache.get_profile(_profile()["id"]) == _profile()
+
+    @pytest.mark.asyncio
+    async def test_profile_update_reaches_refreshed_tokens(self):
+        """Test renaming a partner updates the profile /refresh answers from"""
+        cache = PartnerTokenCache(_memory_redis())
+        await cache.set_profile(_profile())
+        partner = MagicMock(
+            id=_profile()["id"], partner_code="ACME1234", company_name="Acme",
+            email="ada@acme.ng", status=PartnerStatus.ACTIVE, email_verified=True,
+        )
+        partner.name = "Ada"
+        partner.set = AsyncMock(
+            side_effect=lambda changes: [setattr(partner, k, v) for k, v in changes.items()]
+        )
+
+        await partners.update_current_partner(
+            PartnerUpdate(name="Ada Travels"), partner, PartnerResponseCache(None), cache
+        )
+        response = await partner_auth.refresh_token(_refresh_request(_profile()), cache)
+
+        assert response.partner["name"] == "Ada Travels"
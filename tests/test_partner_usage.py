@@ -0,0 +1,62 @@
+"""
+Unit tests for partner usage statistics
+"""
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+from app.routes import partners
+from app.services import partner_service
+from app.services.partner_service import PartnerService
+
+
+def _partner():
+    partner = MagicMock(id="p1", total_requests=10, rate_limit_per_minute=60, rate_limit_per_day=1000)
+    partner.name = "Acme"
+    return partner
+
+
+class TestUsageStatistics:
+    """Test suite for get_usage_statistics"""
+
+    @pytest.mark.asyncio
+    async def test_daily_buckets_from_single_aggregation(self):
+        """Test per-day rows come from one $group and missing days are zero-filled"""
+        today = datetime.utcnow().strftime("%Y-%m-%d")
+        yesterday = (datetime.utcnow() - timedelta(days=1)).strftime("%Y-%m-%d")
+        aggregate = MagicMock()
+        aggregate.return_value.to_list = AsyncMock(return_value=[
+            {"_id": today, "bookings": 3, "revenue_kobo": 900_000},
+            {"_id": yesterday, "bookings": 1, "revenue_kobo": 0},
+        ])
+
+        with patch.object(partners.Booking, "aggregate", aggregate), \
+             patch.object(partners.PartnerService, "count_api_keys", AsyncMock(return_value=(2, 3))):
+            stats = await partners.get_usage_statistics(days=7, partner=_partner())
+
+        assert aggregate.call_count == 1
+        assert stats.total_bookings == 4
+        assert stats.total_revenue_kobo == 900_000
+        assert len(stats.daily_stats) == 8
+        assert [d.date for d in stats.daily_stats[-2:]] == [yesterday, today]
+        assert (stats.daily_stats[-1].bookings, stats.daily_stats[-1].revenue_kobo) == (3, 900_000)
+        assert stats.daily_stats[0].bookings == 0
+        assert (stats.active_api_keys, stats.total_api_keys) == (2, 3)
+
+
+class TestCountAPIKeys:
+    """Test suite for PartnerService.count_api_keys"""
+
+    @pytest.mark.asyncio
+    async def test_counts_grouped_by_status(self):
+        """Test active and total counts come from one $group on status"""
+        aggregate = MagicMock()
+        aggregate.return_value.to_list = AsyncMock(return_value=[
+            {"_id": "active", "n": 2},
+            {"_id": "revoked", "n": 3},
+        ])
+
+        with patch.object(partner_service.APIKey, "aggregate", aggregate):
+            assert await PartnerService.count_api_keys("p1") == (2, 5)
+
+        [pipeline] = aggregate.call_args.args
+        assert pipeline[0] == {"$match": {"partner_id": "p1"}}
@@ -0,0 +1,60 @@
+"""
+Unit tests for partnership interest submissions
+"""
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from fastapi import BackgroundTasks
+from pymongo.errors import DuplicateKeyError
+from app.routes import partnerships
+from app.schemas.partner import PartnershipRequest
+
+
+def _request() -> PartnershipRequest:
+    return PartnershipRequest(
+        company_name="Acme", email="ops@acme.ng", phone="+2348012345678", category="bus"
+    )
+
+
+class TestIndicatePartnershipRequest:
+    """Test suite for indicate_partnership_request"""
+
+    @pytest.mark.asyncio
+    async def test_repeat_submission_returns_existing(self):
+        """Test a duplicate email returns the stored interest with 200 and no email"""
+        existing = MagicMock()
+        model = MagicMock()
+        model.return_value.insert = AsyncMock(side_effect=DuplicateKeyError("E11000"))
+        model.find_one = AsyncMock(return_value=existing)
+        response = MagicMock()
+        background_tasks = BackgroundTasks()
+
+        with patch.object(partnerships, "PartnershipInterest", model):
+            result = await partnerships.indicate_partnership_request(
+                _request(), response, background_tasks, AsyncMock()
+            )
+
+        assert result is existing
+        assert response.status_code == 200
+        assert not background_tasks.tasks
+
+    @pytest.mark.asyncio
+    async def test_new_submission_single_insert(self):
+        """Test a new email is inserted without a prior lookup"""
+        model = MagicMock()
+        model.return_value.insert = AsyncMock()
+        model.find_one = AsyncMock()
+        notifier = AsyncMock()
+        background_tasks = BackgroundTasks()
+
+        with patch.object(partnerships, "PartnershipInterest", model):
+            result = await partnerships.indicate_partnership_request(
+                _request(), MagicMock(), background_tasks, notifier
+            )
+
+        assert result is model.return_value
+        model.find_one.assert_not_called()
+        notifier.send_partnership_acknowledgement.assert_not_called()
+        await background_tasks()
+        notifier.send_partnership_acknowledgement.assert_awaited_once_with(
+            email="ops@acme.ng", company_name="Acme", category="bus", phone="+2348012345678"
+        )
@@ -1,6 +1,8 @@
 """
 Tests for payment service with environment-based behavior
 """
+import hashlib
+import hmac
 import pytest
 from unittest.mock import patch, MagicMock
 from app.services.payment_service import PaystackService
@@ -10,9 +12,11 @@ from app.core.config import Settings
 @pytest.mark.asyncio
 async def test_paystack_service_dev_environment():
     """Test that PaystackService behaves correctly in development"""
-    with patch('app.services.payment_service.settings') as mock_settings:
+    with patch('app.services.payment_service.get_settings') as get_settings:
+        mock_settings = get_settings.return_value
         mock_settings.is_development = True
         mock_settings.PAYSTACK_SECRET_KEY = "sk_test_12345"
+        mock_settings.PAYSTACK_WEBHOOK_SECRET = "whsec_12345"
         
         service = PaystackService()
         assert service.base_url == "https://api.paystack.co"
@@ -22,16 +26,34 @@ async def test_paystack_service_dev_environment():
 @pytest.mark.asyncio
 async def test_paystack_service_prod_environment():
     """Test that PaystackService behaves correctly in production"""
-    with patch('app.services.payment_service.settings') as mock_settings:
+    with patch('app.services.payment_service.get_settings') as get_settings:
+        mock_settings = get_settings.return_value
         mock_settings.is_development = False
         mock_settings.is_production = True
         mock_settings.PAYSTACK_SECRET_KEY = "sk_live_12345"
+        mock_settings.PAYSTACK_WEBHOOK_SECRET = "whsec_12345"
         
         service = PaystackService()
         assert service.base_url == "https://api.paystack.co"
         assert service.secret_key == "sk_live_12345"
 
 
+def test_webhook_signature_verification():
+    """Test webhook signatures are checked against the precomputed HMAC key"""
+    with patch('app.services.payment_service.get_settings') as get_settings:
+        mock_settings = get_settings.return_value
+        mock_settings.PAYSTACK_WEBHOOK_SECRET = "whsec_12345"
+        service = PaystackService()
+
+    body = b'{"event": "charge.success"}'
+    signature = hmac.new(b"whsec_12345", body, hashlib.sha512).hexdigest()
+
+    assert service.verify_webhook_signature(body, signature) is True
+    # The keyed template is copied per call, so it stays reusable
+    assert service.verify_webhook_signature(body, signature) is True
+    assert service.verify_webhook_signature(body + b" ", signature) is False
+
+
 def test_settings_is_production():
     """Test production environment detection"""
     settings = Settings(
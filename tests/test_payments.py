@@ -0,0 +1,95 @@
+"""
+Unit tests for payment routes
+"""
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from bson import ObjectId
+from fastapi import HTTPException
+from app.models.booking import BookingStatus
+from app.models.payment import PaymentMethod, PaymentStatus
+from app.routes import payments
+from app.schemas.payment import PaymentInitiate
+
+
+def _user():
+    return MagicMock(id=ObjectId(), email="ada@acme.ng")
+
+
+def _booking(user):
+    return MagicMock(
+        id=ObjectId(), user_id=str(user.id), status=BookingStatus.PENDING,
+        total_price_kobo=1_500_000, currency="NGN",
+    )
+
+
+async def _initialize(paystack_result):
+    user = _user()
+    paystack = MagicMock()
+    paystack.initialize_transaction = AsyncMock(return_value=paystack_result)
+    # Constructing a Payment needs an initialized Beanie, so stand in for the model
+    payment_model = MagicMock()
+    payment = payment_model.return_value
+    payment.insert = AsyncMock()
+    payment.status = PaymentStatus.PENDING
+    payment.amount_kobo = 1_500_000
+    payment.currency = "NGN"
+    payment.payment_reference = "PAY-1"
+    payment.booking_id = "b1"
+    with patch.object(payments.Booking, "get", AsyncMock(return_value=_booking(user))), \
+         patch.object(payments, "Payment", payment_model):
+        try:
+            return await payments.initialize_payment(
+                PaymentInitiate(booking_id="b1", payment_method=PaymentMethod.CARD), user, paystack
+            ), payment_model
+        except HTTPException as e:
+            return e, payment_model
+
+
+class TestInitializePayment:
+    """Test suite for initialize_payment"""
+
+    @pytest.mark.asyncio
+    async def test_success_writes_payment_once(self):
+        """Test the payment is inserted once, already carrying the provider reference"""
+        response, payment_model = await _initialize({
+            "status": "success", "reference": "PSK-1", "authorization_url": "https://pay/1",
+        })
+
+        fields = payment_model.call_args.kwargs
+        assert (fields["provider_reference"], fields["status"]) == ("PSK-1", PaymentStatus.PENDING)
+        payment_model.return_value.insert.assert_awaited_once()
+        payment_model.return_value.save.assert_not_called()
+        assert response.authorization_url == "https://pay/1"
+
+    @pytest.mark.asyncio
+    async def test_failure_writes_failed_payment_once(self):
+        """Test a rejected initialization still records one FAILED payment"""
+        error, payment_model = await _initialize({"status": "error", "message": "Invalid key"})
+
+        assert payment_model.call_args.kwargs["status"] == PaymentStatus.FAILED
+        payment_model.return_value.insert.assert_awaited_once()
+        payment_model.return_value.save.assert_not_called()
+        assert error.status_code == 400
+        assert error.detail == "Invalid key"
+
+
+class TestPaymentWebhook:
+    """Test suite for payment_webhook"""
+
+    @pytest.mark.asyncio
+    async def test_body_read_once_and_parsed_from_bytes(self):
+        """Test the verified raw body is parsed directly, not re-read via request.json()"""
+        request = MagicMock()
+        request.headers = {"x-paystack-signature": "sig"}
+        request.body = AsyncMock(return_value=b'{"event": "transfer.success", "data": {}}')
+        request.json = AsyncMock(side_effect=AssertionError("body parsed twice"))
+        paystack = MagicMock()
+        paystack.verify_webhook_signature.return_value = True
+
+        result = await payments.payment_webhook(request, MagicMock(), MagicMock(), paystack)
+
+        assert result == {"status": "success"}
+        request.body.assert_awaited_once()
+        paystack.verify_webhook_signature.assert_called_once_with(
+            b'{"event": "transfer.success", "data": {}}', "sig"
+        )
@@ -0,0 +1,110 @@
+"""
+Unit tests for the partner API rate limiter
+"""
+import pytest
+from unittest.mock import AsyncMock
+from app.middleware.rate_limit import RateLimiter
+
+
+class TestRateLimiter:
+    """Test suite for RateLimiter"""
+
+    @pytest.mark.asyncio
+    async def test_connect_failure_disables_limiter(self):
+        """Test that an unreachable Redis leaves rate limiting disabled"""
+        limiter = RateLimiter()
+        limiter.redis = AsyncMock()
+        limiter.redis.ping.side_effect = ConnectionError("refused")
+
+        await limiter.connect()
+
+        assert limiter.enabled is False
+
+    @pytest.mark.asyncio
+    async def test_disabled_limiter_allows_requests(self):
+        """Test that requests are allowed when Redis is unavailable"""
+        limiter = RateLimiter()
+
+        allowed, info = await limiter.check_rate_limit(
+            partner_id="partner-1",
+            api_key_id=None,
+            limit_per_minute=60,
+            limit_per_day=1000
+        )
+
+        assert allowed is True
+        assert info["remaining_per_minute"] == 60
+        assert info["remaining_per_day"] == 1000
+
+    @pytest.mark.asyncio
+    async def test_redis_error_allows_request(self):
+        """Test that Redis errors fail open"""
+        limiter = RateLimiter()
+        limiter.rate_limit_script = AsyncMock(side_effect=ConnectionError("lost"))
+        limiter.enabled = True
+
+        allowed, _ = await limiter.check_rate_limit(
+            partner_id="partner-1",
+            api_key_id="key_abc",
+            limit_per_minute=60,
+            limit_per_day=1000
+        )
+
+        assert allowed is True
+
+    @pytest.mark.asyncio
+    async def test_allowed_request_reports_remaining(self):
+        """Test remaining counts come from the script's post-increment totals"""
+        limiter = RateLimiter()
+        limiter.rate_limit_script = AsyncMock(return_value=[1, 10, 500, 1_700_000_000_500])
+        limiter.enabled = True
+
+        allowed, info = await limiter.check_rate_limit(
+            partner_id="partner-1",
+            api_key_id=None,
+            limit_per_minute=60,
+            limit_per_day=1000
+        )
+
+        assert allowed is True
+        assert info["remaining_per_minute"] == 50
+        assert info["remaining_per_day"] == 500
+        kwargs = limiter.rate_limit_script.call_args.kwargs
+        assert kwargs["keys"][0] == "rate_limit:partner:partner-1:minute"
+        assert kwargs["args"][:2] == [60, 1000]
+        assert info["reset_minute"] == 1_700_000_061
+
+    @pytest.mark.asyncio
+    async def test_exceeded_limit_rejected(self):
+        """Test a request over the per-minute limit is rejected"""
+        limiter = RateLimiter()
+        limiter.rate_limit_script = AsyncMock(return_value=[0, 60, 500, 1_700_000_000_000])
+        limiter.enabled = True
+
+        allowed, info = await limiter.check_rate_limit(
+            partner_id="partner-1",
+            api_key_id="key_abc",
+            limit_per_minute=60,
+            limit_per_day=1000
+        )
+
+        assert allowed is False
+        assert info["remaining_per_minute"] == 0
+        assert limiter.rate_limit_script.call_args.kwargs["keys"][1].startswith(
+            "rate_limit:api_key:key_abc:day:"
+        )
+
+    @pytest.mark.asyncio
+    async def test_usage_stats_single_round_trip(self):
+        """Test daily usage is fetched with one MGET"""
+        limiter = RateLimiter()
+        limiter.redis = AsyncMock()
+        limiter.redis.mget.return_value = ["5", None, "7"]
+        limiter.enabled = True
+
+        stats = await limiter.get_usage_stats("partner-1", days=3)
+
+        limiter.redis.mget.assert_awaited_once()
+        assert len(limiter.redis.mget.call_args.args[0]) == 3
+        assert stats["total_requests"] == 12
+        assert [d["requests"] for d in stats["daily_breakdown"]] == [5, 0, 7]
@@ -0,0 +1,85 @@
+"""
+Unit tests for the search results cache
+"""
+import json
+import pytest
+from datetime import datetime
+from unittest.mock import AsyncMock
+from app.core.responses import MsgspecResponse
+from app.schemas.booking import SearchRequest, SearchResult, SearchResultStruct, TransportType
+from app.services.search_cache import SearchCache
+
+
+def _search_request(**overrides) -> SearchRequest:
+    data = {
+        "origin": "Lagos",
+        "destination": "Abuja",
+        "departure_date": datetime(2025, 1, 15, 8, 0),
+        "passengers": 2,
+    }
+    data.update(overrides)
+    return SearchRequest(**data)
+
+
+def _result() -> SearchResultStruct:
+    return SearchResultStruct(
+        transport_type=TransportType.FLIGHT,
+        provider="travu",
+        origin="Lagos",
+        destination="Abuja",
+        departure_date=datetime(2025, 1, 15, 8, 0),
+        price_kobo=4_500_000,
+        available_seats=50,
+        provider_reference="TRV-FL-001",
+    )
+
+
+class TestSearchCache:
+    """Test suite for SearchCache"""
+
+    def test_key_ignores_transport_type_order(self):
+        """Test equivalent searches share one cache key"""
+        a = _search_request(transport_types=[TransportType.BUS, TransportType.FLIGHT])
+        b = _search_request(transport_types=[TransportType.FLIGHT, TransportType.BUS])
+        c = _search_request(passengers=3)
+
+        assert SearchCache.make_key(a) == SearchCache.make_key(b)
+        assert SearchCache.make_key(a) != SearchCache.make_key(c)
+
+    @pytest.mark.asyncio
+    async def test_round_trip(self):
+        """Test stored results are returned on the next lookup"""
+        store = {}
+        redis = AsyncMock()
+        redis.setex.side_effect = lambda key, ttl, value: store.__setitem__(key, value)
+        redis.get.side_effect = lambda key: store.get(key)
+        cache = SearchCache(redis, ttl_seconds=30)
+        search_req = _search_request()
+
+        assert await cache.get(search_req) is None
+        await cache.set(search_req, [_result()])
+
+        assert redis.setex.call_args.args[1] == 30
+        assert await cache.get(search_req) == [_result()]
+
+    @pytest.mark.asyncio
+    async def test_disabled_and_errors_are_misses(self):
+        """Test a missing or failing Redis never breaks search"""
+        assert await SearchCache(None).get(_search_request()) is None
+
+        redis = AsyncMock()
+        redis.get.side_effect = ConnectionError("lost")
+        redis.setex.side_effect = ConnectionError("lost")
+        cache = SearchCache(redis)
+
+        assert await cache.get(_search_request()) is None
+        await cache.set(_search_request(), [_result()])
+
+    def test_struct_renders_same_json_as_schema(self):
+        """Test the msgspec result serializes identically to the documented SearchResult"""
+        result = _result()
+
+        rendered = MsgspecResponse([result]).body
+
+        expected = SearchResult.model_validate(result, from_attributes=True)
+        assert json.loads(rendered) == [expected.model_dump(mode="json")]
@@ -0,0 +1,119 @@
+"""
+Unit tests for unified transport search
+"""
+import asyncio
+import pytest
+from datetime import datetime
+from unittest.mock import AsyncMock, patch
+from app.schemas.booking import SearchRequest
+from app.services.search_service import SearchService
+from app.services.travu_client import TravuAPIClient
+from app.services.nrc_client import NRCAPIClient
+
+
+def _search_request(**overrides) -> SearchRequest:
+    data = {
+        "origin": "Lagos",
+        "destination": "Ibadan",
+        "departure_date": datetime(2025, 1, 15, 8, 0),
+        "passengers": 1,
+    }
+    data.update(overrides)
+    return SearchRequest(**data)
+
+
+async def _search(search_req: SearchRequest):
+    return await SearchService.search(search_req, TravuAPIClient(), NRCAPIClient())
+
+
+class TestSearchService:
+    """Test suite for SearchService"""
+
+    @pytest.mark.asyncio
+    async def test_results_merged_cheapest_first(self):
+        """Test mock provider results from all transport types are merged by price"""
+        results = await _search(_search_request())
+
+        assert {r.transport_type.value for r in results} == {"flight", "bus", "train"}
+        prices = [r.price_kobo for r in results]
+        assert prices == sorted(prices)
+
+    @pytest.mark.asyncio
+    async def test_providers_queried_concurrently(self):
+        """Test provider calls overlap instead of running back to back"""
+        in_flight = 0
+        peak = 0
+
+        async def slow_search(self, search_req):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return []
+
+        with patch("app.services.travu_client.TravuAPIClient.search_flights", slow_search), \
+             patch("app.services.travu_client.TravuAPIClient.search_buses", slow_search), \
+             patch("app.services.nrc_client.NRCAPIClient.search_trains", slow_search):
+            await _search(_search_request())
+
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_failing_provider_skipped(self):
+        """Test one provider raising does not fail the whole search"""
+        async def broken(self, search_req):
+            raise RuntimeError("provider down")
+
+        with patch("app.services.nrc_client.NRCAPIClient.search_trains", broken):
+            results = await _search(_search_request())
+
+        assert results
+        assert all(r.transport_type.value != "train" for r in results)
+
+    @pytest.mark.asyncio
+    async def test_partial_results_not_cached(self):
+        """Test a search with a failed provider is returned but not cached"""
+        async def broken(self, search_req):
+            raise RuntimeError("provider down")
+
+        cache = AsyncMock()
+        cache.get.return_value = None
+
+        with patch("app.services.nrc_client.NRCAPIClient.search_trains", broken):
+            results = await SearchService.search(
+                _search_request(), TravuAPIClient(), NRCAPIClient(), cache
+            )
+
+        assert results
+        cache.set.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_complete_results_cached(self):
+        """Test a search where every provider answered is cached"""
+        cache = AsyncMock()
+        cache.get.return_value = None
+
+        results = await SearchService.search(
+            _search_request(), TravuAPIClient(), NRCAPIClient(), cache
+        )
+
+        cache.set.assert_awaited_once_with(_search_request(), results)
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_providers(self):
+        """Test cached results are returned without querying providers"""
+        cached = await _search(_search_request())
+        cache = AsyncMock()
+        cache.get.return_value = cached
+
+        async def unexpected(self, search_req):
+            raise AssertionError("provider queried on cache hit")
+
+        with patch("app.services.travu_client.TravuAPIClient.search_flights", unexpected):
+            results = await SearchService.search(
+                _search_request(), TravuAPIClient(), NRCAPIClient(), cache
+            )
+
+        assert results == cached
+        cache.set.assert_not_called()
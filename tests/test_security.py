@@ -0,0 +1,92 @@
+"""
+Unit tests for security utilities
+"""
+import pytest
+from datetime import timedelta
+from fastapi import HTTPException
+from app.core.security import (
+    create_access_token,
+    decode_token,
+    get_password_hash,
+    verify_password,
+    get_password_hash_async,
+    verify_password_async,
+)
+
+
+class TestPasswordHashing:
+    """Test suite for password hashing helpers"""
+
+    def test_hash_and_verify(self):
+        """Test sync hashing round-trip"""
+        hashed = get_password_hash("s3cret-pass")
+
+        assert hashed != "s3cret-pass"
+        assert verify_password("s3cret-pass", hashed) is True
+        assert verify_password("wrong-pass", hashed) is False
+
+    @pytest.mark.asyncio
+    async def test_async_hash_and_verify(self):
+        """Test async hashing round-trip runs off the event loop"""
+        hashed = await get_password_hash_async("s3cret-pass")
+
+        assert await verify_password_async("s3cret-pass", hashed) is True
+        assert await verify_password_async("wrong-pass", hashed) is False
+
+        # Hashes are interchangeable between sync and async helpers
+        assert verify_password("s3cret-pass", hashed) is True
+
+    def test_hash_respects_rounds(self):
+        """Test explicit bcrypt cost is encoded in the hash"""
+        hashed = get_password_hash("s3cret-pass", rounds=4)
+
+        assert hashed.startswith("$2b$04$")
+        assert verify_password("s3cret-pass", hashed) is True
+
+    def test_long_password_truncated_to_72_bytes(self):
+        """Test only the first 72 bytes of a password are significant"""
+        password = "é" * 100  # 2 bytes per char in UTF-8
+        hashed = get_password_hash(password, rounds=4)
+
+        assert verify_password("é" * 36, hashed) is True
+        assert verify_password("é" * 35, hashed) is False
+
+
+class TestTokenDecoding:
+    """Test suite for JWT decoding"""
+
+    def test_decode_round_trip(self):
+        """Test a freshly issued token decodes to its claims"""
+        token = create_access_token({"sub": "user-123"})
+
+        payload = decode_token(token)
+        assert payload["sub"] == "user-123"
+        assert payload["type"] == "access"
+
+        # Second decode is served from the cache with identical claims
+        assert decode_token(token) == payload
+
+    def test_expired_token_rejected(self):
+        """Test expired tokens are rejected even after being cached"""
+        token = create_access_token({"sub": "user-123"}, expires_delta=timedelta(seconds=-1))
+
+        with pytest.raises(HTTPException) as exc_info:
+            decode_token(token)
+        assert exc_info.value.status_code == 401
+
+    def test_tampered_token_rejected(self):
+        """Test tokens with a modified signature are rejected"""
+        token = create_access_token({"sub": "user-123"})
+
+        with pytest.raises(HTTPException):
+            decode_token(token[:-2] + ("AA" if token[-2:] != "AA" else "BB"))
+
+    @pytest.mark.asyncio
+    async def test_warm_up_leaves_token_cache_clean(self):
+        """Test startup warmup runs without caching its throwaway token"""
+        from app.core.security import warm_up, _token_cache
+
+        size_before = len(_token_cache)
+        await warm_up()
+
+        assert len(_token_cache) == size_before
@@ -0,0 +1,48 @@
+"""
+Unit tests for buffered partner usage tracking
+"""
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+from bson import ObjectId
+from app.services.usage_tracker import UsageTracker
+
+
+class TestUsageTracker:
+    """Test suite for UsageTracker"""
+
+    @pytest.mark.asyncio
+    async def test_flush_batches_increments(self):
+        """Test repeated requests collapse into one $inc per document"""
+        partner_id = str(ObjectId())
+        api_key_id = str(ObjectId())
+        tracker = UsageTracker()
+
+        for _ in range(3):
+            tracker.record(partner_id, api_key_id)
+        tracker.record(partner_id)
+
+        partner_collection = Mock(bulk_write=AsyncMock())
+        api_key_collection = Mock(bulk_write=AsyncMock())
+        with patch("app.services.usage_tracker.Partner.get_motor_collection",
+                   return_value=partner_collection), \
+             patch("app.services.usage_tracker.APIKey.get_motor_collection",
+                   return_value=api_key_collection):
+            await tracker.flush()
+
+        partner_ops = partner_collection.bulk_write.call_args.args[0]
+        assert len(partner_ops) == 1
+        assert partner_ops[0]._doc["$inc"] == {"total_requests": 4}
+        assert "last_request_at" in partner_ops[0]._doc["$max"]
+
+        api_key_ops = api_key_collection.bulk_write.call_args.args[0]
+        assert api_key_ops[0]._doc["$inc"] == {"total_requests": 3}
+
+    @pytest.mark.asyncio
+    async def test_flush_empty_buffer_is_noop(self):
+        """Test flushing with nothing recorded does not touch the database"""
+        tracker = UsageTracker()
+
+        with patch("app.services.usage_tracker.Partner.get_motor_collection") as get_collection:
+            await tracker.flush()
+
+        get_collection.assert_not_called()
@@ -0,0 +1,88 @@
+"""
+Unit tests for waitlist subscription
+"""
+import pytest
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+from fastapi import BackgroundTasks, HTTPException
+from pymongo.errors import DuplicateKeyError
+from app.routes import waitlist
+from app.schemas.waitlist import WaitlistSubscribeRequest
+
+
+def _subscription_model(insert_error=None):
+    # Constructing documents needs an initialized Beanie, so stand in for the model
+    model = MagicMock()
+    sub = model.return_value
+    sub.insert = AsyncMock(side_effect=insert_error)
+    sub.id, sub.name, sub.email, sub.created_at = "s1", "Ada", "ada@acme.ng", datetime(2025, 1, 1)
+    return model
+
+
+class TestSubscribeToWaitlist:
+    """Test suite for subscribe_to_waitlist"""
+
+    @pytest.mark.asyncio
+    async def test_new_email_inserted_without_lookup(self):
+        """Test a new subscriber costs one insert and no find_one"""
+        model = _subscription_model()
+
+        with patch.object(waitlist, "WaitlistSubscription", model):
+            result = await waitlist.subscribe_to_waitlist(
+                WaitlistSubscribeRequest(name="Ada", email="ada@acme.ng"),
+                MagicMock(),
+                BackgroundTasks(),
+                AsyncMock(),
+            )
+
+        model.find_one.assert_not_called()
+        model.return_value.insert.assert_awaited_once()
+        assert result.email == "ada@acme.ng"
+
+    @pytest.mark.asyncio
+    async def test_acknowledgement_sent_after_response(self):
+        """Test the email is queued as a background task rather than awaited inline"""
+        notifier = AsyncMock()
+        background_tasks = BackgroundTasks()
+
+        with patch.object(waitlist, "WaitlistSubscription", _subscription_model()):
+            await waitlist.subscribe_to_waitlist(
+                WaitlistSubscribeRequest(name="Ada", email="ada@acme.ng"),
+                MagicMock(),
+                background_tasks,
+                notifier,
+            )
+
+        notifier.send_waitlist_acknowledgement.assert_not_called()
+        await background_tasks()
+        notifier.send_waitlist_acknowledgement.assert_awaited_once_with(
+            email="ada@acme.ng", name="Ada"
+        )
+
+    @pytest.mark.asyncio
+    async def test_acknowledgement_failure_logged(self):
+        """Test an SMTP error inside the task is swallowed"""
+        notifier = AsyncMock()
+        notifier.send_waitlist_acknowledgement.side_effect = RuntimeError("smtp down")
+
+        await waitlist._send_acknowledgement(notifier, email="ada@acme.ng", name="Ada")
+
+    @pytest.mark.asyncio
+    async def test_duplicate_email_conflicts(self):
+        """Test the unique index violation surfaces as 409"""
+        model = _subscription_model(DuplicateKeyError("E11000"))
+        notifier = AsyncMock()
+        background_tasks = BackgroundTasks()
+
+        with patch.object(waitlist, "WaitlistSubscription", model):
+            with pytest.raises(HTTPException) as exc_info:
+                await waitlist.subscribe_to_waitlist(
+                    WaitlistSubscribeRequest(name="Ada", email="ada@acme.ng"),
+                    MagicMock(),
+                    background_tasks,
+                    notifier,
+                )
+
+        assert exc_info.value.status_code == 409
+        notifier.send_waitlist_acknowledgement.assert_not_called()
+        assert not background_tasks.tasks
@@ -366,3 +366,31 @@ class TestWebhookSecurity:
         headers = call_args[1]['headers']
         
         assert 'X-Ovu-Signature' not in headers
+    
+    @pytest.mark.asyncio
+    @patch('httpx.AsyncClient')
+    async def test_shared_client_reused(self, mock_client):
+        """Test a passed-in client is used as-is and left open"""
+        partner = Mock(spec=Partner)
+        partner.partner_code = "TEST-123"
+        partner.webhook_url = "https://example.com/webhook"
+        partner.webhook_events = [WebhookEvent.BOOKING_CREATED]
+        partner.webhook_secret = None
+        
+        mock_response = Mock()
+        mock_response.status_code = 200
+        
+        shared_client = Mock()
+        shared_client.post = AsyncMock(return_value=mock_response)
+        
+        success, _, _ = await WebhookService.send_webhook(
+            partner=partner,
+            event_type=WebhookEvent.BOOKING_CREATED,
+            payload={"test": "data"},
+            http_client=shared_client
+        )
+        
+        assert success is True
+        shared_client.post.assert_awaited_once()
+        shared_client.aclose.assert_not_called()
+        mock_client.assert_not_called()